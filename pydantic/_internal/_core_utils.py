@@ -7,6 +7,7 @@ from pydantic_core import CoreSchema, core_schema
 from typing_extensions import TypeAliasType, TypeGuard, get_args
 
 from . import _repr
+from ._profiling import timed_pass
 
 AnyFunctionSchema = Union[
     core_schema.AfterValidatorFunctionSchema,
@@ -100,6 +101,7 @@ def get_type_ref(type_: type[Any], args_override: tuple[type[Any], ...] | None =
     return type_ref
 
 
+@timed_pass
 def collect_definitions(schema: core_schema.CoreSchema) -> dict[str, core_schema.CoreSchema]:
     # Only collect valid definitions. This is equivalent to collecting all definitions for "valid" schemas,
     # but allows us to reuse this logic while removing "invalid" definitions
@@ -119,8 +121,23 @@ def collect_definitions(schema: core_schema.CoreSchema) -> dict[str, core_schema
     return valid_definitions
 
 
+@timed_pass
 def remove_unnecessary_invalid_definitions(schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
-    valid_refs = collect_definitions(schema).keys()
+    valid_refs: set[str] = set()
+    invalid_refs: set[str] = set()
+
+    def _record_refs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
+        ref: str | None = s.get('ref')  # type: ignore[assignment]
+        if ref:
+            metadata = s.get('metadata')
+            definition_is_invalid = isinstance(metadata, dict) and 'invalid' in metadata
+            (invalid_refs if definition_is_invalid else valid_refs).add(ref)
+        return recurse(s, _record_refs)
+
+    schema = walk_core_schema(schema, _record_refs)
+    if valid_refs.isdisjoint(invalid_refs):
+        # nothing to remove, this is the case for almost all schemas so it's worth skipping the second walk
+        return schema
 
     def _remove_invalid_defs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
         if s['type'] != 'definitions':
@@ -147,6 +164,7 @@ def remove_unnecessary_invalid_definitions(schema: core_schema.CoreSchema) -> co
     return walk_core_schema(schema, _remove_invalid_defs)
 
 
+@timed_pass
 def define_expected_missing_refs(
     schema: core_schema.CoreSchema, allowed_missing_refs: set[str]
 ) -> core_schema.CoreSchema:
@@ -176,6 +194,7 @@ def define_expected_missing_refs(
     return schema
 
 
+@timed_pass
 def collect_invalid_schemas(schema: core_schema.CoreSchema) -> list[core_schema.CoreSchema]:
     invalid_schemas: list[core_schema.CoreSchema] = []
 
@@ -398,7 +417,8 @@ class _WalkCoreSchema:
         return schema
 
 
-_dispatch = _WalkCoreSchema().walk
+_walker = _WalkCoreSchema()
+_dispatch = _walker.walk
 
 
 def walk_core_schema(schema: core_schema.CoreSchema, f: Walk) -> core_schema.CoreSchema:
@@ -418,87 +438,115 @@ def walk_core_schema(schema: core_schema.CoreSchema, f: Walk) -> core_schema.Cor
     return f(schema.copy(), _dispatch)
 
 
-def _simplify_schema_references(schema: core_schema.CoreSchema, inline: bool) -> core_schema.CoreSchema:  # noqa: C901
-    valid_defs: dict[str, core_schema.CoreSchema] = {}
-    invalid_defs: dict[str, core_schema.CoreSchema] = {}
+class _FlattenedSchema:
+    """The result of collecting every schema with a `ref` into a flat mapping of definitions.
 
-    def make_result(schema: core_schema.CoreSchema, defs: Iterable[core_schema.CoreSchema]) -> core_schema.CoreSchema:
-        definitions = list(defs)
-        if definitions:
-            return core_schema.definitions_schema(schema=schema, definitions=definitions)
-        return schema
+    Attributes:
+        schema: The root schema, with every schema that had a `ref` replaced by a `definition-ref` schema.
+        definitions: The flattened definitions, by ref.
+        definition_refs: The refs used by each definition, with the refs used by the root schema stored
+            under `None`, for counting references without walking the schema again.
+    """
 
-    def get_ref(s: core_schema.CoreSchema) -> None | str:
-        return s.get('ref', None)
+    __slots__ = 'schema', 'definitions', 'definition_refs'
+
+    def __init__(
+        self,
+        schema: core_schema.CoreSchema,
+        definitions: dict[str, core_schema.CoreSchema],
+        definition_refs: dict[str | None, list[str]],
+    ) -> None:
+        self.schema = schema
+        self.definitions = definitions
+        self.definition_refs = definition_refs
+
+
+def _make_result(schema: core_schema.CoreSchema, defs: Iterable[core_schema.CoreSchema]) -> core_schema.CoreSchema:
+    definitions = list(defs)
+    if definitions:
+        return core_schema.definitions_schema(schema=schema, definitions=definitions)
+    return schema
 
-    def collect_refs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
-        if s['type'] == 'definitions':
-            for definition in s['definitions']:
-                ref = get_ref(definition)
-                assert ref is not None
-                def_schema = recurse(definition, collect_refs).copy()
-                if 'invalid' in def_schema.get('metadata', {}):
-                    invalid_defs[ref] = def_schema
-                else:
-                    valid_defs[ref] = def_schema
-            return recurse(s['schema'], collect_refs)
-        ref = get_ref(s)
-        if ref is not None:
-            if 'invalid' in s.get('metadata', {}):
-                invalid_defs[ref] = s
-            else:
-                valid_defs[ref] = s
-        return recurse(s, collect_refs)
 
-    schema = walk_core_schema(schema, collect_refs)
+@timed_pass
+def _flatten_refs(schema: core_schema.CoreSchema) -> _FlattenedSchema:
+    """Collect and flatten all definitions in `schema` in a single walk.
 
-    all_defs = {**invalid_defs, **valid_defs}
+    Where a ref is defined more than once, the last definition found in place wins, followed by the last valid
+    definition in a `definitions` schema, followed by the last invalid one.
+    """
+    # the order of the definitions matches the order in which they're first found, invalid definitions first
+    valid_order: dict[str, None] = {}
+    invalid_order: dict[str, None] = {}
+    in_place_defs: dict[str, tuple[core_schema.CoreSchema, list[str]]] = {}
+    valid_defs: dict[str, tuple[core_schema.CoreSchema, list[str]]] = {}
+    invalid_defs: dict[str, tuple[core_schema.CoreSchema, list[str]]] = {}
+    # refs used by the definition currently being walked, the root schema is at the bottom of the stack
+    used_refs_stack: list[list[str]] = [[]]
+
+    def is_invalid(s: core_schema.CoreSchema) -> bool:
+        return 'invalid' in s.get('metadata', {})
 
     def flatten_refs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
         if is_definitions_schema(s):
-            new: dict[str, Any] = dict(s)
-            # iterate ourselves, we don't want to flatten the actual defs!
-            definitions: list[CoreSchema] = new.pop('definitions')
-            schema = cast(CoreSchema, new.pop('schema'))
-            # remaining keys are optional like 'serialization'
-            schema = cast(CoreSchema, {**schema, **new})
-            s['schema'] = recurse(schema, flatten_refs)
-            for definition in definitions:
-                recurse(definition, flatten_refs)  # don't re-assign here!
-            return schema
+            for definition in s['definitions']:
+                def_ref: str = definition['ref']  # type: ignore[typeddict-item]
+                invalid = is_invalid(definition)
+                (invalid_order if invalid else valid_order).setdefault(def_ref)
+                used_refs_stack.append([])
+                def_schema = recurse(definition.copy(), flatten_refs)
+                (invalid_defs if invalid else valid_defs)[def_ref] = (def_schema, used_refs_stack.pop())
+            return flatten_refs(s['schema'].copy(), recurse)
+
+        if is_definition_ref_schema(s):
+            used_refs_stack[-1].append(s['schema_ref'])
+            return recurse(s, flatten_refs)
+
+        ref: str | None = s.get('ref')  # type: ignore[assignment]
+        if ref is None:
+            return recurse(s, flatten_refs)
+
+        (invalid_order if is_invalid(s) else valid_order).setdefault(ref)
+        used_refs_stack.append([])
         s = recurse(s, flatten_refs)
-        ref = get_ref(s)
-        if ref and ref in all_defs:
-            all_defs[ref] = s
-            return core_schema.definition_reference_schema(schema_ref=ref)
-        return s
+        in_place_defs[ref] = (s, used_refs_stack.pop())
+        used_refs_stack[-1].append(ref)
+        return core_schema.definition_reference_schema(schema_ref=ref)
 
-    schema = walk_core_schema(schema, flatten_refs)
+    # `walk_core_schema` would apply `flatten_refs` to the root schema twice, which would record its refs twice
+    schema = flatten_refs(schema.copy(), _walker._walk)
 
-    if not inline:
-        return make_result(schema, all_defs.values())
+    definitions: dict[str, core_schema.CoreSchema] = {}
+    definition_refs: dict[str | None, list[str]] = {None: used_refs_stack.pop()}
+    for ref in {**invalid_order, **valid_order}:
+        definitions[ref], definition_refs[ref] = in_place_defs.get(ref) or valid_defs.get(ref) or invalid_defs[ref]
+    return _FlattenedSchema(schema, definitions, definition_refs)
 
-    ref_counts: dict[str, int] = defaultdict(int)
-    involved_in_recursion: dict[str, bool] = {}
-    current_recursion_ref_count: dict[str, int] = defaultdict(int)
 
-    def count_refs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
-        if not is_definition_ref_schema(s):
-            return recurse(s, count_refs)
-        ref = s['schema_ref']
-        ref_counts[ref] += 1
-        if current_recursion_ref_count[ref] != 0:
-            involved_in_recursion[ref] = True
-            return s
+@timed_pass
+def _inline_refs(flattened: _FlattenedSchema) -> core_schema.CoreSchema:
+    """Inline any definitions that are only referenced in one place and are not involved in a cycle.
 
-        current_recursion_ref_count[ref] += 1
-        recurse(all_defs[ref], count_refs)
-        current_recursion_ref_count[ref] -= 1
-        return s
+    The references are counted from `flattened.definition_refs`, so the schema is only walked once to inline them.
+    Definitions which aren't inlined are shared with `flattened`.
+    """
+    all_defs = flattened.definitions.copy()
+    definition_refs = flattened.definition_refs
+    ref_counts: dict[str, int] = defaultdict(int)
+    involved_in_recursion: dict[str, bool] = {}
+    current_recursion_refs: set[str] = set()
 
-    schema = walk_core_schema(schema, count_refs)
+    def count_refs(refs: list[str]) -> None:
+        for ref in refs:
+            ref_counts[ref] += 1
+            if ref in current_recursion_refs:
+                involved_in_recursion[ref] = True
+                continue
+            current_recursion_refs.add(ref)
+            count_refs(definition_refs[ref])
+            current_recursion_refs.remove(ref)
 
-    assert all(c == 0 for c in current_recursion_ref_count.values()), 'this is a bug! please report it'
+    count_refs(definition_refs[None])
 
     def inline_refs(s: core_schema.CoreSchema, recurse: Recurse) -> core_schema.CoreSchema:
         if s['type'] == 'definition-ref':
@@ -506,7 +554,7 @@ def _simplify_schema_references(schema: core_schema.CoreSchema, inline: bool) ->
             # Check if the reference is only used once and not involved in recursion
             if ref_counts[ref] <= 1 and not involved_in_recursion.get(ref, False):
                 # Inline the reference by replacing the reference with the actual schema
-                new = all_defs.pop(ref)
+                new = all_defs.pop(ref).copy()
                 ref_counts[ref] -= 1  # because we just replaced it!
                 new.pop('ref')  # type: ignore
                 # put all other keys that were on the def-ref schema into the inlined version
@@ -520,17 +568,18 @@ def _simplify_schema_references(schema: core_schema.CoreSchema, inline: bool) ->
         else:
             return recurse(s, inline_refs)
 
-    schema = walk_core_schema(schema, inline_refs)
+    schema = walk_core_schema(flattened.schema, inline_refs)
 
     definitions = [d for d in all_defs.values() if ref_counts[d['ref']] > 0]  # type: ignore
-    return make_result(schema, definitions)
+    return _make_result(schema, definitions)
 
 
 def flatten_schema_defs(schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
     """Simplify schema references by:
     1. Grouping all definitions into a single top-level `definitions` schema, similar to a JSON schema's `#/$defs`.
     """
-    return _simplify_schema_references(schema, inline=False)
+    flattened = _flatten_refs(schema)
+    return _make_result(flattened.schema, flattened.definitions.values())
 
 
 def inline_schema_defs(schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
@@ -538,4 +587,15 @@ def inline_schema_defs(schema: core_schema.CoreSchema) -> core_schema.CoreSchema
     1. Inlining any definitions that are only referenced in one place and are not involved in a cycle.
     2. Removing any unused `ref` references from schemas.
     """
-    return _simplify_schema_references(schema, inline=True)
+    return _inline_refs(_flatten_refs(schema))
+
+
+def simplify_schema_defs(schema: core_schema.CoreSchema) -> tuple[core_schema.CoreSchema, core_schema.CoreSchema]:
+    """Equivalent to `flatten_schema_defs(schema)` followed by `inline_schema_defs` on the result, but only flattens
+    the schema once.
+
+    Returns:
+        A tuple of the flattened schema and the simplified schema, the two may share definitions.
+    """
+    flattened = _flatten_refs(schema)
+    return _make_result(flattened.schema, flattened.definitions.values()), _inline_refs(flattened)
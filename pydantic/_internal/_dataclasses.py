@@ -13,11 +13,11 @@ from typing_extensions import TypeGuard
 from ..errors import PydanticUndefinedAnnotation
 from ..fields import FieldInfo
 from . import _config, _decorators, _typing_extra
-from ._core_utils import flatten_schema_defs, inline_schema_defs
+from ._core_utils import inline_schema_defs
 from ._fields import collect_dataclass_fields
 from ._generate_schema import GenerateSchema
 from ._generics import get_standard_typevars_map
-from ._model_construction import MockValidator
+from ._mock_val_ser import MockValidator
 from ._schema_generation_shared import CallbackGetCoreSchemaHandler
 
 if typing.TYPE_CHECKING:
@@ -134,7 +134,8 @@ def complete_dataclass(
         def attempt_rebuild() -> SchemaValidator | None:
             from ..dataclasses import rebuild_dataclass
 
-            if rebuild_dataclass(cls, raise_errors=False, _parent_namespace_depth=5):
+            # `None` means the dataclass is already complete, e.g. another thread rebuilt it since the mock was accessed
+            if rebuild_dataclass(cls, raise_errors=False, _parent_namespace_depth=5) is not False:
                 return cls.__pydantic_validator__  # type: ignore
             else:
                 return None
@@ -153,7 +154,7 @@ def complete_dataclass(
     cls = typing.cast('type[PydanticDataclass]', cls)
     # debug(schema)
     cls.__pydantic_core_schema__ = schema
-    simplified_core_schema = inline_schema_defs(flatten_schema_defs(schema))
+    simplified_core_schema = inline_schema_defs(schema)
     cls.__pydantic_validator__ = validator = SchemaValidator(simplified_core_schema, core_config)
     cls.__pydantic_serializer__ = SchemaSerializer(simplified_core_schema, core_config)
 
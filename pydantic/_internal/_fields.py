@@ -4,7 +4,7 @@ from __future__ import annotations as _annotations
 import dataclasses
 import sys
 from copy import copy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Mapping
 
 from . import _typing_extra
 from ._config import ConfigWrapper
@@ -208,7 +208,10 @@ def _is_finalvar_with_default_val(type_: type[Any], val: Any) -> bool:
 
 
 def collect_dataclass_fields(
-    cls: type[StandardDataclass], types_namespace: dict[str, Any] | None, *, typevars_map: dict[Any, Any] | None = None
+    cls: type[StandardDataclass],
+    types_namespace: Mapping[str, Any] | None,
+    *,
+    typevars_map: dict[Any, Any] | None = None,
 ) -> dict[str, FieldInfo]:
     """Collect the fields of a dataclass.
 
@@ -15,7 +15,19 @@ from inspect import Parameter, _ParameterKind, signature
 from itertools import chain
 from operator import attrgetter
 from types import FunctionType, LambdaType, MethodType
-from typing import TYPE_CHECKING, Any, Callable, ForwardRef, Iterable, Iterator, Mapping, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ForwardRef,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic_core import CoreSchema, core_schema
 from typing_extensions import Annotated, Final, Literal, TypeAliasType, TypedDict, get_args, get_origin, is_typeddict
@@ -62,6 +74,7 @@ from ._generics import get_standard_typevars_map, recursively_defined_type_refs,
 from ._schema_generation_shared import (
     CallbackGetCoreSchemaHandler,
 )
+from ._schema_memo import copy_schema, memo_key, schema_memo
 from ._typing_extra import is_finalvar
 from ._utils import lenient_issubclass
 
@@ -85,6 +98,16 @@ ModifyCoreSchemaWrapHandler = GetCoreSchemaHandler
 GetCoreSchemaFunction = Callable[[Any, ModifyCoreSchemaWrapHandler], core_schema.CoreSchema]
 
 
+def update_field_json_schema(
+    schema: CoreSchemaOrField, handler: GetJsonSchemaHandler, *, updates: dict[str, Any]
+) -> JsonSchemaValue:
+    """Update a field's JSON schema with `title`, `description`, `examples` and `json_schema_extra` from `Field`.
+
+    This is a module-level function (used via `partial`) rather than a closure so that core schemas stay picklable.
+    """
+    return {**handler(schema), **updates}
+
+
 def check_validator_fields_against_field_name(
     info: FieldDecoratorInfo,
     field: str,
@@ -170,7 +193,7 @@ class GenerateSchema:
     def __init__(
         self,
         config_wrapper: ConfigWrapper,
-        types_namespace: dict[str, Any] | None,
+        types_namespace: Mapping[str, Any] | None,
         typevars_map: dict[Any, Any] | None = None,
     ):
         # we need a stack for recursing into child models
@@ -202,6 +225,14 @@ class GenerateSchema:
         obj: Any,
         from_dunder_get_core_schema: bool = True,
         from_prepare_args: bool = True,
+    ) -> core_schema.CoreSchema:
+        return self._memoized(
+            memo_key(self.config_wrapper, obj, from_dunder_get_core_schema, from_prepare_args),
+            lambda: self._generate_schema_uncached(obj, from_dunder_get_core_schema, from_prepare_args),
+        )
+
+    def _generate_schema_uncached(
+        self, obj: Any, from_dunder_get_core_schema: bool, from_prepare_args: bool
     ) -> core_schema.CoreSchema:
         if isinstance(obj, type(Annotated[int, 123])):
             return self._annotated_schema(obj)
@@ -209,6 +240,23 @@ class GenerateSchema:
             obj, from_dunder_get_core_schema=from_dunder_get_core_schema, from_prepare_args=from_prepare_args
         )
 
+    def _memoized(self, key: Hashable | None, generate: Callable[[], CoreSchema]) -> CoreSchema:
+        """Get a schema from the process-wide memo, or generate it and memoize it if it doesn't refer to any
+        definitions.
+
+        `key` should be built with `_schema_memo.memo_key`, `None` means the schema can't be memoized.
+        """
+        if key is None or self.typevars_map:
+            return generate()
+        schema = schema_memo.get(key)
+        if schema is not None:
+            return schema
+        references, definitions = self.defs.references, len(self.defs.definitions)
+        schema = generate()
+        if self.defs.references == references and len(self.defs.definitions) == definitions:
+            schema_memo.set(key, schema)
+        return schema
+
     def _generate_schema_for_type(
         self,
         obj: Any,
@@ -233,7 +281,10 @@ class GenerateSchema:
             metadata_schema = resolve_original_schema(schema, self.defs.definitions)
             if metadata_schema:
                 metadata = CoreMetadataHandler(metadata_schema).metadata
-                metadata.setdefault('pydantic_js_functions', []).append(metadata_js_function)
+                js_functions = metadata.setdefault('pydantic_js_functions', [])
+                # the schema may be the stored schema of a type we've already built, which already has this function
+                if metadata_js_function not in js_functions:
+                    js_functions.append(metadata_js_function)
 
         return remove_unnecessary_invalid_definitions(schema)
 
@@ -274,10 +325,14 @@ class GenerateSchema:
                     metadata={**metadata, **root_field['metadata']},
                 )
             else:
+                origin_field_schemas = reusable_origin_field_schemas(cls, config_wrapper)
                 self._config_wrapper_stack.append(config_wrapper)
                 try:
                     fields_schema: core_schema.CoreSchema = core_schema.model_fields_schema(
-                        {k: self._generate_md_field_schema(k, v, decorators) for k, v in fields.items()},
+                        {
+                            k: origin_field_schemas.get(k) or self._generate_md_field_schema(k, v, decorators)
+                            for k, v in fields.items()
+                        },
                         computed_fields=[self._computed_field_schema(d) for d in decorators.computed_fields.values()],
                     )
                 finally:
@@ -344,11 +399,40 @@ class GenerateSchema:
             return get_schema(source)
 
         schema = get_schema(source, CallbackGetCoreSchemaHandler(self._generate_schema, self, ref_mode=ref_mode))
+        if schema['type'] == 'definitions':
+            schema = self._unpack_definitions(schema)
         if 'ref' in schema:
             self.defs.definitions[schema['ref']] = schema
             return core_schema.definition_reference_schema(schema['ref'])
         return schema
 
+    def _unpack_definitions(self, schema: core_schema.DefinitionsSchema) -> core_schema.CoreSchema:
+        """Move the definitions of a `definitions` schema into `self.defs` so they can be referenced.
+
+        This is what lets us reuse the stored schema of a model (or dataclass) that's already been built: the model
+        and all the types it refers to are defined once, and every other use of them is a `definition-ref` schema,
+        rather than a copy of the model's whole schema.
+
+        Schemas with invalid definitions, or with any other keys (e.g. `serialization`), are returned as they are.
+        """
+        definitions = schema['definitions']
+        if schema.keys() != {'type', 'schema', 'definitions'} or any(
+            'invalid' in d.get('metadata', {}) for d in definitions
+        ):
+            return schema
+        for definition in definitions:
+            ref: str = definition['ref']  # type: ignore[typeddict-item]
+            if ref not in self.defs.definitions:
+                # copy the definition since JSON schema functions may be added to its metadata
+                definition = definition.copy()
+                metadata = definition.get('metadata')
+                if isinstance(metadata, dict):
+                    definition['metadata'] = {k: copy(v) for k, v in metadata.items()}
+                self.defs.definitions[ref] = definition
+        # keep the (now empty) `definitions` schema so that metadata is still added to this reference to the type,
+        # rather than to its definition
+        return core_schema.definitions_schema(schema['schema'].copy(), [])
+
     def _generate_schema(self, obj: Any) -> core_schema.CoreSchema:  # noqa: C901
         """Recursively generate a pydantic-core schema for any supported python type."""
         if isinstance(obj, dict):
@@ -567,10 +651,10 @@ class GenerateSchema:
             return schema
 
         source_type, annotations = field_info.annotation, field_info.metadata
-        schema = self._apply_annotations(
-            apply_discriminator,
-            source_type,
-            annotations,
+        key = memo_key(self.config_wrapper, source_type, tuple(annotations))
+        schema = self._memoized(
+            key if field_info.discriminator is None else None,
+            lambda: self._apply_annotations(apply_discriminator, source_type, annotations),
         )
 
         # This V1 compatibility shim should eventually be removed
@@ -606,10 +690,7 @@ class GenerateSchema:
         json_schema_updates = {k: v for k, v in json_schema_updates.items() if v is not None}
         json_schema_updates.update(field_info.json_schema_extra or {})
 
-        def json_schema_update_func(schema: CoreSchemaOrField, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
-            return {**handler(schema), **json_schema_updates}
-
-        metadata = build_metadata_dict(js_functions=[json_schema_update_func])
+        metadata = build_metadata_dict(js_functions=[partial(update_field_json_schema, updates=json_schema_updates)])
 
         # apply alias generator
         alias_generator = self.config_wrapper.alias_generator
@@ -666,8 +747,8 @@ class GenerateSchema:
             if maybe_schema is not None:
                 return maybe_schema
 
-            namespace = (self.types_namespace or {}).copy()
-            new_namespace = {**_typing_extra.get_cls_types_namespace(origin), **namespace}
+            namespace = self.types_namespace
+            new_namespace = {**_typing_extra.get_cls_types_namespace(origin), **(namespace or {})}
             annotation = origin.__value__
 
             self.types_namespace = new_namespace
@@ -676,7 +757,7 @@ class GenerateSchema:
             schema = self.generate_schema(annotation)
             assert schema['type'] != 'definitions'
             schema['ref'] = ref  # type: ignore
-            self.types_namespace = namespace or None
+            self.types_namespace = namespace
             self.defs.definitions[ref] = schema
             return core_schema.definition_reference_schema(ref)
 
@@ -1421,6 +1502,92 @@ def apply_model_validators(
     return schema
 
 
+def reusable_origin_field_schemas(
+    cls: type[BaseModel], config_wrapper: ConfigWrapper
+) -> dict[str, core_schema.ModelField]:
+    """Get the field schemas of the generic origin of `cls` which `cls` can reuse, if `cls` is a parametrized
+    generic model.
+
+    A field's schema is reused when the field's annotation isn't changed by the parametrization (i.e. it doesn't
+    contain any of the origin's type variables) and the schema doesn't refer to any definitions, so only the fields
+    which depend on the type variables are generated again for each parametrization.
+
+    The schemas of fields with field validators or serializers aren't reused either, since the origin's schemas have
+    those bound to the origin rather than to `cls`.
+    """
+    origin = getattr(cls, '__pydantic_generic_metadata__', {}).get('origin')
+    decorators = cls.__pydantic_decorators__
+    if (
+        origin is None
+        or not origin.__pydantic_complete__
+        or origin.model_config != cls.model_config
+        # both modify the fields while generating their schemas
+        or config_wrapper.alias_generator is not None
+        or decorators.validators
+    ):
+        return {}
+
+    decorated_fields = {
+        field
+        for decorator in chain(decorators.field_validators.values(), decorators.field_serializers.values())
+        for field in decorator.info.fields
+    }
+    if '*' in decorated_fields:
+        return {}
+
+    fields_schema = _find_model_fields_schema(origin.__pydantic_core_schema__, origin)
+    if fields_schema is None:
+        return {}
+
+    reusable: dict[str, core_schema.ModelField] = {}
+    for name, field_schema in fields_schema['fields'].items():
+        origin_field, field = origin.model_fields.get(name), cls.model_fields.get(name)
+        if origin_field is None or field is None or origin_field.annotation != field.annotation:
+            continue
+        if name not in decorated_fields and not _refers_to_definitions(field_schema):
+            reusable[name] = copy_schema(field_schema)
+    return reusable
+
+
+def _find_model_fields_schema(schema: CoreSchema, cls: type[BaseModel]) -> core_schema.ModelFieldsSchema | None:
+    """Find the fields schema of `cls` in its core schema, through any validators applied to the model or its
+    fields schema.
+    """
+    definitions: dict[str, CoreSchema] = {}
+    if schema['type'] == 'definitions':
+        definitions = {d['ref']: d for d in schema['definitions']}  # type: ignore[misc]
+        schema = schema['schema']
+    in_model = False
+    while True:
+        if schema['type'] == 'definition-ref':
+            found = definitions.get(schema['schema_ref'])
+            if found is None:
+                return None
+            schema = found
+        elif schema['type'] == 'model':
+            if schema['cls'] is not cls or in_model:
+                return None
+            in_model = True
+            schema = schema['schema']
+        elif schema['type'] == 'model-fields':
+            return schema if in_model else None
+        elif 'schema' in schema:
+            schema = schema['schema']  # type: ignore[typeddict-item]
+        else:
+            return None
+
+
+def _refers_to_definitions(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        if 'ref' in schema or 'schema_ref' in schema:
+            return True
+        return any(_refers_to_definitions(v) for k, v in schema.items() if k != 'default')
+    elif isinstance(schema, list):
+        return any(_refers_to_definitions(v) for v in schema)
+    else:
+        return False
+
+
 def wrap_default(field_info: FieldInfo, schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
     if field_info.default_factory:
         return core_schema.with_default_schema(
@@ -1497,6 +1664,8 @@ class _Definitions:
     def __init__(self) -> None:
         self.seen: set[str] = set()
         self.definitions: dict[str, core_schema.CoreSchema] = {}
+        # the number of `definition-ref` schemas returned by `get_schema_or_ref`
+        self.references = 0
 
     @contextmanager
     def get_schema_or_ref(self, tp: Any) -> Iterator[tuple[str, None] | tuple[str, CoreSchema]]:
@@ -1521,6 +1690,7 @@ class _Definitions:
         ref = get_type_ref(tp)
         # return the reference if we're either (1) in a cycle or (2) it was already defined
         if ref in self.seen or ref in self.definitions:
+            self.references += 1
             yield (ref, core_schema.definition_reference_schema(ref))
         else:
             self.seen.add(ref)
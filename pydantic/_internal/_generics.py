@@ -3,11 +3,10 @@ from __future__ import annotations
 import sys
 import types
 import typing
-from collections import ChainMap
 from contextlib import contextmanager
 from contextvars import ContextVar
 from types import prepare_class
-from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, MutableMapping, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Tuple, TypeVar
 from weakref import WeakValueDictionary
 
 import typing_extensions
@@ -15,7 +14,7 @@ import typing_extensions
 from ._core_utils import get_type_ref
 from ._forward_ref import PydanticRecursiveRef
 from ._typing_extra import TypeVarType, typing_base
-from ._utils import all_identical, is_basemodel
+from ._utils import LRUCache, all_identical, is_basemodel
 
 if sys.version_info >= (3, 10):
     from typing import _UnionGenericAlias  # type: ignore[attr-defined]
@@ -25,88 +24,67 @@ if TYPE_CHECKING:
 
 GenericTypesCacheKey = Tuple[Any, Any, Tuple[Any, ...]]
 
-# Note: We want to remove LimitedDict, but to do this, we'd need to improve the handling of generics caching.
-#   Right now, to handle recursive generics, we some types must remain cached for brief periods without references.
-#   By chaining the WeakValuesDict with a LimitedDict, we have a way to retain caching for all types with references,
-#   while also retaining a limited number of types even without references. This is generally enough to build
-#   specific recursive generic models without losing required items out of the cache.
-
-KT = TypeVar('KT')
-VT = TypeVar('VT')
-_LIMITED_DICT_SIZE = 100
-if TYPE_CHECKING:
-
-    class LimitedDict(dict, MutableMapping[KT, VT]):  # type: ignore[type-arg]
-        def __init__(self, size_limit: int = _LIMITED_DICT_SIZE):
-            ...
-
-else:
-
-    class LimitedDict(dict):
-        """Limit the size/length of a dict used for caching to avoid unlimited increase in memory usage.
-
-        Since the dict is ordered, and we always remove elements from the beginning, this is effectively a FIFO cache.
-        """
-
-        def __init__(self, size_limit: int = _LIMITED_DICT_SIZE):
-            self.size_limit = size_limit
-            super().__init__()
-
-        def __setitem__(self, __key: Any, __value: Any) -> None:
-            super().__setitem__(__key, __value)
-            if len(self) > self.size_limit:
-                excess = len(self) - self.size_limit + self.size_limit // 10
-                to_remove = list(self.keys())[:excess]
-                for key in to_remove:
-                    del self[key]
-
-        def __class_getitem__(cls, *args: Any) -> Any:
-            # to avoid errors with 3.7
-            return cls
-
+DEFAULT_GENERIC_TYPES_CACHE_SIZE = 128
+"""The default number of recently used parametrized generic models kept alive by the cache."""
 
 # weak dictionaries allow the dynamically created parametrized versions of generic models to get collected
 # once they are no longer referenced by the caller.
 if sys.version_info >= (3, 9):  # Typing for weak dictionaries available at 3.9
-    GenericTypesCache = WeakValueDictionary[GenericTypesCacheKey, 'type[BaseModel]']
+    GenericTypesCacheDict = WeakValueDictionary[GenericTypesCacheKey, 'type[BaseModel]']
 else:
-    GenericTypesCache = WeakValueDictionary
+    GenericTypesCacheDict = WeakValueDictionary
 
-if TYPE_CHECKING:
 
-    class DeepChainMap(ChainMap[KT, VT]):  # type: ignore
-        ...
+class GenericTypesCache:
+    """The cache of parametrized generic models.
 
-else:
+    Models are found by their parametrization for as long as they're referenced, using a weak dictionary, but the
+    cache also keeps the most recently used models alive, so models which are parametrized and used without keeping
+    a reference, e.g. `Page[Item].model_validate(data)`, aren't created again every time they're used. Keeping some
+    models alive also retains the types needed while building recursive generic models.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_GENERIC_TYPES_CACHE_SIZE) -> None:
+        self._types = GenericTypesCacheDict()
+        # the values are unused, the keys are the recently used models
+        self._recent: LRUCache[type[BaseModel]] = LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: GenericTypesCacheKey) -> type[BaseModel] | None:
+        type_ = self._types.get(key)
+        if type_ is not None:
+            self._recent.set(type_, type_)
+        return type_
+
+    def __setitem__(self, key: GenericTypesCacheKey, type_: type[BaseModel]) -> None:
+        self._types[key] = type_
+        self._recent.set(type_, type_)
 
-    class DeepChainMap(ChainMap):
-        """Variant of ChainMap that allows direct updates to inner scopes.
+    def clear(self) -> None:
+        self._types.clear()
+        self._recent.clear()
 
-        Taken from https://docs.python.org/3/library/collections.html#collections.ChainMap,
-        with some light modifications for this use case.
-        """
+    def __len__(self) -> int:
+        return len(self._types)
 
-        def clear(self) -> None:
-            for mapping in self.maps:
-                mapping.clear()
+    @property
+    def evictions(self) -> int:
+        return self._recent.evictions
 
-        def __setitem__(self, key: KT, value: VT) -> None:
-            for mapping in self.maps:
-                mapping[key] = value
+    @property
+    def max_size(self) -> int:
+        return self._recent.max_size
 
-        def __delitem__(self, key: KT) -> None:
-            hit = False
-            for mapping in self.maps:
-                if key in mapping:
-                    del mapping[key]
-                    hit = True
-            if not hit:
-                raise KeyError(key)
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        self._recent.max_size = max_size
 
+    @property
+    def current_size(self) -> int:
+        """The number of models kept alive by the cache, rather than the number of keys in the weak dictionary."""
+        return len(self._recent)
 
-# Despite the fact that LimitedDict _seems_ no longer necessary, I'm very nervous to actually remove it
-# and discover later on that we need to re-add all this infrastructure...
-# _GENERIC_TYPES_CACHE = DeepChainMap(GenericTypesCache(), LimitedDict())
 
 _GENERIC_TYPES_CACHE = GenericTypesCache()
 
@@ -381,7 +359,10 @@ def get_cached_generic_type_early(parent: type[BaseModel], typevar_values: Any)
     during validation, I think it is worthwhile to ensure that types that are functionally equivalent are actually
     equal.
     """
-    return _GENERIC_TYPES_CACHE.get(_early_cache_key(parent, typevar_values))
+    cached = _GENERIC_TYPES_CACHE.get(_early_cache_key(parent, typevar_values))
+    if cached is not None:
+        _GENERIC_TYPES_CACHE.hits += 1
+    return cached
 
 
 def get_cached_generic_type_late(
@@ -390,7 +371,10 @@ def get_cached_generic_type_late(
     """See the docstring of `get_cached_generic_type_early` for more information about the two-stage cache lookup."""
     cached = _GENERIC_TYPES_CACHE.get(_late_cache_key(origin, args, typevar_values))
     if cached is not None:
+        _GENERIC_TYPES_CACHE.hits += 1
         set_cached_generic_type(parent, typevar_values, cached, origin, args)
+    else:
+        _GENERIC_TYPES_CACHE.misses += 1
     return cached
 
 
@@ -0,0 +1,61 @@
+"""Mock validators and serializers, used in place of the real ones until a model or dataclass can be built."""
+from __future__ import annotations as _annotations
+
+from typing import Any, Callable, ClassVar
+
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from ..errors import PydanticErrorCodes, PydanticUserError
+
+
+class MockValidator:
+    """Mocker for `pydantic_core.SchemaValidator` which just raises an error when one of its methods is accessed."""
+
+    __slots__ = '_error_message', '_code', '_attempt_rebuild'
+
+    _mocked_type: ClassVar[type[Any]] = SchemaValidator
+
+    def __init__(
+        self,
+        error_message: str,
+        *,
+        code: PydanticErrorCodes,
+        attempt_rebuild: Callable[[], Any] | None = None,
+    ) -> None:
+        """Attempt rebuild."""
+        self._error_message = error_message
+        self._code: PydanticErrorCodes = code
+        self._attempt_rebuild = attempt_rebuild
+
+    def __getattr__(self, item: str) -> None:
+        __tracebackhide__ = True
+        if self._attempt_rebuild:
+            rebuilt = self._attempt_rebuild()
+            if rebuilt is not None:
+                return getattr(rebuilt, item)
+
+        # raise an AttributeError if `item` doesn't exist
+        getattr(self._mocked_type, item)
+        raise PydanticUserError(self._error_message, code=self._code)
+
+    def rebuild(self) -> Any:
+        """Attempt to rebuild the mocked object, returning it if successful, otherwise `None`."""
+        if self._attempt_rebuild:
+            return self._attempt_rebuild()
+        return None
+
+    def rebuild_or_raise(self) -> Any:
+        """Rebuild the mocked object and return it, or raise the error explaining why it can't be rebuilt."""
+        __tracebackhide__ = True
+        rebuilt = self.rebuild()
+        if rebuilt is None:
+            raise PydanticUserError(self._error_message, code=self._code)
+        return rebuilt
+
+
+class MockSerializer(MockValidator):
+    """Mocker for `pydantic_core.SchemaSerializer` which just raises an error when one of its methods is accessed."""
+
+    __slots__ = ()
+
+    _mocked_type = SchemaSerializer
@@ -5,20 +5,25 @@ import typing
 import warnings
 from abc import ABCMeta
 from functools import partial
+from threading import RLock
 from types import FunctionType
 from typing import Any, Callable, Generic, Mapping
 
-from pydantic_core import SchemaSerializer, SchemaValidator
+from pydantic_core import InitErrorDetails, SchemaSerializer, SchemaValidator, ValidationError
 from typing_extensions import dataclass_transform, deprecated
 
-from ..errors import PydanticErrorCodes, PydanticUndefinedAnnotation, PydanticUserError
+from ..errors import PydanticUndefinedAnnotation, PydanticUserError
 from ..fields import Field, FieldInfo, ModelPrivateAttr, PrivateAttr
+from ..plugin import _plug_serializer, _plug_validator
+from . import _schema_cache
 from ._config import ConfigWrapper
-from ._core_utils import flatten_schema_defs, inline_schema_defs
+from ._core_utils import simplify_schema_defs
 from ._decorators import ComputedFieldInfo, DecoratorInfos, PydanticDescriptorProxy
 from ._fields import Undefined, collect_model_fields
 from ._generate_schema import GenerateSchema
 from ._generics import PydanticGenericMetadata, get_model_typevars_map
+from ._mock_val_ser import MockSerializer, MockValidator
+from ._profiling import profile_model_build, record_schema_size, timed
 from ._schema_generation_shared import CallbackGetCoreSchemaHandler
 from ._typing_extra import get_cls_types_namespace, is_classvar, parent_frame_namespace
 from ._utils import ClassAttribute, is_valid_identifier
@@ -26,6 +31,7 @@ from ._utils import ClassAttribute, is_valid_identifier
 if typing.TYPE_CHECKING:
     from inspect import Signature
 
+    from ..config import ConfigDict
     from ..main import BaseModel
 
 
@@ -39,6 +45,15 @@ IGNORED_TYPES: tuple[Any, ...] = (
 )
 object_setattr = object.__setattr__
 
+BUILD_LOCK = RLock()
+"""Held while a model or dataclass is rebuilt, or a generic model is parametrized, so that when several threads use
+a model for the first time at once, the model is only built by one of them.
+
+A single reentrant lock is used rather than a lock per class, since building one class can build others (e.g. a
+generic model parametrized in the annotation of a field), and per-class locks taken in different orders by different
+threads could deadlock.
+"""
+
 
 class _ModelNamespaceDict(dict):  # type: ignore[type-arg]
     """A dictionary subclass that intercepts attribute setting on model classes and warns about overriding of
@@ -171,13 +186,8 @@ class ModelMetaclass(ABCMeta):
 
             types_namespace = get_cls_types_namespace(cls, parent_namespace)
             set_model_fields(cls, bases, config_wrapper, types_namespace)
-            complete_model_class(
-                cls,
-                cls_name,
-                config_wrapper,
-                raise_errors=False,
-                types_namespace=types_namespace,
-            )
+            set_model_setattr_handlers(cls, config_wrapper)
+            complete_or_defer_model_class(cls, cls_name, config_wrapper, types_namespace)
             # using super(cls, cls) on the next line ensures we only call the parent class's __pydantic_init_subclass__
             # I believe the `type: ignore` is only necessary because mypy doesn't realize that this code branch is
             # only hit for _proper_ subclasses of BaseModel
@@ -341,6 +351,68 @@ def set_model_fields(
     cls.__class_vars__.update(class_vars)
 
 
+SetattrHandler = Callable[['BaseModel', str, Any], None]
+
+
+def set_model_setattr_handlers(cls: type[BaseModel], config_wrapper: ConfigWrapper) -> None:
+    """Set `cls.__pydantic_setattr_handlers__`, which maps the fields and private attributes of `cls` to how
+    `BaseModel.__setattr__` assigns them, so assignments don't repeat the checks of the model's config on every call.
+
+    Names without a handler, e.g. class vars, properties and extra attributes, go through all the checks of
+    `BaseModel.__setattr__`, as do all names once the `frozen` or `validate_assignment` setting of the model's
+    `model_config` differs from `cls.__pydantic_setattr_config__`, the values the handlers were chosen from.
+    """
+    handlers: dict[str, SetattrHandler] = {}
+    for name in cls.model_fields:
+        if name in cls.__class_vars__ or isinstance(getattr(cls, name, None), property):
+            continue
+        if config_wrapper.frozen:
+            handlers[name] = _setattr_frozen
+        elif config_wrapper.validate_assignment:
+            handlers[name] = _setattr_validate_assignment
+        else:
+            handlers[name] = _setattr_field
+    for name, attribute in cls.__private_attributes__.items():
+        if name not in cls.__class_vars__:
+            handlers[name] = _private_setattr_handler(attribute)
+    cls.__pydantic_setattr_handlers__ = handlers
+    cls.__pydantic_setattr_config__ = setattr_config(cls.model_config)
+
+
+def setattr_config(config: ConfigDict) -> tuple[Any, Any]:
+    """The settings of `config` which `set_model_setattr_handlers` chooses the handlers from."""
+    return config.get('frozen'), config.get('validate_assignment')
+
+
+def _setattr_frozen(model: BaseModel, name: str, value: Any) -> None:
+    error: InitErrorDetails = {'type': 'frozen_instance', 'loc': (name,), 'input': value}
+    raise ValidationError.from_exception_data(model.__class__.__name__, [error])
+
+
+def _setattr_validate_assignment(model: BaseModel, name: str, value: Any) -> None:
+    model.__pydantic_validator__.validate_assignment(model, name, value)
+
+
+def _setattr_field(model: BaseModel, name: str, value: Any) -> None:
+    model.__dict__[name] = value
+    model.__pydantic_fields_set__.add(name)
+
+
+def _private_setattr_handler(attribute: ModelPrivateAttr) -> SetattrHandler:
+    descriptor_set = getattr(attribute, '__set__', None)
+
+    def setattr_private(model: BaseModel, name: str, value: Any) -> None:
+        private = model.__pydantic_private__
+        if private is None:
+            object_setattr(model, name, value)
+        elif descriptor_set is not None:
+            descriptor_set(model, value)
+        else:
+            private[name] = value
+
+    return setattr_private
+
+
 def complete_model_class(
     cls: type[BaseModel],
     cls_name: str,
@@ -356,57 +428,113 @@ def complete_model_class(
     This logic must be called after class has been created since validation functions must be bound
     and `get_type_hints` requires a class object.
     """
-    typevars_map = get_model_typevars_map(cls)
-    gen_schema = GenerateSchema(
-        config_wrapper,
-        types_namespace,
-        typevars_map,
-    )
+    with profile_model_build(cls) as profile:
+        cache_dir = config_wrapper.schema_cache_dir
+        fingerprint = _schema_cache.model_fingerprint(cls, config_wrapper) if cache_dir else None
+        cached_schemas = _schema_cache.load_schemas(cls, cache_dir, fingerprint) if fingerprint else None
 
-    handler = CallbackGetCoreSchemaHandler(
-        partial(gen_schema.generate_schema, from_dunder_get_core_schema=False),
-        gen_schema,
-        ref_mode='unpack',
-    )
+        if cached_schemas is not None:
+            schema, simplified_core_schema = cached_schemas
+        else:
+            typevars_map = get_model_typevars_map(cls)
+            gen_schema = GenerateSchema(
+                config_wrapper,
+                types_namespace,
+                typevars_map,
+            )
+
+            handler = CallbackGetCoreSchemaHandler(
+                partial(gen_schema.generate_schema, from_dunder_get_core_schema=False),
+                gen_schema,
+                ref_mode='unpack',
+            )
 
-    try:
-        schema = cls.__get_pydantic_core_schema__(cls, handler)
-    except PydanticUndefinedAnnotation as e:
-        if raise_errors:
-            raise
-        undefined_type_error_message = (
-            f'`{cls_name}` is not fully defined; you should define `{e.name}`, then call `{cls_name}.model_rebuild()` '
-            f'before the first `{cls_name}` instance is created.'
+            try:
+                with timed('schema_time'):
+                    schema = cls.__get_pydantic_core_schema__(cls, handler)
+            except PydanticUndefinedAnnotation as e:
+                if raise_errors:
+                    raise
+                set_model_mocks(cls, cls_name, f'`{e.name}`')
+                return False
+
+            schema = gen_schema.collect_definitions(schema)
+            schema, simplified_core_schema = simplify_schema_defs(schema)
+            if fingerprint:
+                _schema_cache.store_schemas(cls, cache_dir, fingerprint, schema, simplified_core_schema)
+
+        if profile is not None:
+            record_schema_size(profile, schema)
+        core_config = config_wrapper.core_config(cls)
+
+        # debug(schema)
+        cls.__pydantic_core_schema__ = schema
+        with timed('validator_time'):
+            cls.__pydantic_validator__ = _plug_validator(SchemaValidator(simplified_core_schema, core_config), cls)
+            cls.__pydantic_serializer__ = _plug_serializer(SchemaSerializer(simplified_core_schema, core_config), cls)
+        cls.__pydantic_complete__ = True
+
+        set_model_signature(cls, config_wrapper)
+        return True
+
+
+def complete_or_defer_model_class(
+    cls: type[BaseModel], cls_name: str, config_wrapper: ConfigWrapper, types_namespace: dict[str, Any] | None
+) -> None:
+    """Complete a newly created model class, unless `defer_build` is set, in which case the class is completed on first
+    validation or serialization.
+    """
+    if config_wrapper.defer_build:
+        set_model_mocks(cls, cls_name)
+        set_model_signature(cls, config_wrapper)
+    else:
+        complete_model_class(
+            cls,
+            cls_name,
+            config_wrapper,
+            raise_errors=False,
+            types_namespace=types_namespace,
         )
 
-        def attempt_rebuild() -> SchemaValidator | None:
-            if cls.model_rebuild(raise_errors=False, _parent_namespace_depth=5):
-                return cls.__pydantic_validator__
-            else:
-                return None
 
-        cls.__pydantic_validator__ = MockValidator(  # type: ignore[assignment]
-            undefined_type_error_message, code='class-not-fully-defined', attempt_rebuild=attempt_rebuild
-        )
-        return False
+def set_model_mocks(cls: type[BaseModel], cls_name: str, undefined_name: str = 'all referenced types') -> None:
+    """Set `__pydantic_validator__` and `__pydantic_serializer__` to mocks which attempt to rebuild the model.
+
+    This is used both when the schema can't be built yet because of undefined annotations, and when the build is
+    deliberately deferred via `defer_build`; either way the model is completed on first validation or serialization.
+    """
+    undefined_type_error_message = (
+        f'`{cls_name}` is not fully defined; you should define {undefined_name}, '
+        f'then call `{cls_name}.model_rebuild()` before the first `{cls_name}` instance is created.'
+    )
+
+    # `model_rebuild` returns `None` if the model is already complete, e.g. if another thread rebuilt it since this
+    # mock was accessed
+    def attempt_rebuild_validator() -> SchemaValidator | None:
+        if cls.model_rebuild(raise_errors=False, _parent_namespace_depth=5) is not False:
+            return cls.__pydantic_validator__
+        else:
+            return None
 
-    core_config = config_wrapper.core_config(cls)
+    def attempt_rebuild_serializer() -> SchemaSerializer | None:
+        if cls.model_rebuild(raise_errors=False, _parent_namespace_depth=5) is not False:
+            return cls.__pydantic_serializer__
+        else:
+            return None
 
-    schema = gen_schema.collect_definitions(schema)
-    schema = flatten_schema_defs(schema)
+    cls.__pydantic_validator__ = MockValidator(  # type: ignore[assignment]
+        undefined_type_error_message, code='class-not-fully-defined', attempt_rebuild=attempt_rebuild_validator
+    )
+    cls.__pydantic_serializer__ = MockSerializer(  # type: ignore[assignment]
+        undefined_type_error_message, code='class-not-fully-defined', attempt_rebuild=attempt_rebuild_serializer
+    )
 
-    # debug(schema)
-    cls.__pydantic_core_schema__ = schema
-    simplified_core_schema = inline_schema_defs(schema)
-    cls.__pydantic_validator__ = SchemaValidator(simplified_core_schema, core_config)
-    cls.__pydantic_serializer__ = SchemaSerializer(simplified_core_schema, core_config)
-    cls.__pydantic_complete__ = True
 
-    # set __signature__ attr only for model class, but not for its instances
+def set_model_signature(cls: type[BaseModel], config_wrapper: ConfigWrapper) -> None:
+    """Set `__signature__` on the model class, but not on its instances."""
     cls.__signature__ = ClassAttribute(
         '__signature__', generate_model_signature(cls.__init__, cls.model_fields, config_wrapper)
     )
-    return True
 
 
 def generate_model_signature(
@@ -480,35 +608,6 @@ def generate_model_signature(
     return Signature(parameters=list(merged_params.values()), return_annotation=None)
 
 
-class MockValidator:
-    """Mocker for `pydantic_core.SchemaValidator` which just raises an error when one of its methods is accessed."""
-
-    __slots__ = '_error_message', '_code', '_attempt_rebuild'
-
-    def __init__(
-        self,
-        error_message: str,
-        *,
-        code: PydanticErrorCodes,
-        attempt_rebuild: Callable[[], SchemaValidator | None] | None = None,
-    ) -> None:
-        """Attempt rebuild."""
-        self._error_message = error_message
-        self._code: PydanticErrorCodes = code
-        self._attempt_rebuild = attempt_rebuild
-
-    def __getattr__(self, item: str) -> None:
-        __tracebackhide__ = True
-        if self._attempt_rebuild:
-            validator = self._attempt_rebuild()
-            if validator is not None:
-                return getattr(validator, item)
-
-        # raise an AttributeError if `item` doesn't exist
-        getattr(SchemaValidator, item)
-        raise PydanticUserError(self._error_message, code=self._code)
-
-
 def model_extra_private_getattr(self: BaseModel, item: str) -> Any:
     """This function is used to retrieve unrecognized attribute values from BaseModel subclasses which
     allow (and store) extra and/or private attributes.
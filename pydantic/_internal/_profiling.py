@@ -0,0 +1,89 @@
+"""Hooks recording model build profiles for `pydantic.profiling.record_schema_builds`."""
+from __future__ import annotations as _annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from ..profiling import ModelBuildProfile
+
+AnyCallable = TypeVar('AnyCallable', bound=Callable[..., Any])
+
+recorders: list[list[ModelBuildProfile]] = []
+"""The lists of the active `record_schema_builds` blocks, each build profile is appended to all of them."""
+current_build: ContextVar[ModelBuildProfile | None] = ContextVar('current_build', default=None)
+
+
+@contextmanager
+def profile_model_build(cls: type[Any]) -> Iterator[ModelBuildProfile | None]:
+    """Profile the build of `cls` if `record_schema_builds` is active, otherwise yield `None`."""
+    if not recorders:
+        yield None
+        return
+
+    from ..profiling import ModelBuildProfile
+
+    profile = ModelBuildProfile(f'{cls.__module__}.{cls.__qualname__}')
+    token = current_build.set(profile)
+    start = perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_time = perf_counter() - start
+        current_build.reset(token)
+        for profiles in list(recorders):
+            profiles.append(profile)
+
+
+@contextmanager
+def timed(attribute: str) -> Iterator[None]:
+    """Add the time taken by the `with` block to `attribute` of the current build's profile, if any."""
+    profile = current_build.get()
+    if profile is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        setattr(profile, attribute, getattr(profile, attribute) + perf_counter() - start)
+
+
+def timed_pass(func: AnyCallable) -> AnyCallable:
+    """Decorate a pass over core schemas to add the time it takes to the current build's profile, if any."""
+    name = func.__name__.lstrip('_')
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = current_build.get()
+        if profile is None:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.pass_times[name] = profile.pass_times.get(name, 0.0) + perf_counter() - start
+
+    return wrapper  # type: ignore[return-value]
+
+
+def record_schema_size(profile: ModelBuildProfile, schema: Any) -> None:
+    """Record the number of nodes and definitions in a model's core schema."""
+    if isinstance(schema, dict) and schema.get('type') == 'definitions':
+        profile.definition_count = len(schema['definitions'])
+    profile.node_count = _count_nodes(schema)
+
+
+def _count_nodes(schema: Any) -> int:
+    if isinstance(schema, dict):
+        count = 1 if 'type' in schema else 0
+        return count + sum(_count_nodes(v) for k, v in schema.items() if k not in ('default', 'metadata'))
+    elif isinstance(schema, list):
+        return sum(_count_nodes(v) for v in schema)
+    else:
+        return 0
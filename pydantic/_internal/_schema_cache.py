@@ -0,0 +1,459 @@
+"""Persistent on-disk cache of model core schemas, enabled by the `schema_cache_dir` config setting.
+
+Each cache entry holds a model's flattened core schema (`__pydantic_core_schema__`) and the simplified schema passed
+to `SchemaValidator`, stored in `<schema_cache_dir>/<fingerprint>.json`.
+
+The fingerprint covers the model's fields, config and decorators, the pydantic, pydantic-core and python versions,
+and the source files of the modules defining the model and its bases. Each entry also records the source files of
+every module which the schema refers to (e.g. the modules defining referenced models or validator functions); the
+entry is ignored if any of them have changed.
+
+Entries are JSON, and loading one never calls anything it refers to: classes and functions are stored by their
+module and qualified name and looked up in modules which are already imported, and the few kinds of objects schemas
+hold (e.g. pydantic's validator dataclasses, enum members, decimals and dates) are rebuilt from their data, without
+calling `__init__` or any other code of the model. Only these references are allowed, see `_allowed_reference`:
+
+* classes and functions defined in pydantic, pydantic-core, or the modules defining the model and its bases
+* models, dataclasses and enums defined anywhere
+* the public classes of a few standard library modules
+
+Schemas which hold anything else (e.g. a lambda, a function defined inside another function, or a function from
+another module) are simply not stored, and they're regenerated as usual every time the model is created. Entries
+which can't be loaded, e.g. because they're corrupt or refer to anything else, are deleted and treated as a cache
+miss.
+"""
+from __future__ import annotations as _annotations
+
+import dataclasses
+import datetime
+import decimal
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import uuid
+from enum import Enum
+from functools import partial
+from importlib.util import find_spec
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Tuple
+
+from pydantic_core import CoreSchema
+from pydantic_core import __version__ as pydantic_core_version
+
+from ..version import VERSION
+from ._config import ConfigWrapper
+
+if TYPE_CHECKING:
+    from ..main import BaseModel
+
+ModuleStamp = Tuple[str, int, int]
+"""The path, modification time (in nanoseconds) and size of a module's source file."""
+
+_MEMORY_ADDRESS_RE = re.compile(r' at 0x[0-9a-fA-F]+')
+_REF_ID_RE = re.compile(r':(str-)?(\d+)')
+
+
+def model_fingerprint(cls: type[BaseModel], config_wrapper: ConfigWrapper) -> str | None:
+    """Compute the key of `cls` in the schema cache, or `None` if `cls` can't be cached.
+
+    Models defined inside functions can't be cached since they can't be identified across processes; nor can models
+    using an `alias_generator` or `@validator`s, since generating their schema modifies their fields.
+    """
+    if '<locals>' in cls.__qualname__:
+        return None
+    decorators = cls.__pydantic_decorators__
+    if config_wrapper.alias_generator is not None or decorators.validators:
+        return None
+
+    parts = [sys.version, VERSION, pydantic_core_version, cls.__module__, cls.__qualname__]
+    for module_name in dict.fromkeys(base.__module__ for base in cls.__mro__):
+        parts.append(repr(_module_stamp(module_name)))
+    parts.append(repr(cls.model_fields))
+    parts.append(repr(sorted(config_wrapper.config_dict.items(), key=lambda item: item[0])))
+    for decorators_field in dataclasses.fields(decorators):
+        # `Decorator.cls_ref` includes the `id()` of the class, so only use the name and info of each decorator
+        parts.extend(f'{d.cls_var_name}: {d.info!r}' for d in getattr(decorators, decorators_field.name).values())
+    text = _MEMORY_ADDRESS_RE.sub('', '\n'.join(parts))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def load_schemas(cls: type[BaseModel], cache_dir: str, fingerprint: str) -> tuple[CoreSchema, CoreSchema] | None:
+    """Load the core schema and simplified core schema of `cls` from the cache, or return `None` on a cache miss.
+
+    Entries which can't be loaded are deleted.
+    """
+    path = _entry_path(cache_dir, fingerprint)
+    try:
+        with open(path, encoding='utf-8') as f:
+            entry = json.load(f)
+    except OSError:
+        return None
+    except ValueError:
+        _discard_entry(path)
+        return None
+
+    try:
+        if not isinstance(entry, dict) or entry.get('fingerprint') != fingerprint:
+            raise InvalidCacheEntry('unexpected entry')
+        modules: dict[str, list[Any] | None] = entry['modules']
+        if any(_module_stamp(name) != (tuple(stamp) if stamp is not None else None) for name, stamp in modules.items()):
+            return None
+
+        decoder = _SchemaDecoder(cls)
+        encoded_schema, encoded_simplified_schema = entry['schemas']
+        schema = decoder.decode(encoded_schema)
+        simplified_schema = decoder.decode(encoded_simplified_schema)
+        if not isinstance(schema, dict) or not isinstance(simplified_schema, dict):
+            raise InvalidCacheEntry('schemas must be dicts')
+
+        type_ids = {int(cls_id): id(decoder.resolve(*path)) for cls_id, path in entry['type_refs'].items()}
+        type_ids[entry['cls_id']] = id(cls)
+        # the two schemas may share definitions, which must only be updated once
+        seen: set[int] = set()
+        _replace_ref_ids(schema, type_ids, seen)
+        _replace_ref_ids(simplified_schema, type_ids, seen)
+    except (InvalidCacheEntry, LookupError, AttributeError, TypeError, ValueError, ArithmeticError, RecursionError):
+        # the entry is corrupt, or anything referenced by the schema may have been renamed or removed
+        _discard_entry(path)
+        return None
+    return schema, simplified_schema  # type: ignore[return-value]
+
+
+def store_schemas(
+    cls: type[BaseModel], cache_dir: str, fingerprint: str, schema: CoreSchema, simplified_schema: CoreSchema
+) -> bool:
+    """Store the core schema and simplified core schema of `cls` in the cache.
+
+    Returns `True` if the schemas were stored, or `False` if they hold anything which can't be stored.
+    """
+    encoder = _SchemaEncoder(cls)
+    try:
+        encoded_schemas = [encoder.encode(schema), encoder.encode(simplified_schema)]
+    except (InvalidCacheEntry, RecursionError):
+        return False
+
+    # refs include the `id()` of the types they refer to, so we need to be able to find those types again on load
+    type_refs: dict[str, tuple[str, str]] = {}
+    for ref_id in _collect_ref_ids(schema, set()):
+        if ref_id == id(cls):
+            continue
+        tp = encoder.types.get(ref_id)
+        if tp is None:
+            return False
+        type_refs[str(ref_id)] = (tp.__module__, tp.__qualname__)
+
+    entry = {
+        'fingerprint': fingerprint,
+        'modules': {name: _module_stamp(name) for name in encoder.modules},
+        'type_refs': type_refs,
+        'cls_id': id(cls),
+        'schemas': encoded_schemas,
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            json.dump(entry, tmp_file, separators=(',', ':'))
+        os.replace(tmp_path, _entry_path(cache_dir, fingerprint))
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+class InvalidCacheEntry(ValueError):
+    """Raised when a schema can't be stored in the cache, or a cache entry can't be loaded."""
+
+
+_TAG = '!'
+"""The key of the JSON objects which encode anything but a dict with string keys, e.g. `{"!": "tuple", "v": [1]}`."""
+_JSON_SCALARS = (str, int, float, bool, type(None))
+_STDLIB_TYPE_MODULES = {
+    'builtins',
+    'collections',
+    'collections.abc',
+    'datetime',
+    'decimal',
+    'enum',
+    'ipaddress',
+    'os',
+    'pathlib',
+    'typing',
+    'uuid',
+}
+
+
+def _allowed_reference(obj: Any, model_modules: set[str]) -> bool:
+    """Whether a class or function may be stored in, and loaded from, the cache entry of a model.
+
+    `model_modules` are the modules defining the model and its bases.
+    """
+    module = getattr(obj, '__module__', None)
+    qualname = getattr(obj, '__qualname__', None)
+    if not isinstance(module, str) or not isinstance(qualname, str) or '<locals>' in qualname:
+        return False
+    if module.partition('.')[0] in ('pydantic', 'pydantic_core') or module in model_modules:
+        return isinstance(obj, (type, FunctionType, BuiltinFunctionType))
+    if not isinstance(obj, type):
+        return False
+    if module in _STDLIB_TYPE_MODULES:
+        return not qualname.startswith('_')
+
+    from ..main import BaseModel
+
+    return issubclass(obj, (BaseModel, Enum)) or dataclasses.is_dataclass(obj)
+
+
+def _is_pydantic_dataclass(tp: type[Any]) -> bool:
+    """Whether `tp` is one of pydantic's own dataclasses, e.g. `DecimalValidator`."""
+    return dataclasses.is_dataclass(tp) and tp.__module__.partition('.')[0] == 'pydantic'
+
+
+class _SchemaEncoder:
+    """Encode core schemas as JSON values, recording the types and modules they refer to."""
+
+    def __init__(self, cls: type[BaseModel]) -> None:
+        self.cls = cls
+        self.model_modules = {base.__module__ for base in cls.__mro__}
+        self.types: dict[int, type[Any]] = {}
+        self.modules: set[str] = set()
+        # the position of each dict and list in the order they're encoded, so shared ones are only encoded once
+        self.memo: dict[int, int] = {}
+
+    def encode(self, obj: Any) -> Any:  # noqa: C901
+        obj_type = type(obj)
+        if obj_type in _JSON_SCALARS:
+            return obj
+        elif obj_type is dict or obj_type is list:
+            index = self.memo.get(id(obj))
+            if index is not None:
+                return {_TAG: 'memo', 'v': index}
+            self.memo[id(obj)] = len(self.memo)
+            if obj_type is list:
+                return [self.encode(v) for v in obj]
+            elif _TAG not in obj and all(type(k) is str for k in obj):
+                return {k: self.encode(v) for k, v in obj.items()}
+            else:
+                return {_TAG: 'dict', 'v': [[self.encode(k), self.encode(v)] for k, v in obj.items()]}
+        elif obj_type in (tuple, set, frozenset):
+            return {_TAG: obj_type.__name__, 'v': [self.encode(v) for v in obj]}
+        elif obj_type is bytes:
+            return {_TAG: 'bytes', 'v': obj.decode('latin-1')}
+        elif obj is self.cls:
+            return {_TAG: 'cls'}
+        elif isinstance(obj, (type, FunctionType, BuiltinFunctionType)):
+            return {_TAG: 'ref', 'v': self.encode_reference(obj)}
+        elif obj_type is MethodType:
+            name = obj.__func__.__name__
+            if getattr(obj.__self__, name, None) != obj:
+                raise InvalidCacheEntry(f'{obj!r} is not an attribute of the object it is bound to')
+            if not _allowed_reference(obj.__func__, self.model_modules):
+                raise InvalidCacheEntry(f'{obj!r} is not allowed')
+            self.modules.add(obj.__func__.__module__)
+            return {_TAG: 'method', 'v': [self.encode(obj.__self__), name]}
+        elif obj_type is partial:
+            keywords = {k: self.encode(v) for k, v in obj.keywords.items()}
+            return {_TAG: 'partial', 'v': [self.encode(obj.func), [self.encode(v) for v in obj.args], keywords]}
+        elif isinstance(obj, Enum):
+            return {_TAG: 'enum', 'v': [self.encode_reference(obj_type), obj.name]}
+        elif obj_type is decimal.Decimal or obj_type is uuid.UUID or obj_type is datetime.date:
+            return {_TAG: obj_type.__name__, 'v': str(obj)}
+        elif (obj_type is datetime.datetime or obj_type is datetime.time) and (
+            obj.tzinfo is None or type(obj.tzinfo) is datetime.timezone
+        ):
+            return {_TAG: obj_type.__name__, 'v': obj.isoformat()}
+        elif obj_type is datetime.timedelta:
+            return {_TAG: 'timedelta', 'v': [obj.days, obj.seconds, obj.microseconds]}
+        elif _is_pydantic_dataclass(obj_type):
+            fields = {f.name: self.encode(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+            return {_TAG: 'dataclass', 'v': [self.encode_reference(obj_type), fields]}
+        else:
+            raise InvalidCacheEntry(f'{obj_type.__qualname__} objects are not supported')
+
+    def encode_reference(self, obj: Any) -> list[str]:
+        if not _allowed_reference(obj, self.model_modules):
+            raise InvalidCacheEntry(f'{obj!r} is not allowed')
+        try:
+            found = _lookup(obj.__module__, obj.__qualname__)
+        except (LookupError, TypeError):
+            found = None
+        if found is not obj:
+            raise InvalidCacheEntry(f'{obj!r} cannot be found by its qualified name')
+        if isinstance(obj, type):
+            self.types[id(obj)] = obj
+        self.modules.add(obj.__module__)
+        return [obj.__module__, obj.__qualname__]
+
+
+class _SchemaDecoder:
+    """Decode core schemas encoded by `_SchemaEncoder`, without calling anything they refer to."""
+
+    def __init__(self, cls: type[BaseModel]) -> None:
+        self.cls = cls
+        self.model_modules = {base.__module__ for base in cls.__mro__}
+        self.memo: list[Any] = []
+
+    def decode(self, value: Any) -> Any:  # noqa: C901
+        value_type = type(value)
+        if value_type is list:
+            items: list[Any] = []
+            self.memo.append(items)
+            items.extend(self.decode(v) for v in value)
+            return items
+        elif value_type is not dict:
+            return value
+        elif _TAG not in value:
+            d: dict[str, Any] = {}
+            self.memo.append(d)
+            for k, v in value.items():
+                d[k] = self.decode(v)
+            return d
+
+        tag, v = value[_TAG], value.get('v')
+        if tag == 'memo':
+            return self.memo[v]
+        elif tag == 'dict':
+            d = {}
+            self.memo.append(d)
+            for key, item in v:
+                d[self.decode(key)] = self.decode(item)
+            return d
+        elif tag in ('tuple', 'set', 'frozenset'):
+            container = {'tuple': tuple, 'set': set, 'frozenset': frozenset}[tag]
+            return container(self.decode(item) for item in v)
+        elif tag == 'bytes':
+            return v.encode('latin-1')
+        elif tag == 'cls':
+            return self.cls
+        elif tag == 'ref':
+            return self.resolve(*v)
+        elif tag == 'method':
+            obj, name = self.decode(v[0]), v[1]
+            method = getattr(obj, name)
+            if type(method) is not MethodType or not _allowed_reference(method.__func__, self.model_modules):
+                raise InvalidCacheEntry(f'{name!r} is not an allowed method')
+            return method
+        elif tag == 'partial':
+            func, args, keywords = v
+            return partial(
+                self.decode(func), *(self.decode(a) for a in args), **{k: self.decode(a) for k, a in keywords.items()}
+            )
+        elif tag == 'enum':
+            enum_type = self.resolve(*v[0])
+            if not isinstance(enum_type, type) or not issubclass(enum_type, Enum):
+                raise InvalidCacheEntry(f'{enum_type!r} is not an enum')
+            return enum_type.__members__[v[1]]
+        elif tag == 'Decimal':
+            return decimal.Decimal(v)
+        elif tag == 'UUID':
+            return uuid.UUID(v)
+        elif tag in ('date', 'datetime', 'time'):
+            return getattr(datetime, tag).fromisoformat(v)
+        elif tag == 'timedelta':
+            return datetime.timedelta(*v)
+        elif tag == 'dataclass':
+            dataclass_type, fields = self.resolve(*v[0]), v[1]
+            if not isinstance(dataclass_type, type) or not _is_pydantic_dataclass(dataclass_type):
+                raise InvalidCacheEntry(f"{dataclass_type!r} is not one of pydantic's dataclasses")
+            if set(fields) != {f.name for f in dataclasses.fields(dataclass_type)}:
+                raise InvalidCacheEntry(f'unexpected fields for {dataclass_type!r}')
+            # restored without calling `__init__`, so nothing runs while loading the entry
+            obj = object.__new__(dataclass_type)
+            for name, field_value in fields.items():
+                object.__setattr__(obj, name, self.decode(field_value))
+            return obj
+        else:
+            raise InvalidCacheEntry(f'unknown tag {tag!r}')
+
+    def resolve(self, module_name: str, qualname: str) -> Any:
+        """Look up a class or function referenced by the entry, checking that it's allowed."""
+        obj = _lookup(module_name, qualname)
+        if (
+            getattr(obj, '__module__', None) != module_name
+            or getattr(obj, '__qualname__', None) != qualname
+            or not _allowed_reference(obj, self.model_modules)
+        ):
+            raise InvalidCacheEntry(f'{module_name}.{qualname} is not allowed')
+        return obj
+
+
+def _lookup(module_name: str, qualname: str) -> Any:
+    """Look up a class or function in an imported module, without running any code of the module."""
+    obj: Any = sys.modules[module_name]
+    for name in qualname.split('.'):
+        obj = vars(obj)[name]
+        if isinstance(obj, staticmethod):
+            obj = obj.__func__
+    return obj
+
+
+def _entry_path(cache_dir: str, fingerprint: str) -> str:
+    return os.path.join(os.fspath(cache_dir), f'{fingerprint}.json')
+
+
+def _discard_entry(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _module_stamp(module_name: str) -> ModuleStamp | None:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        path = getattr(module, '__file__', None)
+    else:
+        try:
+            spec = find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        path = spec.origin if spec is not None else None
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _iter_refs(schema: Any, seen: set[int]) -> Any:
+    """Yield every dict in `schema` which holds a `ref` or `schema_ref`, visiting shared sub-schemas once."""
+    if id(schema) in seen:
+        return
+    seen.add(id(schema))
+    if isinstance(schema, dict):
+        if 'ref' in schema or 'schema_ref' in schema:
+            yield schema
+        for value in schema.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_refs(value, seen)
+    elif isinstance(schema, list):
+        for value in schema:
+            if isinstance(value, (dict, list)):
+                yield from _iter_refs(value, seen)
+
+
+def _collect_ref_ids(schema: CoreSchema, seen: set[int]) -> set[int]:
+    ref_ids: set[int] = set()
+    for d in _iter_refs(schema, seen):
+        for key in ('ref', 'schema_ref'):
+            ref = d.get(key)
+            if isinstance(ref, str):
+                for str_marker, ref_id in _REF_ID_RE.findall(ref):
+                    # string literal ids can't be reconstructed, -1 never matches a type so the store is refused
+                    ref_ids.add(-1 if str_marker else int(ref_id))
+    return ref_ids
+
+
+def _replace_ref_ids(schema: CoreSchema, type_ids: dict[int, int], seen: set[int]) -> None:
+    def replace(match: re.Match[str]) -> str:
+        return f':{type_ids[int(match.group(2))]}'
+
+    for d in _iter_refs(schema, seen):
+        for key in ('ref', 'schema_ref'):
+            ref = d.get(key)
+            if isinstance(ref, str):
+                d[key] = _REF_ID_RE.sub(replace, ref)  # type: ignore[literal-required]
@@ -0,0 +1,118 @@
+"""Process-wide memo of the core schemas generated for annotations, so repeated field types like `list[int]` or
+`Annotated[str, Field(max_length=64)]` are only generated once.
+
+Only schemas which depend on nothing but the annotation itself and the config are memoized: annotations which
+contain forward references or type variables are never memoized, nor are schemas which refer to definitions (e.g. of
+models or dataclasses), since those depend on the state of the `GenerateSchema` instance which produced them.
+"""
+from __future__ import annotations as _annotations
+
+import typing
+from typing import Any, Hashable
+
+from pydantic_core import CoreSchema
+from typing_extensions import get_args
+
+from . import _typing_extra
+from ._config import ConfigWrapper
+from ._forward_ref import PydanticRecursiveRef
+from ._utils import LRUCache
+
+DEFAULT_MAX_SIZE = 1000
+"""The maximum number of schemas memoized, the least recently used schema is discarded when it's reached."""
+
+
+class SchemaMemo:
+    """A bounded, least recently used memo of core schemas.
+
+    Schemas are copied when they're stored and when they're retrieved, since schema generation modifies schemas in
+    place, e.g. to add JSON schema functions to their metadata.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._schemas: LRUCache[CoreSchema] = LRUCache(max_size)
+
+    @property
+    def max_size(self) -> int:
+        return self._schemas.max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        self._schemas.max_size = max_size
+
+    def get(self, key: Hashable) -> CoreSchema | None:
+        schema = self._schemas.get(key)
+        return None if schema is None else copy_schema(schema)
+
+    def set(self, key: Hashable, schema: CoreSchema) -> None:
+        self._schemas.set(key, copy_schema(schema))
+
+    def clear(self) -> None:
+        self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+schema_memo = SchemaMemo()
+
+
+def memo_key(config_wrapper: ConfigWrapper, source_type: Any, *args: Hashable) -> Hashable | None:
+    """Build the memo key of the schema generated for `source_type`, or `None` if it can't be memoized.
+
+    Args:
+        config_wrapper: The config the schema is generated with, any difference in config gives a different key.
+        source_type: The annotation the schema is generated for.
+        *args: Anything else the generated schema depends on, e.g. the metadata of a field.
+    """
+    try:
+        key = (
+            _type_key(source_type),
+            tuple(_value_key(arg) for arg in args),
+            tuple(sorted(config_wrapper.config_dict.items())),
+        )
+        hash(key)
+    except (_NotMemoizable, TypeError):
+        return None
+    return key
+
+
+class _NotMemoizable(Exception):
+    pass
+
+
+def _type_key(tp: Any) -> Hashable:
+    """Build a key for `tp` which, unlike `tp` itself, is sensitive to the order of `Union` and `Literal` arguments
+    and to the types of `Literal` values.
+
+    Raises:
+        _NotMemoizable: If `tp` refers to anything which can't be resolved from `tp` itself.
+    """
+    if isinstance(tp, (str, typing.ForwardRef, typing.TypeVar, PydanticRecursiveRef)):
+        raise _NotMemoizable
+    args = get_args(tp)
+    if not args:
+        return tp
+    if _typing_extra.is_literal_type(tp):
+        return tp, tuple(_value_key(arg) for arg in args)
+    if _typing_extra.is_annotated(tp):
+        return tp, _type_key(args[0]), tuple(_value_key(arg) for arg in args[1:])
+    # e.g. the parameters of `Callable[[int, str], None]` are a list
+    return tp, tuple(tuple(map(_type_key, arg)) if isinstance(arg, list) else _type_key(arg) for arg in args)
+
+
+def _value_key(value: Any) -> Hashable:
+    if isinstance(value, tuple):
+        return tuple(map(_value_key, value))
+    # `1`, `1.0` and `True` are all equal, but can produce different schemas
+    return type(value), value
+
+
+def copy_schema(schema: Any) -> Any:
+    """Copy the dicts and lists which make up a schema, other values (e.g. defaults and functions) are shared."""
+    if isinstance(schema, dict):
+        return {k: v if k == 'default' else copy_schema(v) for k, v in schema.items()}
+    elif isinstance(schema, list):
+        return [copy_schema(v) for v in schema]
+    else:
+        return schema
@@ -10,7 +10,7 @@ import decimal
 import inspect
 import os
 import typing
-from enum import Enum
+from enum import Enum, Flag
 from functools import partial
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from typing import Any, Callable, Iterable, TypeVar
@@ -20,7 +20,6 @@ from pydantic_core import (
     MultiHostUrl,
     PydanticCustomError,
     PydanticKnownError,
-    PydanticOmit,
     Url,
     core_schema,
 )
@@ -104,14 +103,24 @@ def enum_prepare_pydantic_annotations(
         update_json_schema(original_schema, updates)
         return json_schema
 
-    to_enum_validator = core_schema.no_info_plain_validator_function(to_enum)
+    if _members_lookup_applies(enum_type, cases):
+        # the members compare equal to their values, so a literal schema of the members looks the values up in
+        # pydantic-core and returns the matching member, without calling `to_enum` for each value
+        to_enum_validator = core_schema.custom_error_schema(
+            core_schema.literal_schema(cases),
+            custom_error_type='enum',
+            custom_error_message=f'Input should be {expected}',
+            custom_error_context={'expected': expected},
+        )
+    else:
+        to_enum_validator = core_schema.no_info_plain_validator_function(to_enum)
     if issubclass(enum_type, int):
         # this handles `IntEnum`, and also `Foobar(int, Enum)`
         updates['type'] = 'integer'
         lax = core_schema.chain_schema([core_schema.int_schema(), to_enum_validator])
         # Disallow float from JSON due to strict mode
         strict = core_schema.json_or_python_schema(
-            json_schema=core_schema.no_info_after_validator_function(to_enum, core_schema.int_schema()),
+            json_schema=core_schema.chain_schema([core_schema.int_schema(), to_enum_validator]),
             python_schema=core_schema.is_instance_schema(enum_type),
         )
     elif issubclass(enum_type, str):
@@ -119,14 +128,14 @@ def enum_prepare_pydantic_annotations(
         updates['type'] = 'string'
         lax = core_schema.chain_schema([core_schema.str_schema(), to_enum_validator])
         strict = core_schema.json_or_python_schema(
-            json_schema=core_schema.no_info_after_validator_function(to_enum, core_schema.str_schema()),
+            json_schema=core_schema.chain_schema([core_schema.str_schema(), to_enum_validator]),
             python_schema=core_schema.is_instance_schema(enum_type),
         )
     elif issubclass(enum_type, float):
         updates['type'] = 'numeric'
         lax = core_schema.chain_schema([core_schema.float_schema(), to_enum_validator])
         strict = core_schema.json_or_python_schema(
-            json_schema=core_schema.no_info_after_validator_function(to_enum, core_schema.float_schema()),
+            json_schema=core_schema.chain_schema([core_schema.float_schema(), to_enum_validator]),
             python_schema=core_schema.is_instance_schema(enum_type),
         )
     else:
@@ -146,6 +155,19 @@ def enum_prepare_pydantic_annotations(
     ]
 
 
+def _members_lookup_applies(enum_type: type[Enum], cases: list[Any]) -> bool:
+    """Whether calling `enum_type(value)` on an `int`, `str` or `float` value is the same as finding the member equal
+    to `value`, i.e. the enum has one of those mixins, no `_missing_` hook and no composite flag members.
+    """
+    mixin = next((t for t in (int, str, float) if issubclass(enum_type, t)), None)
+    return (
+        mixin is not None
+        and not issubclass(enum_type, Flag)
+        and enum_type._missing_.__func__ is Enum._missing_.__func__  # type: ignore[attr-defined]
+        and all(isinstance(case.value, mixin) and not isinstance(case.value, bool) for case in cases)
+    )
+
+
 @slots_dataclass
 class DecimalValidator:
     gt: int | decimal.Decimal | None = None
@@ -218,61 +240,60 @@ class DecimalValidator:
             value = __input_value
         else:
             try:
-                value = decimal.Decimal(str(__input_value))
+                # floats go through `str` so e.g. 0.1 gives Decimal('0.1') rather than its exact binary value
+                value = decimal.Decimal(str(__input_value) if isinstance(__input_value, float) else __input_value)
             except decimal.DecimalException:
                 raise PydanticCustomError('decimal_parsing', 'Input should be a valid decimal')
 
-        if not self.allow_inf_nan or self.check_digits:
+        if self.check_digits:
             try:
                 normalized_value = value.normalize()
             except decimal.InvalidOperation:
                 normalized_value = value
             _1, digit_tuple, exponent = normalized_value.as_tuple()
-            if not self.allow_inf_nan and exponent in {'F', 'n', 'N'}:
+            if isinstance(exponent, str):
                 raise PydanticKnownError('finite_number')
-
-            if self.check_digits:
-                if isinstance(exponent, str):
-                    raise PydanticKnownError('finite_number')
-                elif exponent >= 0:
-                    # A positive exponent adds that many trailing zeros.
-                    digits = len(digit_tuple) + exponent
-                    decimals = 0
+            elif exponent >= 0:
+                # A positive exponent adds that many trailing zeros.
+                digits = len(digit_tuple) + exponent
+                decimals = 0
+            else:
+                # If the absolute value of the negative exponent is larger than the
+                # number of digits, then it's the same as the number of digits,
+                # because it'll consume all the digits in digit_tuple and then
+                # add abs(exponent) - len(digit_tuple) leading zeros after the
+                # decimal point.
+                if abs(exponent) > len(digit_tuple):
+                    digits = decimals = abs(exponent)
                 else:
-                    # If the absolute value of the negative exponent is larger than the
-                    # number of digits, then it's the same as the number of digits,
-                    # because it'll consume all the digits in digit_tuple and then
-                    # add abs(exponent) - len(digit_tuple) leading zeros after the
-                    # decimal point.
-                    if abs(exponent) > len(digit_tuple):
-                        digits = decimals = abs(exponent)
-                    else:
-                        digits = len(digit_tuple)
-                        decimals = abs(exponent)
-
-                if self.max_digits is not None and digits > self.max_digits:
-                    raise PydanticCustomError(
-                        'decimal_max_digits',
-                        'ensure that there are no more than {max_digits} digits in total',
-                        {'max_digits': self.max_digits},
-                    )
+                    digits = len(digit_tuple)
+                    decimals = abs(exponent)
 
-                if self.decimal_places is not None and decimals > self.decimal_places:
+            if self.max_digits is not None and digits > self.max_digits:
+                raise PydanticCustomError(
+                    'decimal_max_digits',
+                    'ensure that there are no more than {max_digits} digits in total',
+                    {'max_digits': self.max_digits},
+                )
+
+            if self.decimal_places is not None and decimals > self.decimal_places:
+                raise PydanticCustomError(
+                    'decimal_max_places',
+                    'ensure that there are no more than {decimal_places} decimal places',
+                    {'decimal_places': self.decimal_places},
+                )
+
+            if self.max_digits is not None and self.decimal_places is not None:
+                whole_digits = digits - decimals
+                expected = self.max_digits - self.decimal_places
+                if whole_digits > expected:
                     raise PydanticCustomError(
-                        'decimal_max_places',
-                        'ensure that there are no more than {decimal_places} decimal places',
-                        {'decimal_places': self.decimal_places},
+                        'decimal_whole_digits',
+                        'ensure that there are no more than {whole_digits} digits before the decimal point',
+                        {'whole_digits': expected},
                     )
-
-                if self.max_digits is not None and self.decimal_places is not None:
-                    whole_digits = digits - decimals
-                    expected = self.max_digits - self.decimal_places
-                    if whole_digits > expected:
-                        raise PydanticCustomError(
-                            'decimal_whole_digits',
-                            'ensure that there are no more than {whole_digits} digits before the decimal point',
-                            {'whole_digits': expected},
-                        )
+        elif not self.allow_inf_nan and not value.is_finite():
+            raise PydanticKnownError('finite_number')
 
         if self.multiple_of is not None:
             mod = value / self.multiple_of % 1
@@ -371,18 +392,22 @@ def uuid_prepare_pydantic_annotations(
 
     from uuid import UUID
 
+    from ..types import UuidVersion
+
     if source_type is not UUID:
         return None
 
+    annotations = list(annotations)
+
     def uuid_validator(input_value: str | bytes | UUID) -> UUID:
         if isinstance(input_value, UUID):
             return input_value
         try:
             if isinstance(input_value, str):
-                return UUID(input_value)
+                return _validators.parse_uuid(input_value)
             else:
                 try:
-                    return UUID(input_value.decode())
+                    return _validators.parse_uuid(input_value.decode())
                 except ValueError:
                     # 16 bytes in big-endian order as the bytes argument fail
                     # the above check
@@ -411,10 +436,34 @@ def uuid_prepare_pydantic_annotations(
         serialization=core_schema.to_string_ser_schema(),
     )
 
+    # a single `UuidVersion` is checked by a plain after validator rather than by `UuidVersion.validate`
+    versions = [a for a in annotations if isinstance(a, UuidVersion)]
+    uuid_version = versions[0].uuid_version if len(versions) == 1 else None
+    if uuid_version is None:
+        js_schema_update = {'format': 'uuid'}
+    else:
+        annotations = [a for a in annotations if not isinstance(a, UuidVersion)]
+        js_schema_update = {'format': f'uuid{uuid_version}'}
+
+        # `value.version == uuid_version` checked on `value.int`: the RFC 4122 variant bits, then the version bits
+        version_mask = (0xC000 << 48) | (0xF << 76)
+        version_bits = (0x8000 << 48) | (uuid_version << 76)
+
+        def uuid_version_validator(value: UUID) -> UUID:
+            if value.int & version_mask != version_bits:
+                raise PydanticCustomError(
+                    'uuid_version', 'uuid version {required_version} expected', {'required_version': uuid_version}
+                )
+            return value
+
+        schema = core_schema.no_info_after_validator_function(
+            uuid_version_validator, schema, serialization=core_schema.to_string_ser_schema()
+        )
+
     return (
         source_type,
         [
-            InnerSchemaValidator(schema, js_core_schema=core_schema.str_schema(), js_schema_update={'format': 'uuid'}),
+            InnerSchemaValidator(schema, js_core_schema=core_schema.str_schema(), js_schema_update=js_schema_update),
             *annotations,
         ],
     )
@@ -499,15 +548,8 @@ class SequenceValidator:
     def serialize_sequence_via_list(
         self, v: Any, handler: core_schema.SerializerFunctionWrapHandler, info: core_schema.SerializationInfo
     ) -> Any:
-        items: list[Any] = []
-        for index, item in enumerate(v):
-            try:
-                v = handler(item, index)
-            except PydanticOmit:
-                pass
-            else:
-                items.append(v)
-
+        # pydantic-core serializes the items, as a list
+        items = handler(list(v))
         if info.mode_is_json():
             return items
         else:
@@ -539,30 +581,41 @@ class SequenceValidator:
                 # if we have a MaxLen annotation might as well set that as the default maxlen on the deque
                 # this lets us re-use existing metadata annotations to let users set the maxlen on a dequeue
                 # that e.g. comes from JSON
-                coerce_instance_wrap = partial(
-                    core_schema.no_info_wrap_validator_function,
-                    partial(dequeue_validator, maxlen=metadata.get('max_length', None)),
+                maxlen = metadata.get('max_length', None)
+                # JSON input is never a deque, so the deque is built by calling `collections.deque` directly
+                construct_from_json: Callable[[Any], Any] = partial(collections.deque, maxlen=maxlen)
+                coerce_python_instance_wrap = partial(
+                    core_schema.no_info_wrap_validator_function, partial(dequeue_validator, maxlen=maxlen)
                 )
             else:
-                coerce_instance_wrap = partial(core_schema.no_info_after_validator_function, self.mapped_origin)
+                construct_from_json = self.mapped_origin
+                coerce_python_instance_wrap = partial(core_schema.no_info_after_validator_function, self.mapped_origin)
 
             constrained_schema = core_schema.list_schema(items_schema, **metadata)
-
-            check_instance = core_schema.json_or_python_schema(
-                json_schema=core_schema.list_schema(),
-                python_schema=core_schema.is_instance_schema(self.mapped_origin),
-            )
+            from_json = core_schema.no_info_after_validator_function(construct_from_json, constrained_schema)
 
             serialization = core_schema.wrap_serializer_function_ser_schema(
-                self.serialize_sequence_via_list, schema=items_schema or core_schema.any_schema(), info_arg=True
+                self.serialize_sequence_via_list,
+                schema=core_schema.list_schema(items_schema),
+                info_arg=True,
             )
 
-            strict = core_schema.chain_schema([check_instance, coerce_instance_wrap(constrained_schema)])
+            strict = core_schema.json_or_python_schema(
+                json_schema=from_json,
+                python_schema=core_schema.chain_schema(
+                    [
+                        core_schema.is_instance_schema(self.mapped_origin),
+                        coerce_python_instance_wrap(constrained_schema),
+                    ]
+                ),
+            )
 
             if metadata.get('strict', False):
                 schema = strict
             else:
-                lax = coerce_instance_wrap(constrained_schema)
+                lax = core_schema.json_or_python_schema(
+                    json_schema=from_json, python_schema=coerce_python_instance_wrap(constrained_schema)
+                )
                 schema = core_schema.lax_or_strict_schema(lax_schema=lax, strict_schema=strict)
             schema['serialization'] = serialization
 
@@ -710,9 +763,6 @@ class MappingValidator:
     max_length: int | None = None
     strict: bool = False
 
-    def serialize_mapping_via_dict(self, v: Any, handler: core_schema.SerializerFunctionWrapHandler) -> Any:
-        return handler(v)
-
     def __get_pydantic_core_schema__(self, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
         if self.keys_source_type is Any:
             keys_schema = None
@@ -729,36 +779,38 @@ class MappingValidator:
             schema = core_schema.dict_schema(keys_schema, values_schema, **metadata)
         else:
             constrained_schema = core_schema.dict_schema(keys_schema, values_schema, **metadata)
-            check_instance = core_schema.json_or_python_schema(
-                json_schema=core_schema.dict_schema(),
-                python_schema=core_schema.is_instance_schema(self.mapped_origin),
-            )
 
             if self.mapped_origin is collections.defaultdict:
                 default_default_factory = get_defaultdict_default_default_factory(self.values_source_type)
-                coerce_instance_wrap = partial(
+                # JSON input is never a defaultdict, so it's built by calling `collections.defaultdict` directly
+                construct_from_json: Callable[[Any], Any] = partial(collections.defaultdict, default_default_factory)
+                coerce_python_instance_wrap = partial(
                     core_schema.no_info_wrap_validator_function,
                     partial(defaultdict_validator, default_default_factory=default_default_factory),
                 )
             else:
-                coerce_instance_wrap = partial(core_schema.no_info_after_validator_function, self.mapped_origin)
-
-            serialization = core_schema.wrap_serializer_function_ser_schema(
-                self.serialize_mapping_via_dict,
-                schema=core_schema.dict_schema(
-                    keys_schema or core_schema.any_schema(), values_schema or core_schema.any_schema()
+                construct_from_json = self.mapped_origin
+                coerce_python_instance_wrap = partial(core_schema.no_info_after_validator_function, self.mapped_origin)
+
+            from_json = core_schema.no_info_after_validator_function(construct_from_json, constrained_schema)
+            strict = core_schema.json_or_python_schema(
+                json_schema=from_json,
+                python_schema=core_schema.chain_schema(
+                    [
+                        core_schema.is_instance_schema(self.mapped_origin),
+                        coerce_python_instance_wrap(constrained_schema),
+                    ]
                 ),
-                info_arg=False,
             )
 
-            strict = core_schema.chain_schema([check_instance, coerce_instance_wrap(constrained_schema)])
-
+            # mapped origins are `dict` subclasses, which are serialized by the dict schema, with no Python call
             if metadata.get('strict', False):
                 schema = strict
             else:
-                lax = coerce_instance_wrap(constrained_schema)
+                lax = core_schema.json_or_python_schema(
+                    json_schema=from_json, python_schema=coerce_python_instance_wrap(constrained_schema)
+                )
                 schema = core_schema.lax_or_strict_schema(lax_schema=lax, strict_schema=strict)
-                schema['serialization'] = serialization
 
         return schema
 
@@ -5,10 +5,11 @@ import dataclasses
 import sys
 import types
 import typing
+from collections import ChainMap
 from collections.abc import Callable
 from functools import partial
 from types import GetSetDescriptorType
-from typing import TYPE_CHECKING, Any, ForwardRef
+from typing import TYPE_CHECKING, Any, ForwardRef, Mapping
 
 from typing_extensions import Annotated, Final, Literal, TypeAliasType, TypeGuard, get_args, get_origin
 
@@ -213,13 +214,41 @@ def get_cls_type_hints_lenient(obj: Any, globalns: dict[str, Any] | None = None)
     return hints
 
 
-def eval_type_lenient(value: Any, globalns: dict[str, Any] | None, localns: dict[str, Any] | None) -> Any:
+def layered_namespace(
+    local_ns: Mapping[str, Any] | None, global_ns: dict[str, Any]
+) -> dict[str, Any] | ChainMap[str, Any]:
+    """Build a namespace which looks up names in `local_ns`, then in `global_ns`, without copying either.
+
+    The result can be used as the `globalns` of `eval_type_lenient` and `evaluate_fwd_ref`, which resolve names in
+    it exactly as they would in `{**global_ns, **local_ns}`.
+    """
+    if not local_ns:
+        return global_ns
+    return ChainMap(local_ns, global_ns)  # type: ignore[arg-type]
+
+
+def _split_namespace(
+    globalns: Mapping[str, Any] | None, localns: Mapping[str, Any] | None
+) -> tuple[dict[str, Any] | None, Mapping[str, Any] | None]:
+    """Get the globals and locals to `eval` annotations with from a namespace built by `layered_namespace`.
+
+    `eval` only accepts a `dict` as globals, so the module globals at the bottom of the chain are used as globals and
+    the whole chain, below `localns`, as locals.
+    """
+    if isinstance(globalns, ChainMap):
+        localns = globalns if localns is None else globalns.new_child(localns)  # type: ignore[arg-type]
+        globalns = globalns.maps[-1]
+    return globalns, localns  # type: ignore[return-value]
+
+
+def eval_type_lenient(value: Any, globalns: Mapping[str, Any] | None, localns: Mapping[str, Any] | None) -> Any:
     """Behaves like typing._eval_type, except it won't raise an error if a forward reference can't be resolved."""
     if value is None:
         value = NoneType
     elif isinstance(value, str):
         value = _make_forward_ref(value, is_argument=False, is_class=True)
 
+    globalns, localns = _split_namespace(globalns, localns)
     try:
         return typing._eval_type(value, globalns, localns)  # type: ignore
     except NameError:
@@ -407,15 +436,17 @@ else:
 if sys.version_info < (3, 9):
 
     def evaluate_fwd_ref(
-        ref: ForwardRef, globalns: dict[str, Any] | None = None, localns: dict[str, Any] | None = None
+        ref: ForwardRef, globalns: Mapping[str, Any] | None = None, localns: Mapping[str, Any] | None = None
     ) -> Any:
+        globalns, localns = _split_namespace(globalns, localns)
         return ref._evaluate(globalns=globalns, localns=localns)
 
 else:
 
     def evaluate_fwd_ref(
-        ref: ForwardRef, globalns: dict[str, Any] | None = None, localns: dict[str, Any] | None = None
+        ref: ForwardRef, globalns: Mapping[str, Any] | None = None, localns: Mapping[str, Any] | None = None
     ) -> Any:
+        globalns, localns = _split_namespace(globalns, localns)
         return ref._evaluate(globalns=globalns, localns=localns, recursive_guard=frozenset())
 
 
@@ -10,8 +10,9 @@ import weakref
 from collections import OrderedDict, defaultdict, deque
 from copy import deepcopy
 from itertools import zip_longest
+from threading import Lock
 from types import BuiltinFunctionType, CodeType, FunctionType, GeneratorType, LambdaType, ModuleType
-from typing import Any, TypeVar
+from typing import Any, Generic, Hashable, TypeVar
 
 from typing_extensions import TypeAlias, TypeGuard
 
@@ -342,3 +343,64 @@ def all_identical(left: typing.Iterable[Any], right: typing.Iterable[Any]) -> bo
         if left_item is not right_item:
             return False
     return True
+
+
+ValueType = TypeVar('ValueType')
+
+
+class LRUCache(Generic[ValueType]):
+    """A thread safe mapping of at most `max_size` items, the least recently used item is discarded when it's full.
+
+    Attributes:
+        hits: The number of `get` calls which found an item.
+        misses: The number of `get` calls which didn't find an item.
+        evictions: The number of items discarded to keep the cache within `max_size`.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._data: OrderedDict[Hashable, ValueType] = OrderedDict()
+        self._lock = Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError(f'max_size must not be negative, got {max_size}')
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def get(self, key: Hashable) -> ValueType | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: ValueType) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self) -> None:
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
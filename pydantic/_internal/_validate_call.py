@@ -3,14 +3,18 @@ from __future__ import annotations as _annotations
 import inspect
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import pydantic_core
+from pydantic_core import core_schema
 
 from ..config import ConfigDict
 from . import _generate_schema, _typing_extra
 from ._config import ConfigWrapper
-from ._core_utils import flatten_schema_defs, inline_schema_defs
+from ._core_utils import inline_schema_defs
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
 
 
 @dataclass
@@ -19,6 +23,19 @@ class CallMarker:
     validate_return: bool
 
 
+@dataclass
+class BoundValidators:
+    """Validators for a bound function, shared by every binding of the same `ValidateCallWrapper`.
+
+    The call schema embeds the function it calls, so it can't be reused across bindings; instead the arguments
+    and return schemas are split out into separate validators which don't depend on the bound object.
+    """
+
+    arguments_schema: CoreSchema
+    arguments_validator: pydantic_core.SchemaValidator
+    return_validator: pydantic_core.SchemaValidator | None
+
+
 class ValidateCallWrapper:
     """This is a wrapper around a function that validates the arguments passed to it, and optionally the return value.
 
@@ -32,6 +49,7 @@ class ValidateCallWrapper:
         '_validate_return',
         '__pydantic_core_schema__',
         '__pydantic_validator__',
+        '_bound_validators',
         '__signature__',
         '__name__',
         '__qualname__',
@@ -58,22 +76,91 @@ class ValidateCallWrapper:
             self.__module__ = function.__module__
             self.__doc__ = function.__doc__
 
-        namespace = _typing_extra.add_module_globals(function, None)
-        config_wrapper = ConfigWrapper(config)
-        gen_schema = _generate_schema.GenerateSchema(config_wrapper, namespace)
-        self.__pydantic_core_schema__ = schema = gen_schema.generate_schema(function)
-        core_config = config_wrapper.core_config(self)
-        schema = flatten_schema_defs(schema)
-        simplified_schema = inline_schema_defs(schema)
+        self._bound_validators: BoundValidators | None = None
+        self.__pydantic_core_schema__, simplified_schema = _generate_call_schema(function, config)
+        core_config = ConfigWrapper(config).core_config(self)
         self.__pydantic_validator__ = pydantic_core.SchemaValidator(simplified_schema, core_config)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.__pydantic_validator__.validate_python(pydantic_core.ArgsKwargs(args, kwargs))
 
     def __get__(self, obj: Any, objtype: type[Any] | None = None) -> ValidateCallWrapper:
-        """Bind the raw function and return another ValidateCallWrapper wrapping that."""
+        """Bind the raw function and return a `BoundValidateCallWrapper` wrapping that.
+
+        The validators for the bound signature are built on first access from an instance and cached on this
+        wrapper, so subsequent bindings only swap the bound object rather than regenerating the schema.
+        """
+        if obj is None:
+            return self
         bound_function = self.raw_function.__get__(obj, objtype)
-        return self.__class__(bound_function, self._config, self._validate_return)
+        if self._bound_validators is None:
+            self._bound_validators = _build_bound_validators(bound_function, self._config)
+        return BoundValidateCallWrapper(self, bound_function)
 
     def __repr__(self) -> str:
         return f'ValidateCallWrapper({self.raw_function})'
+
+
+class BoundValidateCallWrapper(ValidateCallWrapper):
+    """A `ValidateCallWrapper` bound to an instance or class, reusing the validators cached on the unbound wrapper."""
+
+    __slots__ = ('_return_validator',)
+
+    def __init__(self, wrapper: ValidateCallWrapper, bound_function: Callable[..., Any]):
+        bound_validators = wrapper._bound_validators
+        assert bound_validators is not None
+        self.raw_function = bound_function
+        self._config = wrapper._config
+        self._validate_return = wrapper._validate_return
+        self._bound_validators = bound_validators
+        self.__pydantic_core_schema__ = bound_validators.arguments_schema
+        self.__pydantic_validator__ = bound_validators.arguments_validator
+        self._return_validator = bound_validators.return_validator
+        self.__signature__ = inspect.signature(bound_function)
+        self.__name__ = wrapper.__name__
+        self.__qualname__ = wrapper.__qualname__
+        self.__annotations__ = wrapper.__annotations__
+        self.__module__ = wrapper.__module__
+        self.__doc__ = wrapper.__doc__
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        args, kwargs = self.__pydantic_validator__.validate_python(pydantic_core.ArgsKwargs(args, kwargs))
+        result = self.raw_function(*args, **kwargs)
+        if self._return_validator is not None:
+            return self._return_validator.validate_python(result)
+        return result
+
+    def __get__(self, obj: Any, objtype: type[Any] | None = None) -> ValidateCallWrapper:
+        return self
+
+
+def _generate_call_schema(function: Callable[..., Any], config: ConfigDict | None) -> tuple[CoreSchema, CoreSchema]:
+    """Generate the call schema for `function`, returning both the raw schema and the simplified one."""
+    namespace = _typing_extra.add_module_globals(function, None)
+    gen_schema = _generate_schema.GenerateSchema(ConfigWrapper(config), namespace)
+    schema = gen_schema.generate_schema(function)
+    return schema, inline_schema_defs(schema)
+
+
+def _build_bound_validators(bound_function: Callable[..., Any], config: ConfigDict | None) -> BoundValidators:
+    _, schema = _generate_call_schema(bound_function, config)
+    arguments_schema, return_schema = _split_call_schema(schema)
+    core_config = ConfigWrapper(config).core_config(bound_function)
+    return BoundValidators(
+        arguments_schema,
+        pydantic_core.SchemaValidator(arguments_schema, core_config),
+        None if return_schema is None else pydantic_core.SchemaValidator(return_schema, core_config),
+    )
+
+
+def _split_call_schema(schema: CoreSchema) -> tuple[CoreSchema, CoreSchema | None]:
+    """Split a call schema, possibly wrapped in a definitions schema, into its arguments and return schemas."""
+    if schema['type'] == 'definitions':
+        arguments_schema, return_schema = _split_call_schema(schema['schema'])
+        definitions = schema['definitions']
+        return (
+            core_schema.definitions_schema(arguments_schema, definitions),
+            None if return_schema is None else core_schema.definitions_schema(return_schema, definitions),
+        )
+    assert schema['type'] == 'call', schema['type']
+    return schema['arguments_schema'], schema.get('return_schema')
@@ -0,0 +1,97 @@
+"""Validation of many inputs against the same schema in one call, used by `BaseModel.model_validate_many` and
+`TypeAdapter.validate_many`.
+"""
+
+from __future__ import annotations as _annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, Iterable, List, TypeVar
+
+from pydantic_core import CoreConfig, CoreSchema, ErrorDetails, SchemaValidator, ValidationError, core_schema
+
+from ..plugin import _plug_validator
+from ._core_utils import inline_schema_defs
+from ._mock_val_ser import MockValidator
+
+if TYPE_CHECKING:
+    from ..main import BaseModel
+
+T = TypeVar('T')
+
+
+@dataclass
+class ValidateManyResult(Generic[T]):
+    """The result of validating many inputs with `continue_on_error=True`.
+
+    Attributes:
+        values: The validated value of each valid input, by the index of the input.
+        errors: The errors of each invalid input, by the index of the input.
+    """
+
+    values: dict[int, T]
+    errors: dict[int, list[ErrorDetails]]
+
+
+def build_list_validator(schema: CoreSchema, core_config: CoreConfig | None, item_type: Any) -> SchemaValidator:
+    """Build a validator of lists of `item_type` values matching `schema`, a flattened core schema.
+
+    Like other validators, it's observed by the plugins installed when it's built, as `List[item_type]`.
+    """
+    if schema['type'] == 'definitions':
+        list_schema = core_schema.definitions_schema(
+            core_schema.list_schema(schema['schema']), schema['definitions']  # type: ignore[typeddict-item]
+        )
+    else:
+        list_schema = core_schema.list_schema(schema)
+    return _plug_validator(SchemaValidator(inline_schema_defs(list_schema), core_config), List[item_type])
+
+
+def model_list_validator(cls: type[BaseModel]) -> SchemaValidator:
+    """Get the validator of lists of `cls` instances, which is built once per `__pydantic_validator__`, so it's rebuilt
+    along with the model.
+    """
+    validator = cls.__pydantic_validator__
+    cached = cls.__dict__.get('__pydantic_list_validator__')
+    if cached is not None and cached[0] is validator:
+        return cached[1]
+
+    if isinstance(validator, MockValidator):
+        # the model isn't built yet, build it or raise an error explaining why it can't be built
+        validator = validator.rebuild_or_raise()
+    list_validator = build_list_validator(cls.__pydantic_core_schema__, None, cls)
+    cls.__pydantic_list_validator__ = (validator, list_validator)  # type: ignore[attr-defined]
+    return list_validator
+
+
+def validate_many(
+    list_validator: SchemaValidator,
+    item_validator: SchemaValidator,
+    objects: Iterable[Any],
+    *,
+    strict: bool | None,
+    from_attributes: bool | None,
+    context: dict[str, Any] | None,
+    continue_on_error: bool,
+) -> Any:
+    """Validate `objects` with `list_validator`, returning the validated values, or a `ValidateManyResult` if
+    `continue_on_error` is set.
+
+    With `continue_on_error` each object is validated on its own with `item_validator` instead, so valid objects are
+    validated exactly once whatever the other objects are. This runs a Python loop with one validator call per object,
+    so it's no faster than validating each object separately.
+    """
+    if not continue_on_error:
+        return list_validator.validate_python(
+            list(objects), strict=strict, from_attributes=from_attributes, context=context
+        )
+
+    values: dict[int, Any] = {}
+    errors: dict[int, list[ErrorDetails]] = {}
+    for index, obj in enumerate(objects):
+        try:
+            values[index] = item_validator.validate_python(
+                obj, strict=strict, from_attributes=from_attributes, context=context
+            )
+        except ValidationError as e:
+            errors[index] = e.errors()
+    return ValidateManyResult(values, errors)
@@ -9,6 +9,7 @@ import re
 import typing
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from typing import Any
+from uuid import UUID, SafeUUID
 
 from pydantic_core import PydanticCustomError, core_schema
 from pydantic_core._pydantic_core import PydanticKnownError
@@ -223,6 +224,33 @@ def ip_v6_interface_validator(__input_value: Any) -> IPv6Interface:
         raise PydanticCustomError('ip_v6_interface', 'Input is not a valid IPv6 interface')
 
 
+_UUID_IS_SAFE_UNKNOWN = SafeUUID.unknown  # looking up enum members isn't free
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+def parse_uuid(value: str) -> UUID:
+    """Same as `UUID(value)`, but faster for the usual 32 hex digits, optionally separated by hyphens.
+
+    Raises:
+        ValueError: If `value` isn't a valid UUID string.
+    """
+    digits = value.replace('-', '')
+    if len(digits) == 32:
+        try:
+            int_value = int(digits, 16)
+        except ValueError:
+            # e.g. a 'urn:uuid:' prefix or braces, which `UUID` strips
+            pass
+        else:
+            # `UUID.__init__` would only check the string again, then set these two slots
+            uuid = _object_new(UUID)
+            _object_setattr(uuid, 'int', int_value)
+            _object_setattr(uuid, 'is_safe', _UUID_IS_SAFE_UNKNOWN)
+            return uuid
+    return UUID(value)
+
+
 def greater_than_validator(x: Any, gt: Any) -> Any:
     if not (x > gt):
         raise PydanticKnownError('greater_than', {'gt': str(gt)})
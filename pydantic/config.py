@@ -122,6 +122,19 @@ class ConfigDict(TypedDict, total=False):
         hide_input_in_errors: Whether to hide inputs when printing errors. Defaults to `False`.
 
             See [the dedicated section](/usage/model_config#hide-input-in-errors).
+        defer_build: Whether to defer model validator and serializer construction until the first model validation,
+            serialization or JSON schema generation. This is useful to avoid the overhead of building models which
+            are only used nested within other models, or which are never used at all. Defaults to `False`.
+        schema_cache_dir: A directory in which to persist generated core schemas, so that models which haven't
+            changed since the last run are built without regenerating their schema. Models whose schema can't be
+            reconstructed (e.g. because it uses a lambda or a nested function) are built as usual. Defaults to `None`.
+
+            Cache entries are JSON files which are loaded when models are defined, without calling any code. They
+            may only refer to classes and functions from pydantic, pydantic-core and the modules defining the model
+            and its bases, to models, dataclasses and enums, and to a few standard library types; any other entry
+            is deleted and the schema is regenerated.
+
+            See [the dedicated section](/usage/model_config#schema-cache).
     """
 
     title: str | None
@@ -157,6 +170,8 @@ class ConfigDict(TypedDict, total=False):
     validate_return: bool
     protected_namespaces: tuple[str, ...]
     hide_input_in_errors: bool
+    defer_build: bool
+    schema_cache_dir: str | None
 
 
 __getattr__ = getattr_migration(__name__)
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, Callable, Generic, NoReturn, TypeVar, ove
 
 from typing_extensions import Literal, dataclass_transform
 
-from ._internal import _config, _decorators, _typing_extra
+from ._internal import _config, _decorators, _model_construction, _typing_extra
 from ._internal import _dataclasses as _pydantic_dataclasses
 from ._migration import getattr_migration
 from .config import ConfigDict
@@ -255,7 +255,10 @@ def rebuild_dataclass(
     """
     if not force and cls.__pydantic_complete__:
         return None
-    else:
+    with _model_construction.BUILD_LOCK:
+        # another thread may have completed the dataclass while this one waited for the lock
+        if not force and cls.__pydantic_complete__:
+            return None
         if _types_namespace is not None:
             types_namespace: dict[str, Any] | None = _types_namespace.copy()
         else:
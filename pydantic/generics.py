@@ -1,4 +1,48 @@
-"""The `generics` module is a backport module from V1."""
+"""The `generics` module is a backport module from V1, and gives access to the cache of parametrized generic models."""
+from __future__ import annotations as _annotations
+
+from typing import NamedTuple
+
+from ._internal import _generics
 from ._migration import getattr_migration
 
+__all__ = 'GenericTypesCacheInfo', 'generic_types_cache_info', 'set_generic_types_cache_size'
+
+
+class GenericTypesCacheInfo(NamedTuple):
+    """Statistics of the cache of parametrized generic models.
+
+    Attributes:
+        hits: The number of parametrizations which were found in the cache.
+        misses: The number of parametrizations which weren't found in the cache, so a new model was created.
+        evictions: The number of models which were no longer kept alive by the cache, since more than `maxsize`
+            other models were used more recently.
+        maxsize: The number of recently used models kept alive by the cache.
+        currsize: The number of models currently kept alive by the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def generic_types_cache_info() -> GenericTypesCacheInfo:
+    """Get the statistics of the cache of parametrized generic models."""
+    cache = _generics._GENERIC_TYPES_CACHE
+    return GenericTypesCacheInfo(cache.hits, cache.misses, cache.evictions, cache.max_size, cache.current_size)
+
+
+def set_generic_types_cache_size(max_size: int) -> None:
+    """Set the number of recently used parametrized generic models kept alive by the cache.
+
+    Models which are still referenced elsewhere are always found in the cache, whatever its size.
+
+    Raises:
+        ValueError: If `max_size` is negative.
+    """
+    _generics._GENERIC_TYPES_CACHE.max_size = max_size
+
+
 __getattr__ = getattr_migration(__name__)
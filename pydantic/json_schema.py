@@ -1,12 +1,16 @@
 from __future__ import annotations as _annotations
 
+import heapq
 import inspect
+import io
+import json
 import math
 import re
 import warnings
 from dataclasses import is_dataclass
 from enum import Enum
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
@@ -28,7 +32,7 @@ from pydantic_core import CoreConfig, CoreSchema, PydanticOmit, core_schema
 from pydantic_core.core_schema import ComputedField
 from typing_extensions import Literal, assert_never
 
-from ._internal import _core_metadata, _core_utils, _schema_generation_shared, _typing_extra
+from ._internal import _core_metadata, _core_utils, _mock_val_ser, _schema_generation_shared, _typing_extra
 from .config import JsonSchemaExtraCallable
 from .errors import PydanticInvalidForJsonSchema, PydanticUserError
 
@@ -129,6 +133,9 @@ class GenerateJsonSchema:
         ignored_warning_kinds (set): Warnings to ignore when generating the schema. `self.render_warning_message` will
             do nothing if its argument `kind` is in `ignored_warning_kinds`;
             this value can be modified on subclasses to easily control which warnings are emitted.
+        cache_json_schemas (bool): Whether the JSON schemas generated by this class are cached by
+            `BaseModel.model_json_schema` and `TypeAdapter.json_schema`; this should be set to `False` on subclasses
+            which don't always generate the same JSON schema for the same core schema and arguments.
         by_alias (bool): Whether or not to use field names when generating the schema.
         ref_template (str): The format string used when generating reference names.
         core_to_json_refs (dict): A mapping of core refs to JSON refs.
@@ -158,6 +165,10 @@ class GenerateJsonSchema:
     # this value can be modified on subclasses to easily control which warnings are emitted
     ignored_warning_kinds: set[JsonSchemaWarningKind] = {'skipped-choice'}
 
+    # JSON schemas generated by this class are cached by `model_json_schema` and `TypeAdapter.json_schema`,
+    # set this to `False` on subclasses which don't always generate the same JSON schema for the same input
+    cache_json_schemas: bool = True
+
     def __init__(self, by_alias: bool = True, ref_template: str = DEFAULT_REF_TEMPLATE):
         self.by_alias = by_alias
         self.ref_template = ref_template
@@ -281,6 +292,64 @@ class GenerateJsonSchema:
         Raises:
             PydanticUserError: If the JSON schema generator has already been used to generate a JSON schema.
         """
+        return _sort_json_schema(self._generate_unsorted(schema, mode))
+
+    def write(
+        self,
+        schema: CoreSchema,
+        stream: IO[str] | IO[bytes],
+        mode: JsonSchemaMode = 'validation',
+        *,
+        indent: int | None = None,
+    ) -> None:
+        """Generates a JSON schema for a specified schema and writes it as JSON to a text or binary stream.
+
+        The output is the same as `json.dumps(self.generate(schema, mode), indent=indent)`, but rather than sorting a
+        copy of the whole JSON schema and then encoding it, each `$defs` entry is sorted and written separately, so
+        only one definition is held in memory in encoded form at a time.
+
+        Note that this doesn't call `generate`, so changes made to the JSON schema by overriding `generate` in a
+        subclass won't be written.
+
+        Args:
+            schema: A Pydantic model.
+            stream: The stream to write to, e.g. a file opened in text or binary mode.
+            mode: The mode in which to generate the schema. Defaults to 'validation'.
+            indent: The indentation of the JSON output, or `None` for compact output.
+
+        Raises:
+            PydanticUserError: If the JSON schema generator has already been used to generate a JSON schema.
+        """
+        json_schema = self._generate_unsorted(schema, mode)
+
+        binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+
+        def write(chunk: str) -> None:
+            stream.write(chunk.encode() if binary else chunk)  # type: ignore[arg-type]
+
+        newline = '' if indent is None else '\n'
+        item_separator = ', ' if indent is None else ','
+
+        def write_object(value: dict[str, Any], depth: int, stream_key: str | None) -> None:
+            """Write a JSON object with sorted keys, writing the entries of `value[stream_key]` one by one."""
+            if not value:
+                write('{}')
+                return
+            inner_indent = newline + ' ' * (indent or 0) * (depth + 1)
+            write('{')
+            for i, key in enumerate(sorted(value)):
+                write(f'{item_separator if i else ""}{inner_indent}{json.dumps(key)}: ')
+                if key == stream_key:
+                    write_object(value[key], depth + 1, None)
+                else:
+                    chunk = json.dumps(value[key], indent=indent, sort_keys=True)
+                    write(chunk.replace('\n', inner_indent) if indent is not None else chunk)
+            write(newline + ' ' * (indent or 0) * depth + '}')
+
+        write_object(json_schema, 0, '$defs')
+
+    def _generate_unsorted(self, schema: CoreSchema, mode: JsonSchemaMode) -> JsonSchemaValue:
+        """Generates the JSON schema of `generate`, without sorting its keys."""
         self.mode = mode
         if self._used:
             raise PydanticUserError(
@@ -322,7 +391,7 @@ class GenerateJsonSchema:
         # json_schema['$schema'] = self.schema_dialect
 
         self._used = True
-        return _sort_json_schema(json_schema)
+        return json_schema
 
     def generate_inner(self, schema: CoreSchemaOrField) -> JsonSchemaValue:
         """Generates a JSON schema for a given `CoreSchemaOrField`.
@@ -1315,37 +1384,55 @@ class GenerateJsonSchema:
 
         This is intended to prevent confusion where the type that gets the "shortened"
         ref depends on the order in which the types were visited.
-        """
-        made_changes = True
-
-        # Note that because the defs ref choices eventually produce values that use the IDs and
-        # should _never_ collide, it should not be possible for this while loop to run forever
-        while made_changes:
-            made_changes = False
 
-            for defs_ref, core_mode_ref in self.defs_to_core_refs.items():
-                if defs_ref not in self.collisions:
+        The colliding definitions are renamed in a single pass, in the order they were defined, then every `$ref` is
+        updated in a single walk over the JSON schema and definitions, so the cost of resolving collisions doesn't grow
+        with the number of renamed definitions.
+        """
+        json_ref_renames: dict[JsonRef, JsonRef] = {}
+        # the colliding definitions to rename, by their position in `defs_to_core_refs`, where renamed definitions move
+        # to the end; a definition which starts colliding while another one is renamed is queued at that point
+        defs_refs = list(self.defs_to_core_refs)
+        positions = {defs_ref: i for i, defs_ref in enumerate(defs_refs)}
+        pending = [i for defs_ref, i in positions.items() if defs_ref in self.collisions]
+
+        while pending:
+            defs_ref = defs_refs[heapq.heappop(pending)]
+            core_mode_ref = self.defs_to_core_refs[defs_ref]
+            for choice in self.defs_ref_fallbacks[core_mode_ref]:
+                if choice == defs_ref or choice in self.collisions:
                     continue
 
-                for choice in self.defs_ref_fallbacks[core_mode_ref]:
-                    if choice == defs_ref or choice in self.collisions:
-                        continue
-
-                    if self.defs_to_core_refs.get(choice, core_mode_ref) == core_mode_ref:
-                        json_schema = self.change_defs_ref(defs_ref, choice, json_schema)
-                        made_changes = True
-                        break
-                    else:
-                        self.collisions.add(choice)
-
-                if made_changes:
+                if self.defs_to_core_refs.get(choice, core_mode_ref) == core_mode_ref:
+                    old_json_ref, new_json_ref = self._rename_defs_ref(defs_ref, choice)
+                    json_ref_renames[old_json_ref] = new_json_ref
+                    positions[choice] = len(defs_refs)
+                    defs_refs.append(choice)
                     break
+                else:
+                    self.collisions.add(choice)
+                    if choice in positions:
+                        heapq.heappush(pending, positions[choice])
 
-        return json_schema
+        if not json_ref_renames:
+            return json_schema
+
+        # a definition may have been renamed more than once, refs are replaced by its final name; renamed
+        # definitions are in `self.collisions` so a definition is never renamed to a name that was used before
+        for old_json_ref, new_json_ref in json_ref_renames.items():
+            while new_json_ref in json_ref_renames:
+                new_json_ref = json_ref_renames[new_json_ref]
+            json_ref_renames[old_json_ref] = new_json_ref
+        return self._replace_json_refs(json_ref_renames, json_schema)
 
     def change_defs_ref(self, old: DefsRef, new: DefsRef, json_schema: JsonSchemaValue) -> JsonSchemaValue:
         if new == old:
             return json_schema
+        old_json_ref, new_json_ref = self._rename_defs_ref(old, new)
+        return self._replace_json_refs({old_json_ref: new_json_ref}, json_schema)
+
+    def _rename_defs_ref(self, old: DefsRef, new: DefsRef) -> tuple[JsonRef, JsonRef]:
+        """Rename the definition `old` to `new` without updating the refs to it, returning its old and new JSON refs."""
         core_mode_ref = self.defs_to_core_refs[old]
         old_json_ref = self.core_to_json_refs[core_mode_ref]
         new_json_ref = JsonRef(self.ref_template.format(model=new))
@@ -1356,15 +1443,21 @@ class GenerateJsonSchema:
         self.json_to_defs_refs[new_json_ref] = new
         self.core_to_defs_refs[core_mode_ref] = new
         self.core_to_json_refs[core_mode_ref] = new_json_ref
+        return old_json_ref, new_json_ref
+
+    def _replace_json_refs(
+        self, json_ref_renames: dict[JsonRef, JsonRef], json_schema: JsonSchemaValue
+    ) -> JsonSchemaValue:
+        """Replace the `$ref`s in the definitions and `json_schema` according to `json_ref_renames`."""
 
         def walk_replace_json_schema_ref(item: Any) -> Any:
-            """Recursively update the JSON schema to use the new defs_ref."""
+            """Recursively update the JSON schema to use the new refs."""
             if isinstance(item, list):
                 return [walk_replace_json_schema_ref(item) for item in item]
             elif isinstance(item, dict):
                 ref = item.get('$ref')
-                if ref == old_json_ref:
-                    item['$ref'] = new_json_ref
+                if isinstance(ref, str) and ref in json_ref_renames:
+                    item['$ref'] = json_ref_renames[JsonRef(ref)]
                 return {k: walk_replace_json_schema_ref(v) for k, v in item.items()}
             else:
                 return item
@@ -1562,9 +1655,58 @@ def model_json_schema(
     schema_generator: type[GenerateJsonSchema] = GenerateJsonSchema,
     mode: JsonSchemaMode = 'validation',
 ) -> dict[str, Any]:
-    """Utility function to generate a JSON Schema for a model."""
-    schema_generator_instance = schema_generator(by_alias=by_alias, ref_template=ref_template)
-    return schema_generator_instance.generate(cls.__pydantic_core_schema__, mode=mode)
+    """Utility function to generate a JSON Schema for a model.
+
+    JSON schemas are cached on the model by the arguments they're generated with, unless
+    `schema_generator.cache_json_schemas` is `False`; the cache is discarded when the model is rebuilt.
+    """
+    _ensure_model_built(cls)
+    schema = cls.__pydantic_core_schema__
+    cache = cls.__dict__.get('__pydantic_json_schema_cache__')
+    if cache is None or cache[0] is not schema:
+        # the model has been rebuilt since the cached JSON schemas were generated
+        cache = (schema, {})
+        cls.__pydantic_json_schema_cache__ = cache  # type: ignore[union-attr]
+    return cached_json_schema(cache[1], schema, by_alias, ref_template, schema_generator, mode)
+
+
+def cached_json_schema(
+    cache: dict[Any, JsonSchemaValue],
+    schema: CoreSchema,
+    by_alias: bool,
+    ref_template: str,
+    schema_generator: type[GenerateJsonSchema],
+    mode: JsonSchemaMode,
+) -> JsonSchemaValue:
+    """Generate the JSON schema of `schema`, or get a copy of it from `cache` if it's already been generated with the
+    same arguments.
+    """
+    if not schema_generator.cache_json_schemas:
+        return schema_generator(by_alias=by_alias, ref_template=ref_template).generate(schema, mode=mode)
+
+    key = (mode, by_alias, ref_template, schema_generator)
+    json_schema = cache.get(key)
+    if json_schema is None:
+        json_schema = schema_generator(by_alias=by_alias, ref_template=ref_template).generate(schema, mode=mode)
+        cache[key] = json_schema
+    return _copy_json_value(json_schema)
+
+
+def _copy_json_value(value: Any) -> Any:
+    """Copy a JSON value, so the caller can modify the copy without modifying the cached value."""
+    if isinstance(value, dict):
+        return {k: _copy_json_value(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_json_value(v) for v in value]
+    else:
+        return value
+
+
+def _ensure_model_built(cls: type[BaseModel] | type[PydanticDataclass]) -> None:
+    """Build a model whose schema build was deferred (or failed earlier) so `__pydantic_core_schema__` is its own."""
+    validator = cls.__dict__.get('__pydantic_validator__')
+    if isinstance(validator, _mock_val_ser.MockValidator):
+        validator.rebuild()
 
 
 def models_json_schema(
@@ -1592,6 +1734,8 @@ def models_json_schema(
                 whose values are `DefsRef`.
             - The second element is the generated JSON Schema.
     """
+    for cls, _ in models:
+        _ensure_model_built(cls)
     instance = schema_generator(by_alias=by_alias, ref_template=ref_template)
     inputs = [(m, mode, m.__pydantic_core_schema__) for m, mode in models]
     key_map, definitions = instance.generate_definitions(inputs)
@@ -21,6 +21,7 @@ from ._internal import (
     _repr,
     _typing_extra,
     _utils,
+    _validate_many,
 )
 from ._migration import getattr_migration
 from .config import ConfigDict
@@ -83,6 +84,8 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
         __pydantic_parent_namespace__: Parent namespace of the model.
         __pydantic_custom_init__: Custom init of the model.
         __pydantic_post_init__: Post init of the model.
+        __pydantic_setattr_handlers__: Handlers assigning the fields and private attributes of the model.
+        __pydantic_setattr_config__: The `model_config` settings which the setattr handlers were chosen from.
     """
 
     if typing.TYPE_CHECKING:
@@ -107,6 +110,8 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
         __pydantic_parent_namespace__: typing.ClassVar[dict[str, Any] | None]
         __pydantic_custom_init__: typing.ClassVar[bool]
         __pydantic_post_init__: typing.ClassVar[None | Literal['model_post_init']]
+        __pydantic_setattr_handlers__: typing.ClassVar[dict[str, _model_construction.SetattrHandler]]
+        __pydantic_setattr_config__: typing.ClassVar[tuple[Any, Any]]
     else:
         # `model_fields` and `__pydantic_decorators__` must be set for
         # pydantic._internal._generate_schema.GenerateSchema.model_schema to work for a plain BaseModel annotation
@@ -116,6 +121,8 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
             'Pydantic models should inherit from BaseModel, BaseModel cannot be instantiated directly',
             code='base-model-instantiated',
         )
+        __pydantic_setattr_handlers__ = {}
+        __pydantic_setattr_config__ = (None, None)
 
     model_config = ConfigDict()
     __slots__ = '__dict__', '__pydantic_fields_set__', '__pydantic_extra__', '__pydantic_private__'
@@ -254,6 +261,76 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
             obj, strict=strict, from_attributes=from_attributes, context=context
         )
 
+    @typing.overload
+    @classmethod
+    def model_validate_many(
+        cls: type[Model],
+        objs: typing.Iterable[Any],
+        *,
+        strict: bool | None = ...,
+        from_attributes: bool | None = ...,
+        context: dict[str, Any] | None = ...,
+        continue_on_error: Literal[False] = ...,
+    ) -> list[Model]:
+        ...
+
+    @typing.overload
+    @classmethod
+    def model_validate_many(
+        cls: type[Model],
+        objs: typing.Iterable[Any],
+        *,
+        strict: bool | None = ...,
+        from_attributes: bool | None = ...,
+        context: dict[str, Any] | None = ...,
+        continue_on_error: Literal[True],
+    ) -> _validate_many.ValidateManyResult[Model]:
+        ...
+
+    @classmethod
+    def model_validate_many(
+        cls: type[Model],
+        objs: typing.Iterable[Any],
+        *,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, Any] | None = None,
+        continue_on_error: bool = False,
+    ) -> list[Model] | _validate_many.ValidateManyResult[Model]:
+        """Validate many objects against the model in a single call to the validator.
+
+        This is faster than calling `model_validate` on each object, since the loop over the objects is run by
+        `pydantic-core`.
+
+        Args:
+            objs: The objects to validate.
+            strict: Whether to raise an exception on invalid fields. Defaults to None.
+            from_attributes: Whether to extract data from object attributes. Defaults to None.
+            context: Additional context to pass to the validator. Defaults to None.
+            continue_on_error: Whether to validate the remaining objects when some are invalid, rather than raising
+                an error; each object is then validated in its own call, which is no faster than calling
+                `model_validate` on each object. Defaults to False.
+
+        Raises:
+            ValidationError: If any object could not be validated and `continue_on_error` is not set, the location of
+                each error starts with the index of the invalid object.
+
+        Returns:
+            The validated model instances, or if `continue_on_error` is set, a `ValidateManyResult` holding the
+                instance validated from each valid object and the errors of each invalid object, by the object's index.
+        """
+        __tracebackhide__ = True
+        list_validator = _validate_many.model_list_validator(cls)
+        return _validate_many.validate_many(
+            list_validator,
+            cls.__pydantic_validator__,
+            objs,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+            continue_on_error=continue_on_error,
+        )
+
     @property
     def model_fields_set(self) -> set[str]:
         """Returns the set of fields that have been set on this model instance.
@@ -314,6 +391,13 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
         pass
 
     def __setattr__(self, name: str, value: Any) -> None:
+        handler = self.__pydantic_setattr_handlers__.get(name)
+        # handlers are only used while `model_config` still holds the settings they were chosen from
+        setattr_config = _model_construction.setattr_config(self.model_config)
+        if handler is not None and setattr_config == self.__pydantic_setattr_config__:
+            handler(self, name, value)
+            return
+
         if name in self.__class_vars__:
             raise AttributeError(
                 f'"{name}" is a ClassVar of `{self.__class__.__name__}` and cannot be set on an instance. '
@@ -516,6 +600,9 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
         with your desired modifications, then override this method on a custom base class and set the default
         value of `schema_generator` to be your subclass.
 
+        The JSON schema is cached by the arguments it's generated with until the model is rebuilt, unless
+        `schema_generator.cache_json_schemas` is `False`.
+
         Args:
             by_alias: Whether to use attribute aliases or not. Defaults to `True`.
             ref_template: The reference template. Defaults to `DEFAULT_REF_TEMPLATE`.
@@ -554,7 +641,10 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
         """
         if not force and cls.__pydantic_complete__:
             return None
-        else:
+        with _model_construction.BUILD_LOCK:
+            # another thread may have completed the model while this one waited for the lock
+            if not force and cls.__pydantic_complete__:
+                return None
             if _types_namespace is not None:
                 types_namespace: dict[str, Any] | None = _types_namespace.copy()
             else:
@@ -566,10 +656,12 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
                 types_namespace = cls.__pydantic_parent_namespace__
 
                 types_namespace = _typing_extra.get_cls_types_namespace(cls, types_namespace)
+            config_wrapper = _config.ConfigWrapper(cls.model_config, check=False)
+            _model_construction.set_model_setattr_handlers(cls, config_wrapper)
             return _model_construction.complete_model_class(
                 cls,
                 cls.__name__,
-                _config.ConfigWrapper(cls.model_config, check=False),
+                config_wrapper,
                 raise_errors=raise_errors,
                 types_namespace=types_namespace,
             )
@@ -700,49 +792,56 @@ class BaseModel(metaclass=_model_construction.ModelMetaclass):
             typevar_values = (typevar_values,)
         _generics.check_parameters_count(cls, typevar_values)
 
-        # Build map from generic typevars to passed params
-        typevars_map: dict[_typing_extra.TypeVarType, type[Any]] = dict(
-            zip(cls.__pydantic_generic_metadata__['parameters'], typevar_values)
-        )
+        with _model_construction.BUILD_LOCK:
+            # another thread may have created the model while this one waited for the lock
+            cached = _generics.get_cached_generic_type_early(cls, typevar_values)
+            if cached is not None:
+                return cached
 
-        if _utils.all_identical(typevars_map.keys(), typevars_map.values()) and typevars_map:
-            submodel = cls  # if arguments are equal to parameters it's the same object
-            _generics.set_cached_generic_type(cls, typevar_values, submodel)
-        else:
-            parent_args = cls.__pydantic_generic_metadata__['args']
-            if not parent_args:
-                args = typevar_values
-            else:
-                args = tuple(_generics.replace_types(arg, typevars_map) for arg in parent_args)
-
-            origin = cls.__pydantic_generic_metadata__['origin'] or cls
-            model_name = origin.model_parametrized_name(args)
-            params = tuple(
-                {param: None for param in _generics.iter_contained_typevars(typevars_map.values())}
-            )  # use dict as ordered set
-
-            with _generics.generic_recursion_self_type(origin, args) as maybe_self_type:
-                if maybe_self_type is not None:
-                    return maybe_self_type
-
-                cached = _generics.get_cached_generic_type_late(cls, typevar_values, origin, args)
-                if cached is not None:
-                    return cached
-
-                # Attempt to rebuild the origin in case new types have been defined
-                try:
-                    # depth 3 gets you above this __class_getitem__ call
-                    origin.model_rebuild(_parent_namespace_depth=3)
-                except PydanticUndefinedAnnotation:
-                    # It's okay if it fails, it just means there are still undefined types
-                    # that could be evaluated later.
-                    # TODO: Make sure validation fails if there are still undefined types, perhaps using MockValidator
-                    pass
-
-                submodel = _generics.create_generic_submodel(model_name, origin, args, params)
+            # Build map from generic typevars to passed params
+            typevars_map: dict[_typing_extra.TypeVarType, type[Any]] = dict(
+                zip(cls.__pydantic_generic_metadata__['parameters'], typevar_values)
+            )
 
-                # Update cache
-                _generics.set_cached_generic_type(cls, typevar_values, submodel, origin, args)
+            if _utils.all_identical(typevars_map.keys(), typevars_map.values()) and typevars_map:
+                submodel = cls  # if arguments are equal to parameters it's the same object
+                _generics.set_cached_generic_type(cls, typevar_values, submodel)
+            else:
+                parent_args = cls.__pydantic_generic_metadata__['args']
+                if not parent_args:
+                    args = typevar_values
+                else:
+                    args = tuple(_generics.replace_types(arg, typevars_map) for arg in parent_args)
+
+                origin = cls.__pydantic_generic_metadata__['origin'] or cls
+                model_name = origin.model_parametrized_name(args)
+                params = tuple(
+                    {param: None for param in _generics.iter_contained_typevars(typevars_map.values())}
+                )  # use dict as ordered set
+
+                with _generics.generic_recursion_self_type(origin, args) as maybe_self_type:
+                    if maybe_self_type is not None:
+                        return maybe_self_type
+
+                    cached = _generics.get_cached_generic_type_late(cls, typevar_values, origin, args)
+                    if cached is not None:
+                        return cached
+
+                    # Attempt to rebuild the origin in case new types have been defined
+                    try:
+                        # depth 3 gets you above this __class_getitem__ call
+                        origin.model_rebuild(_parent_namespace_depth=3)
+                    except PydanticUndefinedAnnotation:
+                        # It's okay if it fails, it just means there are still undefined types
+                        # that could be evaluated later.
+                        # TODO: Make sure validation fails if there are still undefined types, perhaps using
+                        #   MockValidator
+                        pass
+
+                    submodel = _generics.create_generic_submodel(model_name, origin, args, params)
+
+                    # Update cache
+                    _generics.set_cached_generic_type(cls, typevar_values, submodel, origin, args)
 
         return submodel
 
@@ -1103,8 +1202,7 @@ def create_model(
     __validators__: dict[str, AnyClassMethod] | None = None,
     __cls_kwargs__: dict[str, Any] | None = None,
     **field_definitions: Any,
-) -> type[BaseModel]:
-    ...
+) -> type[BaseModel]: ...
 
 
 @typing.overload
@@ -1117,8 +1215,7 @@ def create_model(
     __validators__: dict[str, AnyClassMethod] | None = None,
     __cls_kwargs__: dict[str, Any] | None = None,
     **field_definitions: Any,
-) -> type[Model]:
-    ...
+) -> type[Model]: ...
 
 
 def create_model(
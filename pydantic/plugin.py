@@ -0,0 +1,153 @@
+"""Plugins observing every validation and serialization call made through models and type adapters, e.g. to record
+latencies and error rates.
+
+Plugins are installed process-wide with `install_plugin`, and only observe the models and type adapters created while
+at least one plugin is installed; so plugins should be installed before the models they observe are defined. When no
+plugin is installed, models and type adapters use pydantic-core's validators and serializers directly, with no
+overhead.
+
+The list validators used by `model_validate_many` and `TypeAdapter.validate_many` are built on their first call, and
+observe the plugins installed at that point, with `List[<model or type>]` as the `schema_type`.
+"""
+from __future__ import annotations as _annotations
+
+from time import perf_counter
+from typing import Any, Callable, cast
+
+from pydantic_core import SchemaSerializer, SchemaValidator
+from typing_extensions import Literal
+
+__all__ = 'PluginCall', 'ValidationPlugin', 'install_plugin', 'uninstall_plugin'
+
+PluginMethod = Literal['validate_python', 'validate_json', 'validate_assignment', 'to_python', 'to_json']
+
+
+class PluginCall:
+    """A validation or serialization call observed by plugins, the same object is passed to each callback of a call.
+
+    Attributes:
+        schema_type: The model, or the type of the type adapter, the call was made for.
+        method: The method of the validator or serializer called.
+        input: The value validated or serialized; for `validate_assignment`, the model instance assigned to.
+        start_time: The `time.perf_counter()` value just before the plugins' `on_enter` callbacks were called.
+    """
+
+    __slots__ = 'schema_type', 'method', 'input', 'start_time', '__weakref__'
+
+    def __init__(self, schema_type: Any, method: PluginMethod, input: Any) -> None:
+        self.schema_type = schema_type
+        self.method = method
+        self.input = input
+        self.start_time = perf_counter()
+
+    def __repr__(self) -> str:
+        return f'PluginCall(schema_type={self.schema_type!r}, method={self.method!r})'
+
+
+class ValidationPlugin:
+    """Base class of plugins, subclasses override the callbacks they need.
+
+    Callbacks are called in the thread making the call; exceptions raised by callbacks propagate to the caller.
+    """
+
+    def on_enter(self, call: PluginCall) -> None:
+        """Called before the validator or serializer is called."""
+
+    def on_success(self, call: PluginCall, result: Any) -> None:
+        """Called after the validator or serializer returned `result`."""
+
+    def on_error(self, call: PluginCall, error: Exception) -> None:
+        """Called after the validator or serializer raised `error`, e.g. a `ValidationError`, which is re-raised."""
+
+
+_plugins: list[ValidationPlugin] = []
+
+
+def install_plugin(plugin: ValidationPlugin) -> None:
+    """Install `plugin`, so it observes the models and type adapters created from now on.
+
+    Installing a plugin which is already installed does nothing.
+    """
+    if plugin not in _plugins:
+        _plugins.append(plugin)
+
+
+def uninstall_plugin(plugin: ValidationPlugin) -> None:
+    """Uninstall `plugin`, it won't be called by any model or type adapter after this returns.
+
+    Raises:
+        ValueError: If `plugin` isn't installed.
+    """
+    _plugins.remove(plugin)
+
+
+def _plug_validator(validator: SchemaValidator, schema_type: Any) -> SchemaValidator:
+    """Wrap `validator` to call the installed plugins, or return it unchanged if no plugin is installed."""
+    if not _plugins:
+        return validator
+    return cast(SchemaValidator, _PluggableSchemaValidator(validator, schema_type))
+
+
+def _plug_serializer(serializer: SchemaSerializer, schema_type: Any) -> SchemaSerializer:
+    """Wrap `serializer` to call the installed plugins, or return it unchanged if no plugin is installed."""
+    if not _plugins:
+        return serializer
+    return cast(SchemaSerializer, _PluggableSchemaSerializer(serializer, schema_type))
+
+
+def _observed(func: Callable[..., Any], schema_type: Any, method: PluginMethod) -> Callable[..., Any]:
+    def observed(__input: Any, *args: Any, **kwargs: Any) -> Any:
+        # copied so plugins can be installed or uninstalled during the call
+        plugins = tuple(_plugins)
+        if not plugins:
+            return func(__input, *args, **kwargs)
+
+        call = PluginCall(schema_type, method, __input)
+        for plugin in plugins:
+            plugin.on_enter(call)
+        try:
+            result = func(__input, *args, **kwargs)
+        except Exception as error:
+            for plugin in plugins:
+                plugin.on_error(call, error)
+            raise
+        for plugin in plugins:
+            plugin.on_success(call, result)
+        return result
+
+    return observed
+
+
+class _PluggableSchemaValidator:
+    """A `SchemaValidator` calling the installed plugins around each validation."""
+
+    __slots__ = '_validator', 'validate_python', 'validate_json', 'validate_assignment'
+
+    def __init__(self, validator: SchemaValidator, schema_type: Any) -> None:
+        self._validator = validator
+        self.validate_python = _observed(validator.validate_python, schema_type, 'validate_python')
+        self.validate_json = _observed(validator.validate_json, schema_type, 'validate_json')
+        self.validate_assignment = _observed(validator.validate_assignment, schema_type, 'validate_assignment')
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._validator, name)
+
+    def __repr__(self) -> str:
+        return f'PluggableSchemaValidator({self._validator!r})'
+
+
+class _PluggableSchemaSerializer:
+    """A `SchemaSerializer` calling the installed plugins around each serialization."""
+
+    __slots__ = '_serializer', 'to_python', 'to_json'
+
+    def __init__(self, serializer: SchemaSerializer, schema_type: Any) -> None:
+        self._serializer = serializer
+        self.to_python = _observed(serializer.to_python, schema_type, 'to_python')
+        self.to_json = _observed(serializer.to_json, schema_type, 'to_json')
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._serializer, name)
+
+    def __repr__(self) -> str:
+        return f'PluggableSchemaSerializer({self._serializer!r})'
@@ -0,0 +1,303 @@
+"""Profiling of model schema builds and of validation, to find the models which are slowest to define or validate.
+
+While `record_schema_builds()` is active, every model built (when its class is created, or when it's rebuilt) is
+recorded as a `ModelBuildProfile`, and `schema_build_report()` formats the slowest of them as a table.
+
+`ValidationProfiler` is a plugin which samples validation calls, see `pydantic.plugin`.
+"""
+from __future__ import annotations as _annotations
+
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field, is_dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+from pydantic_core import ValidationError
+from typing_extensions import is_typeddict
+
+from ._internal import _profiling, _repr, _utils
+from .plugin import PluginCall, ValidationPlugin
+
+__all__ = 'ModelBuildProfile', 'record_schema_builds', 'schema_build_report', 'ValidationProfiler'
+
+
+@dataclass
+class ModelBuildProfile:
+    """The timings and size of one model build.
+
+    All times are wall times in seconds. `total_time` includes the time spent building any other models while
+    building this one, e.g. parametrizing a generic model referenced by a field.
+
+    Attributes:
+        model: The module and qualified name of the model.
+        total_time: The time taken to build the model.
+        schema_time: The time taken to generate the model's core schema.
+        validator_time: The time taken to construct the model's validator and serializer.
+        pass_times: The time taken by each pass over the core schema, e.g. `flatten_refs`, by the name of the pass.
+        node_count: The number of schemas in the model's core schema, including definitions.
+        definition_count: The number of definitions in the model's core schema.
+    """
+
+    model: str
+    total_time: float = 0.0
+    schema_time: float = 0.0
+    validator_time: float = 0.0
+    pass_times: dict[str, float] = field(default_factory=dict)
+    node_count: int = 0
+    definition_count: int = 0
+
+
+@contextmanager
+def record_schema_builds() -> Iterator[list[ModelBuildProfile]]:
+    """Record a profile of every model built in the `with` block, in any thread.
+
+    Usage:
+        ```py
+        from pydantic import BaseModel
+        from pydantic.profiling import record_schema_builds, schema_build_report
+
+        with record_schema_builds() as profiles:
+
+            class Model(BaseModel):
+                x: int
+
+        print([p.model for p in profiles])
+        #> ['__main__.Model']
+        report = schema_build_report(profiles)
+        ```
+
+    Yields:
+        The list the profiles are appended to, in the order the builds complete.
+    """
+    profiles: list[ModelBuildProfile] = []
+    _profiling.recorders.append(profiles)
+    try:
+        yield profiles
+    finally:
+        _profiling.recorders.remove(profiles)
+
+
+def schema_build_report(profiles: Iterable[ModelBuildProfile], *, limit: int = 20) -> str:
+    """Format the slowest model builds as a table, followed by the total time taken by each core schema pass.
+
+    Args:
+        profiles: The profiles to report, as recorded by `record_schema_builds`.
+        limit: The number of models to include in the table, starting from the slowest.
+
+    Returns:
+        The report, times are in milliseconds.
+    """
+    profiles = sorted(profiles, key=lambda p: p.total_time, reverse=True)
+    headers = ('model', 'total ms', 'schema ms', 'validator ms', 'passes ms', 'nodes', 'defs')
+    rows = [
+        (
+            p.model,
+            f'{p.total_time * 1000:.2f}',
+            f'{p.schema_time * 1000:.2f}',
+            f'{p.validator_time * 1000:.2f}',
+            f'{sum(p.pass_times.values()) * 1000:.2f}',
+            str(p.node_count),
+            str(p.definition_count),
+        )
+        for p in profiles[:limit]
+    ]
+    widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+    lines = [
+        '  '.join(
+            cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in (headers, *rows)
+    ]
+    if len(profiles) > limit:
+        lines.append(f'... {len(profiles) - limit} more models')
+
+    pass_totals: dict[str, float] = {}
+    for p in profiles:
+        for name, time in p.pass_times.items():
+            pass_totals[name] = pass_totals.get(name, 0.0) + time
+    if pass_totals:
+        lines.append('')
+        lines.append(f'{len(profiles)} models built in {sum(p.total_time for p in profiles) * 1000:.2f}ms, passes:')
+        for name, time in sorted(pass_totals.items(), key=lambda item: item[1], reverse=True):
+            lines.append(f'  {name}: {time * 1000:.2f}ms')
+    return '\n'.join(lines)
+
+
+class ValidationProfiler(ValidationPlugin):
+    """A plugin sampling validation calls, to find the models and types worth optimizing.
+
+    For each model (or type of a type adapter) it counts the validation calls, and for the sampled calls it records
+    the time taken, the size of the input (its `len()`, e.g. the length of JSON data or the number of items in a
+    dict) and the fields which failed validation. Like any plugin, it only observes models and type adapters created
+    after it's installed.
+
+    Usage:
+        ```py
+        from pydantic import BaseModel
+        from pydantic.plugin import install_plugin, uninstall_plugin
+        from pydantic.profiling import ValidationProfiler
+
+        profiler = ValidationProfiler(sample_rate=1.0)
+        install_plugin(profiler)
+
+
+        class Model(BaseModel):
+            x: int
+
+
+        Model(x=1)
+        Model.model_validate_json('{"x": 2}')
+        uninstall_plugin(profiler)
+        print(profiler.report()['__main__.Model']['calls'])
+        #> 2
+        ```
+
+    Args:
+        sample_rate: The fraction of calls which are sampled, between `0` and `1`.
+        max_samples: The number of call durations kept per type to compute percentiles; once it's reached, a random
+            subset of the sampled durations is kept.
+    """
+
+    def __init__(self, sample_rate: float = 0.01, *, max_samples: int = 1000) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('`sample_rate` must be between 0 and 1')
+        self.sample_rate = sample_rate
+        self.max_samples = max_samples
+        self._stats: dict[Any, _ValidationStats] = {}
+        # the stats each sampled call in progress is recorded in, dropped with the call if it's never completed
+        self._sampled: WeakKeyDictionary[PluginCall, _ValidationStats] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def on_enter(self, call: PluginCall) -> None:
+        """Count a validation call, and decide whether it's sampled."""
+        if call.method not in _VALIDATION_METHODS:
+            return
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        with self._lock:
+            stats = self._stats.get(call.schema_type)
+            if stats is None:
+                stats = self._stats[call.schema_type] = _ValidationStats(_has_fields(call.schema_type))
+            stats.calls += 1
+            if sampled:
+                self._sampled[call] = stats
+
+    def on_success(self, call: PluginCall, result: Any) -> None:
+        """Record the duration of a sampled validation call which returned `result`."""
+        self._record(call, None)
+
+    def on_error(self, call: PluginCall, error: Exception) -> None:
+        """Record the duration of a sampled validation call which raised `error`, and the fields which failed."""
+        self._record(call, error)
+
+    def _record(self, call: PluginCall, error: Exception | None) -> None:
+        duration = perf_counter() - call.start_time
+        with self._lock:
+            stats = self._sampled.pop(call, None)
+            if stats is None:
+                return
+            stats.sampled_calls += 1
+            stats.total_time += duration
+            if len(stats.durations) < self.max_samples:
+                stats.durations.append(duration)
+            else:
+                # reservoir sampling, so every sampled duration is kept with the same probability
+                index = random.randrange(stats.sampled_calls)
+                if index < self.max_samples:
+                    stats.durations[index] = duration
+            try:
+                size = len(call.input)
+            except TypeError:
+                pass
+            else:
+                stats.input_size_total += size
+                stats.input_size_max = max(stats.input_size_max, size)
+                stats.sized_calls += 1
+            if error is not None:
+                stats.errors += 1
+                if stats.has_fields and isinstance(error, ValidationError):
+                    for field_name in {str(e['loc'][0]) for e in error.errors() if e['loc']}:
+                        stats.failing_fields[field_name] = stats.failing_fields.get(field_name, 0) + 1
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of each model or type, starting with the one with the longest sampled time.
+
+        Returns:
+            A dict of statistics by the name of the model or type, each of which has the keys:
+
+            * `calls`: the number of validation calls
+            * `sampled_calls`: the number of calls sampled, all the other statistics only cover sampled calls
+            * `errors`: the number of calls which raised an error
+            * `total_time`, `mean_time` and `p99_time`: the time taken by calls, in seconds
+            * `mean_input_size` and `max_input_size`: the `len()` of inputs, or `None` if no input had a length
+            * `failing_fields`: the number of calls in which each field failed validation, most frequent first; only
+                recorded for models, dataclasses and typed dicts
+        """
+        with self._lock:
+            stats_items = sorted(self._stats.items(), key=lambda item: item[1].total_time, reverse=True)
+            return {_type_name(schema_type): stats.as_dict() for schema_type, stats in stats_items}
+
+    def reset(self) -> None:
+        """Discard all the statistics recorded so far."""
+        with self._lock:
+            self._stats.clear()
+            self._sampled.clear()
+
+
+_VALIDATION_METHODS = {'validate_python', 'validate_json', 'validate_assignment'}
+
+
+class _ValidationStats:
+    __slots__ = (
+        'has_fields',
+        'calls',
+        'sampled_calls',
+        'errors',
+        'total_time',
+        'durations',
+        'sized_calls',
+        'input_size_total',
+        'input_size_max',
+        'failing_fields',
+    )
+
+    def __init__(self, has_fields: bool) -> None:
+        self.has_fields = has_fields
+        self.calls = 0
+        self.sampled_calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.durations: list[float] = []
+        self.sized_calls = 0
+        self.input_size_total = 0
+        self.input_size_max = 0
+        self.failing_fields: dict[str, int] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        durations = sorted(self.durations)
+        return {
+            'calls': self.calls,
+            'sampled_calls': self.sampled_calls,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / self.sampled_calls if self.sampled_calls else 0.0,
+            'p99_time': durations[min(len(durations) - 1, int(len(durations) * 0.99))] if durations else 0.0,
+            'mean_input_size': self.input_size_total / self.sized_calls if self.sized_calls else None,
+            'max_input_size': self.input_size_max if self.sized_calls else None,
+            'failing_fields': dict(sorted(self.failing_fields.items(), key=lambda item: item[1], reverse=True)),
+        }
+
+
+def _has_fields(tp: Any) -> bool:
+    """Whether the first item of the location of validation errors of `tp` is a field name."""
+    from .main import BaseModel
+
+    return _utils.lenient_issubclass(tp, BaseModel) or is_dataclass(tp) or is_typeddict(tp)
+
+
+def _type_name(tp: Any) -> str:
+    if isinstance(tp, type) and tp.__module__ != 'builtins':
+        return f'{tp.__module__}.{tp.__qualname__}'
+    return _repr.display_as_type(tp)
@@ -11,7 +11,7 @@ from typing_extensions import Literal, is_typeddict
 from pydantic.errors import PydanticUserError
 from pydantic.main import BaseModel
 
-from ._internal import _config, _core_utils, _generate_schema, _typing_extra
+from ._internal import _config, _core_utils, _generate_schema, _schema_memo, _typing_extra, _utils, _validate_many
 from .config import ConfigDict
 from .json_schema import (
     DEFAULT_REF_TEMPLATE,
@@ -20,7 +20,9 @@ from .json_schema import (
     JsonSchemaKeyT,
     JsonSchemaMode,
     JsonSchemaValue,
+    cached_json_schema,
 )
+from .plugin import _plug_serializer, _plug_validator
 
 T = TypeVar('T')
 
@@ -28,6 +30,9 @@ if TYPE_CHECKING:
     # should be `set[int] | set[str] | dict[int, IncEx] | dict[str, IncEx] | None`, but mypy can't cope
     IncEx = Union[Set[int], Set[str], Dict[int, Any], Dict[str, Any]]
 
+# adapters kept by `TypeAdapter.cached`
+_adapter_cache: _utils.LRUCache[TypeAdapter[Any]] = _utils.LRUCache(max_size=256)
+
 
 def _get_schema(type_: Any, config_wrapper: _config.ConfigWrapper, parent_depth: int) -> CoreSchema:
     """`BaseModel` uses its own `__module__` to find out where it was defined
@@ -72,9 +77,9 @@ def _get_schema(type_: Any, config_wrapper: _config.ConfigWrapper, parent_depth:
     But at the very least this behavior is _subtly_ different from `BaseModel`'s.
     """
     local_ns = _typing_extra.parent_frame_namespace(parent_depth=parent_depth)
-    global_ns = sys._getframe(max(parent_depth - 1, 1)).f_globals.copy()
-    global_ns.update(local_ns or {})
-    gen = _generate_schema.GenerateSchema(config_wrapper, types_namespace=global_ns, typevars_map={})
+    global_ns = sys._getframe(max(parent_depth - 1, 1)).f_globals
+    types_namespace = _typing_extra.layered_namespace(local_ns, global_ns)
+    gen = _generate_schema.GenerateSchema(config_wrapper, types_namespace=types_namespace, typevars_map={})
     schema = gen.generate_schema(type_)
     schema = gen.collect_definitions(schema)
     return schema
@@ -151,25 +156,56 @@ class TypeAdapter(Generic[T]):
         except AttributeError:
             core_schema = _get_schema(type, config_wrapper, parent_depth=_parent_depth + 1)
 
-        core_schema = _core_utils.flatten_schema_defs(core_schema)
-        simplified_core_schema = _core_utils.inline_schema_defs(core_schema)
+        core_schema, simplified_core_schema = _core_utils.simplify_schema_defs(core_schema)
 
         core_config = config_wrapper.core_config(None)
         validator: SchemaValidator
         try:
             validator = _getattr_no_parents(type, '__pydantic_validator__')
         except AttributeError:
-            validator = SchemaValidator(simplified_core_schema, core_config)
+            validator = _plug_validator(SchemaValidator(simplified_core_schema, core_config), type)
 
         serializer: SchemaSerializer
         try:
             serializer = _getattr_no_parents(type, '__pydantic_serializer__')
         except AttributeError:
-            serializer = SchemaSerializer(simplified_core_schema, core_config)
+            serializer = _plug_serializer(SchemaSerializer(simplified_core_schema, core_config), type)
 
         self.core_schema = core_schema
         self.validator = validator
         self.serializer = serializer
+        self._type = type
+        self._core_config = core_config
+        self._list_validator: SchemaValidator | None = None
+        self._json_schema_cache: dict[Any, JsonSchemaValue] = {}
+
+    @classmethod
+    def cached(cls, type: Any, *, config: ConfigDict | None = None, _parent_depth: int = 2) -> TypeAdapter[Any]:
+        """Get a `TypeAdapter` for `type`, reusing the adapter built by a previous call with the same type and config.
+
+        This avoids building the schema, validator and serializer again when an adapter is created repeatedly, e.g.
+        inside a request handler. Adapters are kept in a process-wide cache of at most 256 adapters, the least recently
+        used adapter is discarded when it's full.
+
+        Types containing forward references or type variables are never cached, since they may resolve differently
+        depending on where the adapter is created; nor are adapters whose config can't be hashed.
+
+        Args:
+            type: The type to adapt.
+            config: The config to use for the type.
+
+        Returns:
+            The cached `TypeAdapter`, or a new one if there's none for `type` and `config`.
+        """
+        key = _schema_memo.memo_key(_config.ConfigWrapper(config or {}, check=False), type)
+        if key is None:
+            return cls(type, config=config, _parent_depth=_parent_depth + 1)
+        key = (cls, key)
+        adapter = _adapter_cache.get(key)
+        if adapter is None:
+            adapter = cls(type, config=config, _parent_depth=_parent_depth + 1)
+            _adapter_cache.set(key, adapter)
+        return adapter
 
     def validate_python(
         self,
@@ -192,6 +228,66 @@ class TypeAdapter(Generic[T]):
         """
         return self.validator.validate_python(__object, strict=strict, from_attributes=from_attributes, context=context)
 
+    @overload
+    def validate_many(
+        self,
+        __objects: Iterable[Any],
+        *,
+        strict: bool | None = ...,
+        from_attributes: bool | None = ...,
+        context: dict[str, Any] | None = ...,
+        continue_on_error: Literal[False] = ...,
+    ) -> list[T]:
+        ...
+
+    @overload
+    def validate_many(
+        self,
+        __objects: Iterable[Any],
+        *,
+        strict: bool | None = ...,
+        from_attributes: bool | None = ...,
+        context: dict[str, Any] | None = ...,
+        continue_on_error: Literal[True],
+    ) -> _validate_many.ValidateManyResult[T]:
+        ...
+
+    def validate_many(
+        self,
+        __objects: Iterable[Any],
+        *,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, Any] | None = None,
+        continue_on_error: bool = False,
+    ) -> list[T] | _validate_many.ValidateManyResult[T]:
+        """Validate many Python objects against the type in a single call to the validator.
+
+        Args:
+            __objects: The Python objects to validate.
+            strict: Whether to strictly check types.
+            from_attributes: Whether to extract data from object attributes.
+            context: Additional context to pass to the validator.
+            continue_on_error: Whether to validate the remaining objects when some are invalid, rather than raising
+                an error; each object is then validated in its own call, which is no faster than calling
+                `validate_python` on each object.
+
+        Returns:
+            The validated objects, or if `continue_on_error` is set, a `ValidateManyResult` holding the value
+                validated from each valid object and the errors of each invalid object, by the object's index.
+        """
+        if self._list_validator is None:
+            self._list_validator = _validate_many.build_list_validator(self.core_schema, self._core_config, self._type)
+        return _validate_many.validate_many(
+            self._list_validator,
+            self.validator,
+            __objects,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+            continue_on_error=continue_on_error,
+        )
+
     def validate_json(
         self, __data: str | bytes, *, strict: bool | None = None, context: dict[str, Any] | None = None
     ) -> T:
@@ -317,6 +413,9 @@ class TypeAdapter(Generic[T]):
     ) -> dict[str, Any]:
         """Generate a JSON schema for the adapted type.
 
+        The JSON schema is cached by the arguments it's generated with, unless `schema_generator.cache_json_schemas`
+        is `False`.
+
         Args:
             by_alias: Whether to use alias names for field names.
             ref_template: The format string used for generating $ref strings.
@@ -326,8 +425,9 @@ class TypeAdapter(Generic[T]):
         Returns:
             The JSON schema for the model as a dictionary.
         """
-        schema_generator_instance = schema_generator(by_alias=by_alias, ref_template=ref_template)
-        return schema_generator_instance.generate(self.core_schema, mode=mode)
+        return cached_json_schema(
+            self._json_schema_cache, self.core_schema, by_alias, ref_template, schema_generator, mode
+        )
 
     @staticmethod
     def json_schemas(
@@ -0,0 +1,7 @@
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+if pytest_benchmark is None:
+    collect_ignore_glob = ['test_*.py']
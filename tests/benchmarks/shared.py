@@ -0,0 +1,203 @@
+"""Model definitions and input data shared by the benchmarks.
+
+Each `define_*` function defines its models from scratch every time it's called, so it can be used both to benchmark
+class creation and, called once at import time, to provide models for the validation and serialization benchmarks.
+"""
+from __future__ import annotations
+
+import types
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+
+from typing_extensions import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+T = TypeVar('T')
+
+
+def define_flat_model() -> type[BaseModel]:
+    class FlatModel(BaseModel):
+        id: int
+        name: str
+        email: Optional[str] = None
+        score: float = 0.0
+        active: bool = True
+        created: datetime
+        tags: List[str] = []
+        attributes: Dict[str, int] = {}
+        code: Annotated[str, Field(max_length=16)] = 'x'
+        note: Optional[str] = None
+
+    return FlatModel
+
+
+def define_nested_model(depth: int = 8) -> type[BaseModel]:
+    class Leaf(BaseModel):
+        value: int
+        label: str
+
+    model: type[BaseModel] = Leaf
+    for level in range(depth):
+        namespace = {'__annotations__': {'child': model, 'siblings': List[model], 'level': int}, 'siblings': []}
+        model = type(BaseModel)(f'Level{level}', (BaseModel,), namespace)
+    return model
+
+
+def define_recursive_model() -> type[BaseModel]:
+    class Node(BaseModel):
+        value: int
+        children: List[Node] = []
+        parent_value: Optional[int] = None
+
+    Node.model_rebuild(_types_namespace={'Node': Node, 'List': List, 'Optional': Optional})
+    return Node
+
+
+def define_generic_model() -> type[BaseModel]:
+    class Item(BaseModel):
+        id: int
+        name: str
+
+    class Page(BaseModel, Generic[T]):
+        items: List[T]
+        total: int
+        next_cursor: Optional[str] = None
+
+    return Page[Item]
+
+
+def define_discriminated_union_model() -> type[BaseModel]:
+    class Cat(BaseModel):
+        pet_type: Literal['cat']
+        meows: int
+
+    class Dog(BaseModel):
+        pet_type: Literal['dog']
+        barks: float
+
+    class Lizard(BaseModel):
+        pet_type: Literal['reptile', 'lizard']
+        scales: bool
+
+    class Owner(BaseModel):
+        pets: List[Annotated[Union[Cat, Dog, Lizard], Field(discriminator='pet_type')]]
+
+    return Owner
+
+
+def define_large_list_model() -> type[BaseModel]:
+    class Point(BaseModel):
+        x: float
+        y: float
+        label: Optional[str] = None
+
+    class Polygon(BaseModel):
+        points: List[Point]
+
+    return Polygon
+
+
+def define_shared_submodel_model(width: int = 20) -> type[BaseModel]:
+    class Money(BaseModel):
+        amount: int
+        currency: str
+
+    class Address(BaseModel):
+        street: str
+        city: str
+        delivery_cost: Money
+
+    models: list[type[BaseModel]] = []
+    for i in range(width):
+        annotations = {'home': Address, 'work': Optional[Address], 'history': List[Address], 'price': Money}
+        namespace = {'__annotations__': annotations, 'work': None, 'history': []}
+        models.append(type(BaseModel)(f'Record{i}', (BaseModel,), namespace))
+
+    namespace = {'__annotations__': {f'record_{i}': model for i, model in enumerate(models)}}
+    return type(BaseModel)('Records', (BaseModel,), namespace)
+
+
+def define_model_graph(count: int = 1000) -> list[type[BaseModel]]:
+    """Define `count` models referring to each other, spread over 10 modules with 10 models sharing each name, so
+    generating their JSON schemas together has to resolve many name collisions.
+    """
+    models: list[type[BaseModel]] = []
+    for i in range(count):
+        annotations: dict[str, Any] = {'id': int, 'name': str}
+        namespace: dict[str, Any] = {'__annotations__': annotations, '__module__': f'models.module{i % 10}'}
+        if models:
+            annotations.update(parent=Optional[models[i // 2]], related=List[models[i * 7 % len(models)]])
+            namespace.update(parent=None, related=[])
+        models.append(type(BaseModel)(f'Model{i // 10}', (BaseModel,), namespace))
+    return models
+
+
+def define_wide_generic_model(width: int = 40) -> type[BaseModel]:
+    """Define a generic model with one field depending on its type variable and `width` fields which don't."""
+    field_types: list[Any] = [int, Optional[str], List[Dict[str, int]], Annotated[str, Field(max_length=16)], datetime]
+    annotations: dict[str, Any] = {f'field_{i}': field_types[i % len(field_types)] for i in range(width)}
+    annotations['value'] = T
+    return types.new_class('Wide', (BaseModel, Generic[T]), exec_body=lambda ns: ns.update(__annotations__=annotations))
+
+
+def flat_data() -> dict[str, Any]:
+    return {
+        'id': 123,
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'score': 9.5,
+        'active': False,
+        'created': '2032-04-23T10:20:30.400+02:30',
+        'tags': ['a', 'b', 'c'],
+        'attributes': {'x': 1, 'y': 2},
+        'code': 'ABC',
+    }
+
+
+def nested_data(depth: int = 8) -> dict[str, Any]:
+    data: dict[str, Any] = {'value': 1, 'label': 'leaf'}
+    for level in range(depth):
+        data = {'child': data, 'siblings': [data, data], 'level': level}
+    return data
+
+
+def recursive_data(depth: int = 6, width: int = 3) -> dict[str, Any]:
+    if depth == 0:
+        return {'value': 0}
+    return {'value': depth, 'children': [recursive_data(depth - 1, width) for _ in range(width)], 'parent_value': 1}
+
+
+def generic_data(size: int = 100) -> dict[str, Any]:
+    return {'items': [{'id': i, 'name': f'item {i}'} for i in range(size)], 'total': size, 'next_cursor': 'abc'}
+
+
+def discriminated_union_data(size: int = 100) -> dict[str, Any]:
+    pets = [
+        {'pet_type': 'cat', 'meows': 4},
+        {'pet_type': 'dog', 'barks': 3.5},
+        {'pet_type': 'lizard', 'scales': True},
+    ]
+    return {'pets': [pets[i % 3] for i in range(size)]}
+
+
+def shared_submodel_data(width: int = 20) -> dict[str, Any]:
+    address = {'street': 'Main Street', 'city': 'London', 'delivery_cost': {'amount': 1, 'currency': 'GBP'}}
+    record = {'home': address, 'history': [address, address], 'price': {'amount': 10, 'currency': 'GBP'}}
+    return {f'record_{i}': record for i in range(width)}
+
+
+def large_list_data(size: int = 10_000) -> dict[str, Any]:
+    return {'points': [{'x': i, 'y': i / 2, 'label': 'p' if i % 2 else None} for i in range(size)]}
+
+
+MODELS = {
+    'flat': (define_flat_model, flat_data),
+    'nested': (define_nested_model, nested_data),
+    'recursive': (define_recursive_model, recursive_data),
+    'generic': (define_generic_model, generic_data),
+    'discriminated_union': (define_discriminated_union_model, discriminated_union_data),
+    'large_list': (define_large_list_model, large_list_data),
+    'shared_submodel': (define_shared_submodel_model, shared_submodel_data),
+}
+"""Mapping of benchmark case name to a function defining the model and a function producing valid input data."""
@@ -0,0 +1,33 @@
+import pytest
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from .shared import define_flat_model
+
+
+@pytest.mark.parametrize('validate_assignment', [False, True])
+def test_field_assignment(benchmark, validate_assignment):
+    class Model(define_flat_model()):
+        model_config = ConfigDict(validate_assignment=validate_assignment)
+
+    model = Model(id=1, name='a', created='2023-01-01T00:00:00')
+
+    @benchmark
+    def assign():
+        for i in range(1000):
+            model.id = i
+            model.score = 1.5
+            model.name = 'b'
+
+
+def test_private_attribute_assignment(benchmark):
+    class Model(BaseModel):
+        x: int
+        _counter: int = PrivateAttr(0)
+
+    model = Model(x=1)
+
+    @benchmark
+    def assign():
+        for i in range(1000):
+            model._counter = i
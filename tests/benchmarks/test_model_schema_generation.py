@@ -0,0 +1,60 @@
+import pytest
+from typing_extensions import Literal
+
+from pydantic import TypeAdapter
+from pydantic._internal._core_utils import simplify_schema_defs
+from pydantic._internal._generics import _GENERIC_TYPES_CACHE
+from pydantic.json_schema import GenerateJsonSchema, models_json_schema
+
+from .shared import MODELS, define_model_graph, define_wide_generic_model
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_class_creation(benchmark, case):
+    define_model, _ = MODELS[case]
+    benchmark(define_model)
+
+
+def test_generic_model_parametrization(benchmark):
+    model = define_wide_generic_model()
+    parameters = [Literal[i] for i in range(20)]
+
+    @benchmark
+    def parametrize():
+        # parametrized models are cached, so clear the cache to create new models every run
+        _GENERIC_TYPES_CACHE.clear()
+        for parameter in parameters:
+            model[parameter]
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_type_adapter_creation(benchmark, case):
+    model = MODELS[case][0]()
+    benchmark(TypeAdapter, model)
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_json_schema(benchmark, case):
+    model = MODELS[case][0]()
+
+    @benchmark
+    def json_schema():
+        # a new generator each time, so nothing is reused between runs
+        GenerateJsonSchema().generate(model.__pydantic_core_schema__)
+
+
+def test_models_json_schema(benchmark):
+    models = [define_model() for define_model, _ in MODELS.values()]
+    benchmark(models_json_schema, [(model, 'validation') for model in models])
+
+
+@pytest.mark.parametrize('count', [100, 1000])
+def test_models_json_schema_large_graph(benchmark, count):
+    models = define_model_graph(count)
+    benchmark(models_json_schema, [(model, mode) for model in models for mode in ('validation', 'serialization')])
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_simplify_schema_defs(benchmark, case):
+    model = MODELS[case][0]()
+    benchmark(simplify_schema_defs, model.__pydantic_core_schema__)
@@ -0,0 +1,17 @@
+import pytest
+
+from .shared import MODELS
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_dump(benchmark, case):
+    define_model, make_data = MODELS[case]
+    instance = define_model().model_validate(make_data())
+    benchmark(instance.model_dump)
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_dump_json(benchmark, case):
+    define_model, make_data = MODELS[case]
+    instance = define_model().model_validate(make_data())
+    benchmark(instance.model_dump_json)
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from .shared import MODELS, define_flat_model, flat_data
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_validate(benchmark, case):
+    define_model, make_data = MODELS[case]
+    model = define_model()
+    data = make_data()
+    benchmark(model.model_validate, data)
+
+
+@pytest.mark.parametrize('case', MODELS)
+def test_model_validate_json(benchmark, case):
+    define_model, make_data = MODELS[case]
+    model = define_model()
+    data = json.dumps(make_data())
+    benchmark(model.model_validate_json, data)
+
+
+@pytest.mark.parametrize('batch_size', [100, 10_000])
+def test_model_validate_loop(benchmark, batch_size):
+    model = define_flat_model()
+    data = [flat_data() for _ in range(batch_size)]
+    benchmark(lambda: [model.model_validate(d) for d in data])
+
+
+@pytest.mark.parametrize('batch_size', [100, 10_000])
+def test_model_validate_many(benchmark, batch_size):
+    model = define_flat_model()
+    data = [flat_data() for _ in range(batch_size)]
+    benchmark(model.model_validate_many, data)
@@ -0,0 +1,90 @@
+import json
+from collections import Counter, deque
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import Counter as TypingCounter
+from typing import DefaultDict, Deque, List
+from uuid import UUID, uuid4
+
+import pytest
+from typing_extensions import Annotated
+
+from pydantic import Field, TypeAdapter
+from pydantic.types import UUID4
+
+Currency = Enum('Currency', {f'C{i}': f'c{i}' for i in range(150)}, type=str)
+StatusCode = IntEnum('StatusCode', {f'S{i}': i for i in range(100, 600)})
+
+
+@pytest.mark.parametrize('enum_type', [Currency, StatusCode])
+def test_enum_list_validation(benchmark, enum_type):
+    ta = TypeAdapter(List[enum_type])
+    members = list(enum_type)
+    data = [members[i % len(members)].value for i in range(10_000)]
+    benchmark(ta.validate_python, data)
+
+
+def test_enum_list_validation_json(benchmark):
+    ta = TypeAdapter(List[Currency])
+    data = json.dumps([f'c{i % 150}' for i in range(10_000)])
+    benchmark(ta.validate_json, data)
+
+
+DECIMAL_STRINGS = [f'{i}.{i % 100:02d}' for i in range(10_000)]
+
+
+@pytest.mark.parametrize('input_type', [str, float, Decimal])
+def test_decimal_list_validation(benchmark, input_type):
+    ta = TypeAdapter(List[Decimal])
+    data = [input_type(s) for s in DECIMAL_STRINGS]
+    benchmark(ta.validate_python, data)
+
+
+def test_constrained_decimal_list_validation_json(benchmark):
+    ta = TypeAdapter(List[Annotated[Decimal, Field(max_digits=12, decimal_places=2, ge=0)]])
+    data = json.dumps(DECIMAL_STRINGS)
+    benchmark(ta.validate_json, data)
+
+
+UUID_STRINGS = [str(uuid4()) for _ in range(10_000)]
+
+
+@pytest.mark.parametrize('uuid_type', [UUID, UUID4])
+def test_uuid_list_validation(benchmark, uuid_type):
+    ta = TypeAdapter(List[uuid_type])
+    benchmark(ta.validate_python, UUID_STRINGS)
+
+
+def test_uuid_list_validation_json(benchmark):
+    ta = TypeAdapter(List[UUID])
+    data = json.dumps(UUID_STRINGS)
+    benchmark(ta.validate_json, data)
+
+
+def test_deque_validation_json(benchmark):
+    ta = TypeAdapter(Deque[int])
+    data = json.dumps(list(range(10_000)))
+    benchmark(ta.validate_json, data)
+
+
+@pytest.mark.parametrize('mode', ['python', 'json'])
+def test_deque_serialization(benchmark, mode):
+    ta = TypeAdapter(Deque[int])
+    data = deque(range(10_000))
+    benchmark(ta.dump_json if mode == 'json' else ta.dump_python, data)
+
+
+COUNTS = Counter({f'key{i}': i for i in range(100_000)})
+
+
+@pytest.mark.parametrize('mapping_type', [TypingCounter[str], DefaultDict[str, int]])
+def test_mapping_validation_json(benchmark, mapping_type):
+    ta = TypeAdapter(mapping_type)
+    data = json.dumps(COUNTS)
+    benchmark(ta.validate_json, data)
+
+
+@pytest.mark.parametrize('mode', ['python', 'json'])
+def test_counter_serialization(benchmark, mode):
+    ta = TypeAdapter(TypingCounter[str])
+    benchmark(ta.dump_json if mode == 'json' else ta.dump_python, COUNTS)
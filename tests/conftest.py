@@ -17,6 +17,14 @@ def pytest_addoption(parser):
     parser.addoption('--test-mypy', action='store_true', help='run mypy tests')
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # run each benchmark just once as a regular test unless benchmarking was asked for explicitly,
+    # see `make benchmark`
+    if hasattr(config.option, 'benchmark_disable') and not config.option.benchmark_only:
+        config.option.benchmark_disable = True
+
+
 def _extract_source_code_from_function(function):
     if function.__code__.co_argcount:
         raise RuntimeError(f'function {function.__qualname__} cannot have any arguments')
@@ -47,6 +55,15 @@ def disable_error_urls():
     os.environ['PYDANTIC_ERRORS_OMIT_URL'] = 'true'
 
 
+@pytest.fixture
+def frequent_thread_switches():
+    # make threads switch as often as possible, so race conditions in concurrency tests are likely to show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
 @pytest.fixture
 def create_module(tmp_path, request):
     def run(source_code_or_function, rewrite_assertions=True):
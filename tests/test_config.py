@@ -1,17 +1,20 @@
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext as does_not_raise
 from decimal import Decimal
 from inspect import signature
 from typing import Any, ContextManager, Iterable, NamedTuple, Type, Union, get_type_hints
 
 from dirty_equals import HasRepr, IsPartialDict
-from pydantic_core import SchemaError
+from pydantic_core import CoreSchema, SchemaError, SchemaSerializer, SchemaValidator
 
 from pydantic import (
     BaseConfig,
     BaseModel,
     Field,
+    GetCoreSchemaHandler,
     PrivateAttr,
     PydanticSchemaGenerationError,
     ValidationError,
@@ -19,6 +22,7 @@ from pydantic import (
     validate_call,
 )
 from pydantic._internal._config import ConfigWrapper, config_defaults
+from pydantic._internal._mock_val_ser import MockSerializer, MockValidator
 from pydantic.config import ConfigDict
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 from pydantic.errors import PydanticUserError
@@ -632,3 +636,83 @@ def test_config_inheritance_with_annotations():
         model_config: ConfigDict = {'str_to_lower': True}
 
     assert Child.model_config == {'extra': 'allow', 'str_to_lower': True}
+
+
+@pytest.mark.parametrize('mode', ['validation', 'construct', 'json_schema'])
+def test_config_defer_build(mode):
+    class MyModel(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        x: int
+
+    assert MyModel.__pydantic_complete__ is False
+    assert '__pydantic_core_schema__' not in MyModel.__dict__
+    assert isinstance(MyModel.__pydantic_validator__, MockValidator)
+    assert isinstance(MyModel.__pydantic_serializer__, MockSerializer)
+    assert str(signature(MyModel)) == '(*, x: int) -> None'
+
+    if mode == 'validation':
+        assert MyModel(x='1').model_dump() == {'x': 1}
+    elif mode == 'construct':
+        assert MyModel.model_construct(x=1).model_dump_json() == '{"x":1}'
+    else:
+        assert MyModel.model_json_schema() == {
+            'title': 'MyModel',
+            'type': 'object',
+            'properties': {'x': {'title': 'X', 'type': 'integer'}},
+            'required': ['x'],
+        }
+
+    assert MyModel.__pydantic_complete__ is True
+    assert isinstance(MyModel.__pydantic_validator__, SchemaValidator)
+    assert isinstance(MyModel.__pydantic_serializer__, SchemaSerializer)
+
+
+def test_config_defer_build_concurrent_first_use(frequent_thread_switches):
+    builds = []
+
+    class MyModel(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        x: int
+
+        @classmethod
+        def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+            builds.append(source)
+            return handler(source)
+
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+
+    def validate(x: int) -> MyModel:
+        barrier.wait()
+        return MyModel(x=x)
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        models = list(pool.map(validate, range(n_threads)))
+
+    assert [m.x for m in models] == list(range(n_threads))
+    assert builds == [MyModel]
+
+
+def test_config_defer_build_stale_mock():
+    class MyModel(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        x: int
+
+    mock_validator = MyModel.__pydantic_validator__
+    assert MyModel.model_rebuild() is True
+    # e.g. another thread completed the model after this mock was retrieved
+    assert mock_validator.validate_python({'x': 1}).x == 1
+    assert mock_validator.rebuild() is MyModel.__pydantic_validator__
+
+
+def test_config_defer_build_undefined_type():
+    class MyModel(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        x: 'Undefined'  # noqa F821
+
+    with pytest.raises(PydanticUserError, match='`MyModel` is not fully defined'):
+        MyModel(x=1)
@@ -4,7 +4,9 @@ import json
 import platform
 import re
 import sys
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, IntEnum
 from typing import (
     Any,
@@ -44,19 +46,21 @@ from pydantic import (
     ValidationError,
     ValidationInfo,
     computed_field,
+    field_serializer,
     field_validator,
     model_validator,
 )
+from pydantic._internal import _generics
 from pydantic._internal._core_utils import collect_invalid_schemas
 from pydantic._internal._generics import (
     _GENERIC_TYPES_CACHE,
-    _LIMITED_DICT_SIZE,
-    LimitedDict,
+    DEFAULT_GENERIC_TYPES_CACHE_SIZE,
     generic_recursion_self_type,
     iter_contained_typevars,
     recursively_defined_type_refs,
     replace_types,
 )
+from pydantic.generics import generic_types_cache_info, set_generic_types_cache_size
 
 
 @pytest.fixture()
@@ -375,7 +379,9 @@ def test_caches_get_cleaned_up(clean_cache):
     gc.collect(0)
     gc.collect(1)
     gc.collect(2)
-    assert len(_GENERIC_TYPES_CACHE) < initial_types_cache_size + _LIMITED_DICT_SIZE
+    # only the most recently used models are kept alive, each of them cached with 3 keys
+    assert _GENERIC_TYPES_CACHE.current_size == DEFAULT_GENERIC_TYPES_CACHE_SIZE
+    assert len(_GENERIC_TYPES_CACHE) == initial_types_cache_size + 3 * DEFAULT_GENERIC_TYPES_CACHE_SIZE
 
 
 @pytest.mark.skipif(platform.python_implementation() == 'PyPy', reason='PyPy does not play nice with PyO3 gc')
@@ -402,7 +408,9 @@ def test_caches_get_cleaned_up_with_aliased_parametrized_bases(clean_cache):
     gc.collect(0)
     gc.collect(1)
     gc.collect(2)
-    assert len(_GENERIC_TYPES_CACHE) < types_cache_size + _LIMITED_DICT_SIZE
+    # both models are among the most recently used, which are kept alive
+    assert _GENERIC_TYPES_CACHE.current_size == 2
+    assert len(_GENERIC_TYPES_CACHE) == types_cache_size + 5
 
 
 def test_generics_work_with_many_parametrized_base_models(clean_cache):
@@ -433,7 +441,7 @@ def test_generics_work_with_many_parametrized_base_models(clean_cache):
         generics.append(Working)
 
     target_size = cache_size + count_create_models * 3 + 2
-    assert len(_GENERIC_TYPES_CACHE) < target_size + _LIMITED_DICT_SIZE
+    assert len(_GENERIC_TYPES_CACHE) == target_size
     del models
     del generics
 
@@ -1725,14 +1733,6 @@ def test_generic_recursive_models_with_a_concrete_parameter(create_module):
 
 
 def test_generic_recursive_models_complicated(create_module):
-    """
-    Note: If we drop the use of LimitedDict and use WeakValueDictionary only, this test will fail if run by itself.
-        This is due to weird behavior with the WeakValueDictionary used for caching.
-        As part of the next batch of generics work, we should attempt to fix this if possible.
-        In the meantime, if this causes issues, or the test otherwise starts failing, please make it xfail
-        with strict=False
-    """
-
     @create_module
     def module():
         from typing import Generic, TypeVar, Union
@@ -2159,44 +2159,130 @@ def test_generic_recursion_contextvar():
     assert not recursively_defined_type_refs()
 
 
-def test_limited_dict():
-    d = LimitedDict(10)
-    d[1] = '1'
-    d[2] = '2'
-    assert list(d.items()) == [(1, '1'), (2, '2')]
-    for no in '34567890':
-        d[int(no)] = no
-    assert list(d.items()) == [
-        (1, '1'),
-        (2, '2'),
-        (3, '3'),
-        (4, '4'),
-        (5, '5'),
-        (6, '6'),
-        (7, '7'),
-        (8, '8'),
-        (9, '9'),
-        (0, '0'),
-    ]
-    d[11] = '11'
-
-    # reduce size to 9 after setting 11
-    assert len(d) == 9
-    assert list(d.items()) == [
-        (3, '3'),
-        (4, '4'),
-        (5, '5'),
-        (6, '6'),
-        (7, '7'),
-        (8, '8'),
-        (9, '9'),
-        (0, '0'),
-        (11, '11'),
-    ]
-    d[12] = '12'
-    assert len(d) == 10
-    d[13] = '13'
-    assert len(d) == 9
+def test_generic_types_cache_is_lru(clean_cache, monkeypatch):
+    monkeypatch.setattr(_generics, '_GENERIC_TYPES_CACHE', _generics.GenericTypesCache(max_size=2))
+    T = TypeVar('T')
+
+    class Model(BaseModel, Generic[T]):
+        x: T
+
+    int_model_id = id(Model[int])
+    Model[str]
+    assert id(Model[int]) == int_model_id  # recently used, so still alive
+    Model[bytes]
+    Model[float]
+    gc.collect()
+    info = generic_types_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 4, 2, 2, 2)
+
+    set_generic_types_cache_size(1)
+    assert generic_types_cache_info()[2:] == (3, 1, 1)
+
+    with pytest.raises(ValueError, match='max_size must not be negative, got -1'):
+        set_generic_types_cache_size(-1)
+    assert generic_types_cache_info()[2:] == (3, 1, 1)
+
+
+def test_generic_types_cache_keeps_unreferenced_models(clean_cache):
+    T = TypeVar('T')
+
+    class Model(BaseModel, Generic[T]):
+        x: T
+
+    hits = generic_types_cache_info().hits
+    model_id = id(Model[int])
+    gc.collect()
+    assert id(Model[int]) == model_id
+    assert generic_types_cache_info().hits == hits + 1
+
+
+def test_parametrized_model_reuses_origin_field_schemas():
+    calls = []
+
+    class Counted(str):
+        @classmethod
+        def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+            calls.append(source_type)
+            return core_schema.no_info_after_validator_function(cls, handler(str))
+
+    T = TypeVar('T')
+
+    class Model(BaseModel, Generic[T]):
+        counted: Counted
+        items: List[T]
+        upper: str = 'a'
+
+        @field_validator('upper')
+        @classmethod
+        def to_upper(cls, v: str) -> str:
+            return v.upper()
+
+    assert len(calls) == 1
+    IntModel, StrModel = Model[int], Model[str]
+    assert len(calls) == 1
+
+    m = IntModel(counted='x', items=['1'], upper='b')
+    assert type(m.counted) is Counted
+    assert m.model_dump() == {'counted': 'x', 'items': [1], 'upper': 'B'}
+    assert StrModel(counted='y', items=['1']).model_dump() == {'counted': 'y', 'items': ['1'], 'upper': 'a'}
+    with pytest.raises(ValidationError):
+        StrModel(counted='y', items=[1])
+
+
+def test_parametrized_model_binds_field_decorators_to_itself():
+    T = TypeVar('T')
+
+    class Model(BaseModel, Generic[T]):
+        a: str
+        b: T
+
+        @field_validator('a')
+        @classmethod
+        def add_class_name(cls, v: str) -> str:
+            return f'{v}:{cls.__name__}'
+
+        @field_serializer('b')
+        def serialize_b(self, v: Any) -> str:
+            return f'{v}:{type(self).__name__}'
+
+    assert Model[int](a='x', b=1).model_dump() == {'a': 'x:Model[int]', 'b': '1:Model[int]'}
+
+
+def test_parametrized_model_regenerates_field_schemas_referring_to_models():
+    T = TypeVar('T')
+
+    class Inner(BaseModel):
+        x: int
+
+    class Model(BaseModel, Generic[T]):
+        inner: Inner
+        value: T
+
+    IntModel = Model[int]
+    assert IntModel(inner={'x': '1'}, value='2').model_dump() == {'inner': {'x': 1}, 'value': 2}
+    assert IntModel.model_json_schema()['$defs'] == {'Inner': Inner.model_json_schema()}
+
+
+def test_concurrent_parametrization_creates_one_model(clean_cache, frequent_thread_switches):
+    T = TypeVar('T')
+
+    class Model(BaseModel, Generic[T]):
+        value: T
+        values: List[T]
+
+    n_threads = 8
+    for parameter in (int, str, float, List[int], Dict[str, int]):
+        barrier = threading.Barrier(n_threads)
+
+        def parametrize(_: int, barrier: threading.Barrier = barrier, parameter: Any = parameter) -> Any:
+            barrier.wait()
+            return Model[parameter]
+
+        misses = generic_types_cache_info().misses
+        with ThreadPoolExecutor(n_threads) as pool:
+            models = list(pool.map(parametrize, range(n_threads)))
+        assert all(model is models[0] for model in models)
+        assert generic_types_cache_info().misses == misses + 1
 
 
 def test_construct_generic_model_with_validation():
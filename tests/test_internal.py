@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import pytest
 from pydantic_core import core_schema as cs
 
-from pydantic._internal._core_utils import flatten_schema_defs, inline_schema_defs
+from pydantic._internal._core_utils import flatten_schema_defs, inline_schema_defs, simplify_schema_defs
 from pydantic._internal._repr import Representation
 
 
@@ -177,6 +177,7 @@ from pydantic._internal._repr import Representation
 def test_build_schema_defs(input_schema: cs.CoreSchema, flattened: cs.CoreSchema, inlined: cs.CoreSchema):
     assert flatten_schema_defs(input_schema) == flattened
     assert inline_schema_defs(input_schema) == inlined
+    assert simplify_schema_defs(input_schema) == (flattened, inlined)
 
 
 def test_representation_integrations():
@@ -1,3 +1,4 @@
+import io
 import json
 import math
 import re
@@ -4633,3 +4634,106 @@ def test_inclusion_of_defaults():
         'title': 'Model',
         'type': 'object',
     }
+
+
+def test_model_json_schema_cached(mocker):
+    class Model(BaseModel):
+        x: int = Field(alias='X')
+
+    generate = mocker.spy(GenerateJsonSchema, 'generate')
+    schema = Model.model_json_schema()
+    assert Model.model_json_schema() == schema
+    assert generate.call_count == 1
+    expected = Model.model_json_schema()
+
+    # the returned schema can be modified without affecting the cache
+    schema['properties']['X']['title'] = 'changed'
+    assert Model.model_json_schema()['properties']['X']['title'] == 'X'
+    assert generate.call_count == 1
+
+    assert Model.model_json_schema(by_alias=False)['properties'].keys() == {'x'}
+    Model.model_json_schema(mode='serialization')
+    Model.model_json_schema(ref_template='/components/schemas/{model}')
+    assert generate.call_count == 4
+
+    Model.model_rebuild(force=True)
+    assert Model.model_json_schema() == expected
+    assert generate.call_count == 5
+
+
+def test_model_json_schema_cache_opt_out():
+    class Counter(GenerateJsonSchema):
+        cache_json_schemas = False
+        count = 0
+
+        def generate(self, schema, mode='validation'):
+            json_schema = super().generate(schema, mode=mode)
+            Counter.count += 1
+            json_schema['description'] = f'generated {Counter.count} times'
+            return json_schema
+
+    class Model(BaseModel):
+        x: int
+
+    assert Model.model_json_schema(schema_generator=Counter)['description'] == 'generated 1 times'
+    assert Model.model_json_schema(schema_generator=Counter)['description'] == 'generated 2 times'
+    ta = TypeAdapter(List[int])
+    assert ta.json_schema(schema_generator=Counter)['description'] == 'generated 3 times'
+    assert ta.json_schema(schema_generator=Counter)['description'] == 'generated 4 times'
+
+
+def test_type_adapter_json_schema_cached(mocker):
+    ta = TypeAdapter(List[int])
+    generate = mocker.spy(GenerateJsonSchema, 'generate')
+    assert ta.json_schema() == {'items': {'type': 'integer'}, 'type': 'array'}
+    assert ta.json_schema() == {'items': {'type': 'integer'}, 'type': 'array'}
+    assert generate.call_count == 1
+
+
+def test_models_json_schema_many_collisions():
+    models = []
+    for i in range(30):
+        annotations = {'x': int}
+        namespace = {'__annotations__': annotations, '__module__': f'module{i % 3}'}
+        if models:
+            annotations['prev'] = Optional[models[-1]]
+            namespace['prev'] = None
+        models.append(type(BaseModel)(f'Model{i // 3}', (BaseModel,), namespace))
+
+    key_map, schema = models_json_schema([(model, 'validation') for model in models])
+    defs = schema['$defs']
+    assert len(defs) == 30
+    # names collide across modules, so every definition is qualified by its module
+    assert {key_map[(model, 'validation')] for model in models} == set(defs)
+    assert all(name.startswith('module') for name in defs)
+
+    refs = set(re.findall(r"'\$ref': '#/\$defs/([^']+)'", repr(schema)))
+    assert refs == {key_map[(model, 'validation')] for model in models[:-1]}
+
+
+@pytest.mark.parametrize('indent', [None, 0, 2])
+def test_write_json_schema(indent):
+    class Sub(BaseModel):
+        b: List[int] = [1]
+        c: str = Field('é', description='not ascii')
+
+    class Model(BaseModel):
+        z: Sub
+        a: Optional[Sub] = None
+        e: Dict[str, Sub] = {}
+
+    expected = json.dumps(GenerateJsonSchema().generate(Model.__pydantic_core_schema__), indent=indent)
+
+    text_stream = io.StringIO()
+    GenerateJsonSchema().write(Model.__pydantic_core_schema__, text_stream, indent=indent)
+    assert text_stream.getvalue() == expected
+
+    binary_stream = io.BytesIO()
+    GenerateJsonSchema().write(Model.__pydantic_core_schema__, binary_stream, indent=indent)
+    assert binary_stream.getvalue() == expected.encode()
+
+
+def test_write_json_schema_without_defs():
+    stream = io.StringIO()
+    GenerateJsonSchema().write(core_schema.list_schema(core_schema.int_schema()), stream, mode='serialization')
+    assert json.loads(stream.getvalue()) == {'items': {'type': 'integer'}, 'type': 'array'}
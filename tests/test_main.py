@@ -40,6 +40,7 @@ from pydantic import (
     constr,
     field_validator,
 )
+from pydantic._internal._generate_schema import GenerateSchema
 from pydantic.type_adapter import TypeAdapter
 
 
@@ -1579,6 +1580,73 @@ def test_frozen_field():
     ]
 
 
+def test_assignment_handlers_per_class():
+    class Parent(BaseModel):
+        x: int
+        _private: int = PrivateAttr(0)
+
+        @property
+        def double(self) -> int:
+            return self.x * 2
+
+        @double.setter
+        def double(self, value: int) -> None:
+            self.x = value // 2
+
+    class Validating(Parent):
+        model_config = ConfigDict(validate_assignment=True)
+
+    class Frozen(Parent):
+        model_config = ConfigDict(frozen=True)
+
+    assert set(Parent.__pydantic_setattr_handlers__) == {'x', '_private'}
+
+    parent = Parent(x=1)
+    parent.x = 'a'
+    assert parent.x == 'a'
+    parent.double = 8
+    parent._private = 2
+    assert (parent.x, parent._private, parent.model_fields_set) == (4, 2, {'x'})
+
+    validating = Validating(x=1)
+    with pytest.raises(ValidationError, match='Input should be a valid integer'):
+        validating.x = 'a'
+    validating.x = '2'
+    assert validating.x == 2
+
+    frozen = Frozen(x=1)
+    with pytest.raises(ValidationError, match='Instance is frozen'):
+        frozen.x = 2
+    frozen._private = 3
+    assert frozen._private == 3
+
+
+def test_assignment_follows_config_changes():
+    class Model(BaseModel):
+        x: int
+        _private: int = 0
+
+    m = Model(x=1)
+    Model.model_config['validate_assignment'] = True
+    with pytest.raises(ValidationError, match='Input should be a valid integer'):
+        m.x = 'a'
+    m._private = 1
+    assert m._private == 1
+
+    Model.model_config['frozen'] = True
+    with pytest.raises(ValidationError, match='Instance is frozen'):
+        m.x = 2
+
+    Model.model_rebuild(force=True)
+    with pytest.raises(ValidationError, match='Instance is frozen'):
+        m.x = 2
+
+    Model.model_config['frozen'] = False
+    Model.model_config['validate_assignment'] = False
+    m.x = 'b'
+    assert m.x == 'b'
+
+
 def test_repr_field():
     class Model(BaseModel):
         a: int = Field()
@@ -2139,6 +2207,77 @@ def test_model_validate_json_strict() -> None:
     ]
 
 
+def test_model_validate_many() -> None:
+    class Model(BaseModel):
+        x: int
+        y: str = 'y'
+
+    assert Model.model_validate_many([{'x': '1'}, Model(x=2, y='a')]) == [Model(x=1), Model(x=2, y='a')]
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model.model_validate_many([{'x': 1}, {'x': 'a'}, {}])
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            'type': 'int_parsing',
+            'loc': (1, 'x'),
+            'msg': 'Input should be a valid integer, unable to parse string as an integer',
+            'input': 'a',
+        },
+        {'type': 'missing', 'loc': (2, 'x'), 'msg': 'Field required', 'input': {}},
+    ]
+
+    result = Model.model_validate_many([{'x': 1}, {'x': 'a'}, {}, {'x': 4}], continue_on_error=True)
+    assert result.values == {0: Model(x=1), 3: Model(x=4)}
+    assert {index: [(e['type'], e['loc']) for e in errors] for index, errors in result.errors.items()} == {
+        1: [('int_parsing', ('x',))],
+        2: [('missing', ('x',))],
+    }
+
+
+def test_model_validate_many_continue_on_error_validates_once() -> None:
+    calls = []
+
+    class Model(BaseModel):
+        x: int
+
+        @field_validator('x')
+        @classmethod
+        def record(cls, v: int) -> int:
+            calls.append(v)
+            return v
+
+    result = Model.model_validate_many([{'x': 1}, {'x': 'a'}, {'x': 2}], continue_on_error=True)
+    assert calls == [1, 2]
+    assert {index: m.x for index, m in result.values.items()} == {0: 1, 2: 2}
+    assert list(result.errors) == [1]
+
+
+def test_model_validate_many_strict_and_context() -> None:
+    class Model(BaseModel):
+        x: int
+
+        @field_validator('x')
+        @classmethod
+        def add_offset(cls, v: int, info: ValidationInfo) -> int:
+            return v + (info.context or {}).get('offset', 0)
+
+    assert Model.model_validate_many([{'x': 1}, {'x': 2}], context={'offset': 10}) == [Model(x=11), Model(x=12)]
+    with pytest.raises(ValidationError):
+        Model.model_validate_many([{'x': '1'}], strict=True)
+
+
+def test_model_validate_many_after_rebuild() -> None:
+    class Model(BaseModel):
+        x: 'Undefined'
+
+    with pytest.raises(PydanticUserError, match='`Model` is not fully defined'):
+        Model.model_validate_many([{'x': 1}])
+
+    Undefined = int
+    Model.model_rebuild()
+    assert Model.model_validate_many([{'x': '1'}]) == [Model(x=1)]
+
+
 def test_validate_python_context() -> None:
     contexts: List[Any] = [None, None, {'foo': 'bar'}]
 
@@ -2444,3 +2583,38 @@ def test_get_core_schema_return_new_ref() -> None:
     assert 'inner was here' in str(cs)
 
     assert OuterModel(inner=InnerModel()).x == 2
+
+
+def test_reuse_sub_model_schema(mocker) -> None:
+    class Money(BaseModel):
+        amount: int
+
+    class Address(BaseModel):
+        city: str
+        cost: Money
+
+    address_schema = repr(Address.__pydantic_core_schema__)
+    model_schema = mocker.spy(GenerateSchema, '_model_schema')
+
+    class Model(BaseModel):
+        home: Address
+        work: Optional[Address] = None
+        history: List[Address] = []
+        price: Money
+
+    # only `Model` itself is generated, the schemas of `Address` and `Money` are reused
+    assert model_schema.call_count == 1
+    # the stored schema of `Address` isn't modified by being reused
+    assert repr(Address.__pydantic_core_schema__) == address_schema
+    # and the parent schema defines each model once
+    assert str(Model.__pydantic_core_schema__).count("'type': 'model', 'cls': <class") == 3
+
+    m = Model(
+        home={'city': 'a', 'cost': {'amount': 1}}, history=[{'city': 'b', 'cost': {'amount': 2}}], price={'amount': 3}
+    )
+    assert m.model_dump() == {
+        'home': {'city': 'a', 'cost': {'amount': 1}},
+        'work': None,
+        'history': [{'city': 'b', 'cost': {'amount': 2}}],
+        'price': {'amount': 3},
+    }
@@ -0,0 +1,138 @@
+from typing import Any, List
+
+import pytest
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+from pydantic.plugin import PluginCall, ValidationPlugin, install_plugin, uninstall_plugin
+
+
+class RecordingPlugin(ValidationPlugin):
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+
+    def on_enter(self, call: PluginCall) -> None:
+        self.events.append(('enter', call.schema_type, call.method, call.input))
+
+    def on_success(self, call: PluginCall, result: Any) -> None:
+        self.events.append(('success', call.method, result))
+
+    def on_error(self, call: PluginCall, error: Exception) -> None:
+        self.events.append(('error', call.method, type(error)))
+
+
+@pytest.fixture
+def plugin():
+    plugin = RecordingPlugin()
+    install_plugin(plugin)
+    yield plugin
+    uninstall_plugin(plugin)
+
+
+def test_model_validation(plugin):
+    class Model(BaseModel):
+        model_config = ConfigDict(validate_assignment=True)
+
+        x: int
+
+    m = Model.model_validate({'x': '1'})
+    assert plugin.events == [('enter', Model, 'validate_python', {'x': '1'}), ('success', 'validate_python', m)]
+    plugin.events.clear()
+
+    with pytest.raises(ValidationError):
+        Model.model_validate_json('{"x": "a"}')
+    assert plugin.events == [
+        ('enter', Model, 'validate_json', '{"x": "a"}'),
+        ('error', 'validate_json', ValidationError),
+    ]
+    plugin.events.clear()
+
+    m.x = 2
+    assert plugin.events == [('enter', Model, 'validate_assignment', m), ('success', 'validate_assignment', m)]
+    plugin.events.clear()
+
+    assert m.model_dump() == {'x': 2}
+    assert m.model_dump_json() == '{"x":2}'
+    assert plugin.events == [
+        ('enter', Model, 'to_python', m),
+        ('success', 'to_python', {'x': 2}),
+        ('enter', Model, 'to_json', m),
+        ('success', 'to_json', b'{"x":2}'),
+    ]
+
+
+def test_type_adapter(plugin):
+    ta = TypeAdapter(List[int])
+    assert ta.validate_python(['1']) == [1]
+    assert ta.dump_json([1]) == b'[1]'
+    assert plugin.events == [
+        ('enter', List[int], 'validate_python', ['1']),
+        ('success', 'validate_python', [1]),
+        ('enter', List[int], 'to_json', [1]),
+        ('success', 'to_json', b'[1]'),
+    ]
+
+
+def test_validate_many(plugin):
+    class Model(BaseModel):
+        x: int
+
+    ms = Model.model_validate_many([{'x': 1}])
+    assert plugin.events == [
+        ('enter', List[Model], 'validate_python', [{'x': 1}]),
+        ('success', 'validate_python', ms),
+    ]
+    plugin.events.clear()
+
+    ta = TypeAdapter(int)
+    result = ta.validate_many(['1', 'a'], continue_on_error=True)
+    assert result.values == {0: 1}
+    assert plugin.events == [
+        ('enter', int, 'validate_python', '1'),
+        ('success', 'validate_python', 1),
+        ('enter', int, 'validate_python', 'a'),
+        ('error', 'validate_python', ValidationError),
+    ]
+    plugin.events.clear()
+
+    assert ta.validate_many(['2']) == [2]
+    assert plugin.events == [('enter', List[int], 'validate_python', ['2']), ('success', 'validate_python', [2])]
+
+
+def test_uninstall_plugin(plugin):
+    class Model(BaseModel):
+        x: int
+
+    other_plugin = RecordingPlugin()
+    install_plugin(other_plugin)
+    uninstall_plugin(other_plugin)
+    with pytest.raises(ValueError):
+        uninstall_plugin(other_plugin)
+
+    Model(x=1)
+    assert len(plugin.events) == 2
+    assert other_plugin.events == []
+
+
+def test_no_plugin_installed():
+    class Model(BaseModel):
+        x: int
+
+    assert type(Model.__pydantic_validator__) is SchemaValidator
+    assert type(Model.__pydantic_serializer__) is SchemaSerializer
+    ta = TypeAdapter(int)
+    assert type(ta.validator) is SchemaValidator
+    assert type(ta.serializer) is SchemaSerializer
+
+
+def test_installed_after_model_creation():
+    class Model(BaseModel):
+        x: int
+
+    plugin = RecordingPlugin()
+    install_plugin(plugin)
+    try:
+        Model(x=1)
+    finally:
+        uninstall_plugin(plugin)
+    assert plugin.events == []
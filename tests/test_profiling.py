@@ -0,0 +1,175 @@
+from typing import Generic, List, Optional, TypeVar
+
+import pytest
+from dirty_equals import IsFloat, IsList, IsPartialDict
+from typing_extensions import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter, ValidationError
+from pydantic.plugin import install_plugin, uninstall_plugin
+from pydantic.profiling import ModelBuildProfile, ValidationProfiler, record_schema_builds, schema_build_report
+
+
+def model_name(cls):
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def test_record_schema_builds():
+    with record_schema_builds() as profiles:
+
+        class Inner(BaseModel):
+            x: int
+
+        class Outer(BaseModel):
+            inner: Inner
+            inners: List[Inner]
+            name: Optional[str] = None
+
+    assert [p.model for p in profiles] == [model_name(Inner), model_name(Outer)]
+    inner_profile, outer_profile = profiles
+    assert inner_profile.definition_count == 1
+    # definitions, definition-ref, model, model-fields, model-field, int
+    assert inner_profile.node_count == 6
+    assert outer_profile.definition_count == 2
+    assert outer_profile.node_count > inner_profile.node_count
+    for profile in profiles:
+        assert 0 < profile.schema_time < profile.total_time
+        assert 0 < profile.validator_time < profile.total_time
+        assert {'remove_unnecessary_invalid_definitions', 'flatten_refs', 'inline_refs'} <= profile.pass_times.keys()
+
+    class NotRecorded(BaseModel):
+        x: int
+
+    assert len(profiles) == 2
+
+
+def test_record_rebuilds_and_parametrizations():
+    T = TypeVar('T')
+
+    class Deferred(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        x: int
+
+    class Page(BaseModel, Generic[T]):
+        items: List[T]
+
+    with record_schema_builds() as outer_profiles:
+        with record_schema_builds() as profiles:
+            Deferred(x=1)
+            IntPage = Page[int]
+
+    assert [p.model for p in profiles] == [model_name(Deferred), model_name(IntPage)]
+    assert outer_profiles == profiles
+
+
+def test_schema_build_report():
+    profiles = [
+        ModelBuildProfile('a.Fast', total_time=0.001, pass_times={'flatten_refs': 0.0005}),
+        ModelBuildProfile('a.Slow', total_time=0.01, schema_time=0.008, node_count=30, definition_count=2),
+        ModelBuildProfile('a.Medium', total_time=0.005, pass_times={'flatten_refs': 0.001, 'inline_refs': 0.002}),
+    ]
+    assert schema_build_report(profiles, limit=2) == (
+        'model     total ms  schema ms  validator ms  passes ms  nodes  defs\n'
+        'a.Slow       10.00       8.00          0.00       0.00     30     2\n'
+        'a.Medium      5.00       0.00          0.00       3.00      0     0\n'
+        '... 1 more models\n'
+        '\n'
+        '3 models built in 16.00ms, passes:\n'
+        '  inline_refs: 2.00ms\n'
+        '  flatten_refs: 1.50ms'
+    )
+
+
+@pytest.fixture
+def validation_profiler():
+    profiler = ValidationProfiler(sample_rate=1.0)
+    install_plugin(profiler)
+    yield profiler
+    uninstall_plugin(profiler)
+
+
+def test_validation_profiler(validation_profiler):
+    class Model(BaseModel):
+        x: int
+        y: str
+
+    Model(x=1, y='a')
+    Model.model_validate_json('{"x": 2, "y": "b"}')
+    with pytest.raises(ValidationError):
+        Model.model_validate({'x': 'a', 'y': 1})
+    with pytest.raises(ValidationError):
+        Model.model_validate({'x': 'a', 'y': 'b'})
+    Model(x=1, y='a').model_dump()
+    ta = TypeAdapter(List[int])
+    ta.validate_python([1, 2, 3])
+
+    report = validation_profiler.report()
+    assert list(report) == IsList(model_name(Model), 'List[int]', check_order=False)
+    model_report = report[model_name(Model)]
+    assert model_report == {
+        'calls': 5,
+        'sampled_calls': 5,
+        'errors': 2,
+        'total_time': IsFloat(gt=0),
+        'mean_time': pytest.approx(model_report['total_time'] / 5),
+        'p99_time': IsFloat(gt=0),
+        'mean_input_size': pytest.approx((2 + 18 + 2 + 2 + 2) / 5),
+        'max_input_size': 18,
+        'failing_fields': {'x': 2, 'y': 1},
+    }
+    assert report['List[int]']['calls'] == 1
+    assert report['List[int]']['max_input_size'] == 3
+    with pytest.raises(ValidationError):
+        ta.validate_python([1, 'a'])
+    assert validation_profiler.report()['List[int]']['failing_fields'] == {}
+
+    validation_profiler.reset()
+    assert validation_profiler.report() == {}
+
+
+def test_validation_profiler_sampling():
+    profiler = ValidationProfiler(sample_rate=0.0)
+    install_plugin(profiler)
+    try:
+
+        class Model(BaseModel):
+            x: int
+
+        for i in range(10):
+            Model(x=i)
+    finally:
+        uninstall_plugin(profiler)
+
+    report = profiler.report()[model_name(Model)]
+    assert report['calls'] == 10
+    assert report['sampled_calls'] == 0
+    assert report['p99_time'] == 0.0
+    assert report['mean_input_size'] is None
+
+    with pytest.raises(ValueError, match='`sample_rate` must be between 0 and 1'):
+        ValidationProfiler(sample_rate=2)
+
+
+def test_validation_profiler_max_samples(validation_profiler):
+    validation_profiler.max_samples = 10
+    ta = TypeAdapter(int)
+    for i in range(100):
+        ta.validate_python(i)
+
+    report = validation_profiler.report()['int']
+    assert report['sampled_calls'] == 100
+    assert report['p99_time'] <= report['total_time']
+
+
+def test_validation_profiler_reset_during_call(validation_profiler):
+    ta = TypeAdapter(int)
+
+    def validate_and_reset(v):
+        validation_profiler.reset()
+        return v
+
+    nested_ta = TypeAdapter(Annotated[int, AfterValidator(validate_and_reset)])
+    assert nested_ta.validate_python(1) == 1
+    assert ta.validate_python(2) == 2
+    assert validation_profiler.report() == {'int': IsPartialDict(calls=1, sampled_calls=1)}
+    assert len(validation_profiler._sampled) == 0
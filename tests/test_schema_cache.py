@@ -0,0 +1,176 @@
+import json
+import os
+import pickle
+from decimal import Decimal
+
+import pytest
+from pydantic_core import SchemaValidator
+
+from pydantic import BaseModel, ConfigDict
+from pydantic._internal import _schema_cache
+from pydantic._internal._generate_schema import GenerateSchema
+
+MODULE_SOURCE = """
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class Base(BaseModel):
+    model_config = ConfigDict(schema_cache_dir={cache_dir!r})
+
+
+class Sub(Base):
+    x: int
+
+
+class Model(Base):
+    sub: Sub
+    subs: List[Sub] = []
+    name: str = Field('x', max_length=3, title='Name')
+    parent: Optional['Model'] = None
+
+    @field_validator('name')
+    @classmethod
+    def upper(cls, v):
+        return v.upper()
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / 'schema_cache'
+
+
+def test_schema_cache_hit(create_module, cache_dir, mocker):
+    module = create_module(MODULE_SOURCE.format(cache_dir=str(cache_dir)), rewrite_assertions=False)
+    assert len(os.listdir(cache_dir)) == 3
+    json_schema = module.Model.model_json_schema()
+
+    generate_schema = mocker.spy(GenerateSchema, 'generate_schema')
+    module.__spec__.loader.exec_module(module)
+    assert generate_schema.call_count == 0
+
+    m = module.Model(sub={'x': '1'}, subs=[module.Sub(x=2)], name='ab', parent={'sub': {'x': 3}})
+    assert m.model_dump() == {
+        'sub': {'x': 1},
+        'subs': [{'x': 2}],
+        'name': 'AB',
+        'parent': {'sub': {'x': 3}, 'subs': [], 'name': 'x', 'parent': None},
+    }
+    assert isinstance(m.parent, module.Model)
+    assert module.Model.model_json_schema() == json_schema
+
+
+def test_schema_cache_source_changed(create_module, cache_dir, mocker):
+    module = create_module(MODULE_SOURCE.format(cache_dir=str(cache_dir)), rewrite_assertions=False)
+
+    with open(module.__file__, 'a') as f:
+        f.write('\n# changed\n')
+
+    generate_schema = mocker.spy(GenerateSchema, 'generate_schema')
+    module.__spec__.loader.exec_module(module)
+    assert generate_schema.call_count > 0
+    assert len(os.listdir(cache_dir)) == 6
+
+
+def test_schema_cache_unpicklable_schema(cache_dir):
+    from typing_extensions import Annotated
+
+    from pydantic import AfterValidator
+
+    class Model(BaseModel):
+        x: Annotated[int, AfterValidator(lambda v: v * 2)]
+
+    fingerprint = 'test'
+    assert not _schema_cache.store_schemas(
+        Model, str(cache_dir), fingerprint, Model.__pydantic_core_schema__, Model.__pydantic_core_schema__
+    )
+    assert _schema_cache.load_schemas(Model, str(cache_dir), fingerprint) is None
+
+
+def test_schema_cache_local_model_not_cached(cache_dir):
+    class Model(BaseModel):
+        model_config = ConfigDict(schema_cache_dir=str(cache_dir))
+
+        x: int
+
+    assert Model(x=1).x == 1
+    assert not cache_dir.exists()
+
+
+class Exploit:
+    def __reduce__(self):
+        return os.getcwd, ()
+
+
+class Model(BaseModel):
+    x: Decimal = Decimal('1.5')
+
+
+@pytest.fixture
+def stored_entry(cache_dir):
+    schema = Model.__pydantic_core_schema__
+    assert _schema_cache.store_schemas(Model, str(cache_dir), 'test', schema, schema)
+    path = cache_dir / 'test.json'
+    with open(path) as f:
+        return path, json.load(f)
+
+
+def test_schema_cache_round_trip(cache_dir, stored_entry):
+    schemas = _schema_cache.load_schemas(Model, str(cache_dir), 'test')
+    assert schemas is not None
+    schema, simplified_schema = schemas
+    assert schema is simplified_schema
+    validator = SchemaValidator(schema)
+    assert validator.validate_python({}).x == Decimal('1.5')
+    assert validator.validate_python({'x': '2.5'}).x == Decimal('2.5')
+
+
+def replace_refs(value, old, new):
+    if isinstance(value, dict):
+        if value.get('!') == 'ref' and value['v'] == old:
+            return {'!': 'ref', 'v': new}
+        return {k: replace_refs(v, old, new) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [replace_refs(v, old, new) for v in value]
+    return value
+
+
+@pytest.mark.parametrize(
+    'change',
+    [
+        pytest.param(lambda entry: {**entry, 'schemas': [0, 0]}, id='schemas-not-dicts'),
+        pytest.param(lambda entry: {**entry, 'schemas': []}, id='missing-schemas'),
+        pytest.param(lambda entry: {**entry, 'fingerprint': 'other'}, id='other-fingerprint'),
+        pytest.param(lambda entry: [entry], id='not-an-object'),
+        pytest.param(lambda entry: {**entry, 'schemas': [{'!': 'memo', 'v': 5}] * 2}, id='bad-memo'),
+        pytest.param(
+            lambda entry: replace_refs(entry, ['decimal', 'Decimal'], ['os', 'system']), id='disallowed-function'
+        ),
+        pytest.param(
+            lambda entry: replace_refs(
+                entry, ['decimal', 'Decimal'], ['pydantic._internal._schema_cache', 'os.system']
+            ),
+            id='function-imported-in-pydantic',
+        ),
+        pytest.param(
+            lambda entry: replace_refs(entry, ['decimal', 'Decimal'], ['subprocess', 'Popen']), id='disallowed-class'
+        ),
+    ],
+)
+def test_schema_cache_invalid_entry(cache_dir, stored_entry, change):
+    path, entry = stored_entry
+    with open(path, 'w') as f:
+        json.dump(change(entry), f)
+    assert _schema_cache.load_schemas(Model, str(cache_dir), 'test') is None
+    assert not path.exists()
+
+
+@pytest.mark.parametrize('content', [b'', b'{', b'\xff', pickle.dumps((Exploit(), b''))])
+def test_schema_cache_corrupt_entry(cache_dir, content):
+    os.makedirs(cache_dir)
+    path = cache_dir / 'test.json'
+    path.write_bytes(content)
+    assert _schema_cache.load_schemas(Model, str(cache_dir), 'test') is None
+    assert not path.exists()
@@ -0,0 +1,96 @@
+from typing import ForwardRef, List, Optional, TypeVar, Union
+
+from typing_extensions import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic._internal._config import ConfigWrapper
+from pydantic._internal._generate_schema import GenerateSchema
+from pydantic._internal._schema_memo import SchemaMemo, memo_key, schema_memo
+
+T = TypeVar('T')
+
+
+def test_repeated_field_types_reused(mocker):
+    class Model1(BaseModel):
+        a: Annotated[str, Field(max_length=64)]
+        b: List[int]
+
+    apply_annotations = mocker.spy(GenerateSchema, '_apply_annotations')
+
+    class Model2(BaseModel):
+        c: Annotated[str, Field(max_length=64)]
+        d: List[int]
+
+    assert apply_annotations.call_count == 0
+    assert Model2(c='x', d=['1']).d == [1]
+    assert Model2.model_json_schema()['properties']['c'] == {'maxLength': 64, 'title': 'C', 'type': 'string'}
+
+
+def test_config_differences():
+    assert memo_key(ConfigWrapper({}), int) == memo_key(ConfigWrapper({}), int)
+    assert memo_key(ConfigWrapper({}), int) != memo_key(ConfigWrapper({'strict': True}), int)
+    assert memo_key(ConfigWrapper({'strict': True}), int) == memo_key(ConfigWrapper({'strict': True}), int)
+
+
+def test_argument_order_and_types():
+    config_wrapper = ConfigWrapper({})
+    assert memo_key(config_wrapper, Union[int, str]) != memo_key(config_wrapper, Union[str, int])
+    assert memo_key(config_wrapper, Literal['a', 'b']) != memo_key(config_wrapper, Literal['b', 'a'])
+    assert memo_key(config_wrapper, Literal[1]) != memo_key(config_wrapper, Literal[True])
+
+
+def test_not_memoizable():
+    config_wrapper = ConfigWrapper({})
+    assert memo_key(config_wrapper, 'int') is None
+    assert memo_key(config_wrapper, List['int']) is None
+    assert memo_key(config_wrapper, Optional[ForwardRef('int')]) is None
+    assert memo_key(config_wrapper, List[T]) is None
+    assert memo_key(config_wrapper, int, ([],)) is None
+    assert memo_key(ConfigWrapper({'json_schema_extra': {'a': 1}}), int) is None
+
+
+def test_schemas_referring_to_definitions_not_memoized():
+    class Sub(BaseModel):
+        x: int
+
+    class Model(BaseModel):
+        sub: Sub
+        subs: List[Sub]
+
+    config_wrapper = ConfigWrapper(Model.model_config)
+    assert schema_memo.get(memo_key(config_wrapper, List[Sub], ())) is None
+
+
+def test_memo_copies():
+    memo = SchemaMemo()
+    schema = {'type': 'list', 'items_schema': {'type': 'int'}, 'metadata': {'pydantic_js_functions': []}}
+    memo.set('key', schema)
+    schema['metadata']['pydantic_js_functions'].append(repr)
+
+    retrieved = memo.get('key')
+    assert retrieved == {'type': 'list', 'items_schema': {'type': 'int'}, 'metadata': {'pydantic_js_functions': []}}
+    retrieved['items_schema']['strict'] = True
+    assert memo.get('key')['items_schema'] == {'type': 'int'}
+
+
+def test_memo_max_size():
+    memo = SchemaMemo(max_size=2)
+    memo.set('a', {'type': 'int'})
+    memo.set('b', {'type': 'str'})
+    assert memo.get('a') == {'type': 'int'}
+    memo.set('c', {'type': 'bool'})
+    assert len(memo) == 2
+    assert memo.get('a') == {'type': 'int'}
+    assert memo.get('b') is None
+    assert memo.get('c') == {'type': 'bool'}
+
+
+def test_config_used_by_memoized_schemas():
+    class Model1(BaseModel):
+        model_config = ConfigDict(str_max_length=3)
+        a: Annotated[str, Field(min_length=1)]
+
+    class Model2(BaseModel):
+        a: Annotated[str, Field(min_length=1)]
+
+    assert Model2(a='abcd').a == 'abcd'
@@ -79,6 +79,31 @@ def test_local_namespace_variables():
     assert res == {'foo': [1, 2]}
 
 
+def test_local_namespace_shadows_global():
+    IntList = List[str]  # noqa: F841
+
+    v = TypeAdapter(Dict[str, 'IntList']).validate_python
+    assert v({'foo': ['1']}) == {'foo': ['1']}
+
+    # names defined in the global namespace are still resolved, and it isn't modified
+    global_names = set(globals())
+    v = TypeAdapter(List['PydanticModel']).validate_python
+    assert v([{'x': '1'}]) == [PydanticModel(x=1)]
+    assert set(globals()) == global_names
+
+
+def test_local_namespace_dataclass_shadows_global():
+    IntList = Tuple[int, int]  # noqa: F841
+
+    @dataclass
+    class Holder:
+        values: 'IntList'
+        models: 'List[PydanticModel]'
+
+    holder = TypeAdapter(Holder).validate_python({'values': ['1', 2], 'models': [{'x': 1}]})
+    assert holder == Holder(values=(1, 2), models=[PydanticModel(x=1)])
+
+
 @pytest.mark.skipif(sys.version_info < (3, 9), reason="ForwardRef doesn't accept module as a parameter in Python < 3.9")
 def test_top_level_fwd_ref():
     FwdRef = ForwardRef('OuterDict', module=__name__)
@@ -248,3 +273,65 @@ def test_validate_python_from_attributes() -> None:
 
     res = ta.validate_python(UnrelatedClass(), from_attributes=True)
     assert res == ModelFromAttributesFalse(x=1)
+
+
+def test_cached():
+    ta = TypeAdapter.cached(List[PydanticModel])
+    assert TypeAdapter.cached(List[PydanticModel]) is ta
+    assert ta.validate_python([{'x': '1'}]) == [PydanticModel(x=1)]
+
+    assert TypeAdapter.cached(List[PydanticModel], config=ConfigDict(strict=True)) is not ta
+    assert type(TypeAdapter.cached(Union[int, float]).validate_python('1')) is int
+    assert type(TypeAdapter.cached(Union[float, int]).validate_python('1')) is float
+
+
+def test_cached_not_cacheable():
+    IntList = List[int]  # noqa: F841
+    assert TypeAdapter.cached(List['IntList']) is not TypeAdapter.cached(List['IntList'])
+    assert TypeAdapter.cached(List['IntList']).validate_python([['1']]) == [[1]]
+    assert TypeAdapter.cached(List[T]) is not TypeAdapter.cached(List[T])
+    config = ConfigDict(json_schema_extra={'examples': [1]})
+    assert TypeAdapter.cached(int, config=config) is not TypeAdapter.cached(int, config=config)
+
+
+def test_cached_eviction(monkeypatch):
+    from pydantic import type_adapter
+
+    monkeypatch.setattr(type_adapter, '_adapter_cache', type_adapter._utils.LRUCache(max_size=2))
+    int_ta = TypeAdapter.cached(int)
+    str_ta = TypeAdapter.cached(str)
+    assert TypeAdapter.cached(int) is int_ta
+    TypeAdapter.cached(bytes)
+    assert TypeAdapter.cached(int) is int_ta
+    assert TypeAdapter.cached(str) is not str_ta
+
+
+def test_validate_many():
+    ta = TypeAdapter(Tuple[int, str])
+    assert ta.validate_many([('1', 'a'), [2, 'b']]) == [(1, 'a'), (2, 'b')]
+    assert ta.validate_many(iter([])) == []
+
+    with pytest.raises(ValidationError) as exc_info:
+        ta.validate_many([(1, 'a'), ('x', 'b')])
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            'type': 'int_parsing',
+            'loc': (1, 0),
+            'msg': 'Input should be a valid integer, unable to parse string as an integer',
+            'input': 'x',
+        }
+    ]
+
+    result = ta.validate_many([(1, 'a'), ('x', 'b'), (3, 'c'), (4,)], continue_on_error=True)
+    assert result.values == {0: (1, 'a'), 2: (3, 'c')}
+    assert list(result.errors) == [1, 3]
+    assert [e['loc'] for e in result.errors[1]] == [(0,)]
+    assert [e['type'] for e in result.errors[3]] == ['missing']
+
+
+def test_validate_many_config():
+    ta = TypeAdapter(List[int], config=ConfigDict(strict=True))
+    assert ta.validate_many([[1]]) == [[1]]
+    with pytest.raises(ValidationError):
+        ta.validate_many([['1']])
+    assert TypeAdapter(List[int]).validate_many([['1']]) == [[1]]
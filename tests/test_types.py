@@ -11,7 +11,7 @@ from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from enum import Enum, IntEnum
+from enum import Enum, IntEnum, IntFlag
 from pathlib import Path
 from typing import (
     Any,
@@ -1645,6 +1645,46 @@ def test_enum_from_json(enum_base, strict):
         ]
 
 
+@pytest.mark.parametrize('strict', [False, True])
+def test_str_enum_lookup(strict):
+    class Currency(str, Enum):
+        eur = 'EUR'
+        usd = 'USD'
+
+    ta = TypeAdapter(Currency)
+    assert ta.validate_json('"USD"', strict=strict) is Currency.usd
+    assert ta.validate_python(Currency.eur, strict=strict) is Currency.eur
+    assert ta.dump_json(Currency.eur) == b'"EUR"'
+    with pytest.raises(ValidationError) as exc_info:
+        ta.validate_json('"GBP"', strict=strict)
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            'ctx': {'expected': "'EUR' or 'USD'"},
+            'input': 'GBP',
+            'loc': (),
+            'msg': "Input should be 'EUR' or 'USD'",
+            'type': 'enum',
+        }
+    ]
+
+
+def test_enum_missing_hook_and_flags():
+    class Color(str, Enum):
+        red = 'red'
+
+        @classmethod
+        def _missing_(cls, value):
+            if isinstance(value, str):
+                return cls.__members__.get(value.lower())
+
+    class Permission(IntFlag):
+        read = 1
+        write = 2
+
+    assert TypeAdapter(Color).validate_python('RED') is Color.red
+    assert TypeAdapter(Permission).validate_python(3) == Permission.read | Permission.write
+
+
 @pytest.mark.parametrize(
     'kwargs,type_',
     [
@@ -2694,6 +2734,60 @@ def test_uuid_error():
     assert v.validate_json(json.dumps(valid.hex), strict=True) == valid
 
 
+@pytest.mark.parametrize(
+    'value',
+    [
+        '49fdfa1d-856d-4003-a83e-4b9236532ec6',
+        '49FDFA1D856D4003A83E4B9236532EC6',
+        '{49fdfa1d-856d-4003-a83e-4b9236532ec6}',
+        'urn:uuid:49fdfa1d-856d-4003-a83e-4b9236532ec6',
+        b'49fdfa1d-856d-4003-a83e-4b9236532ec6',
+        b'\x49\xfd\xfa\x1d\x85\x6d\x40\x03\xa8\x3e\x4b\x92\x36\x53\x2e\xc6',
+    ],
+)
+def test_uuid_formats(value):
+    expected = UUID('49fdfa1d856d4003a83e4b9236532ec6')
+    for ta in TypeAdapter(UUID), TypeAdapter(UUID4):
+        parsed = ta.validate_python(value)
+        assert parsed == expected
+        assert (parsed.is_safe, hash(parsed), str(parsed)) == (expected.is_safe, hash(expected), str(expected))
+
+
+def test_uuid_version_error():
+    v = TypeAdapter(UUID4)
+
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_python('ebcdab58-6eb8-46fb-a190-d07a3')
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            'type': 'is_instance_of',
+            'loc': ('is-instance[UUID]',),
+            'msg': 'Input should be an instance of UUID',
+            'input': 'ebcdab58-6eb8-46fb-a190-d07a3',
+            'ctx': {'class': 'UUID'},
+        },
+        {
+            'type': 'uuid_parsing',
+            'loc': ('function-after[uuid_validator(), union[str,bytes]]',),
+            'msg': 'Input should be a valid UUID, unable to parse string as an UUID',
+            'input': 'ebcdab58-6eb8-46fb-a190-d07a3',
+        },
+    ]
+
+    # invalid UUIDs get the same errors as with a plain `UUID`
+    for value in 123, b'bad', 'bad':
+        with pytest.raises(ValidationError) as uuid_exc_info:
+            TypeAdapter(UUID).validate_python(value)
+        with pytest.raises(ValidationError) as exc_info:
+            v.validate_python(value)
+        assert exc_info.value.errors() == uuid_exc_info.value.errors()
+
+    uuid1 = '7fb48116-ca6b-11ed-a439-3274d3adddac'
+    with pytest.raises(ValidationError, match='uuid version 4 expected'):
+        v.validate_json(json.dumps(uuid1), strict=True)
+    assert v.json_schema() == {'type': 'string', 'format': 'uuid4'}
+
+
 def test_uuid_json():
     class Model(BaseModel):
         v: UUID
@@ -4411,6 +4505,22 @@ def test_deque_json():
     assert Model(v=deque((1, 2, 3))).model_dump_json() == '{"v":[1,2,3]}'
 
 
+def test_deque_serialization():
+    class Item(BaseModel):
+        x: int
+
+    class Model(BaseModel):
+        v: Deque[Item]
+        w: Annotated[Deque[int], Field(max_length=3)]
+
+    m = Model.model_validate_json('{"v": [{"x": 1}, {"x": 2}, {"x": 3}], "w": [1, 2]}')
+    assert m.v == deque([Item(x=1), Item(x=2), Item(x=3)])
+    assert m.w.maxlen == 3
+    assert m.model_dump(include={'v': {0, 2}}) == {'v': deque([{'x': 1}, {'x': 3}])}
+    assert m.model_dump_json(exclude={'v': {1: {'x'}}, 'w': True}) == '{"v":[{"x":1},{},{"x":3}]}'
+    assert Model.model_validate_json(m.model_dump_json(), strict=True) == m
+
+
 def test_deque_any_maxlen():
     class DequeModel1(BaseModel):
         field: deque
@@ -4987,6 +5097,24 @@ def test_typing_counter_value_validation():
     ]
 
 
+@pytest.mark.parametrize('strict', [False, True])
+def test_mapping_json_round_trip(strict):
+    class Model(BaseModel):
+        c: Counter[str]
+        d: DefaultDict[str, List[int]]
+        o: typing.OrderedDict[str, int]
+
+    m = Model(c={'a': 2, 'b': 1}, d={'x': [1]}, o={'z': 1, 'y': 2})
+    assert m.model_dump() == {'c': {'a': 2, 'b': 1}, 'd': {'x': [1]}, 'o': {'z': 1, 'y': 2}}
+    assert m.model_dump_json(exclude={'c': {'a'}}) == '{"c":{"b":1},"d":{"x":[1]},"o":{"z":1,"y":2}}'
+
+    m2 = Model.model_validate_json(m.model_dump_json(), strict=strict)
+    assert m2 == m
+    assert type(m2.c) is collections.Counter
+    assert type(m2.o) is OrderedDict
+    assert m2.d.default_factory is list
+
+
 def test_mapping_subclass_without_core_schema() -> None:
     class MyDict(Dict[int, int]):
         # The point of this is that subclasses can do arbitrary things
@@ -374,6 +374,45 @@ def test_item_method():
     ]
 
 
+def test_item_method_validators_reused():
+    class X:
+        def __init__(self, v):
+            self.v = v
+
+        @validate_call(config=dict(validate_return=True))
+        def foo(self, a: int) -> str:
+            return self.v * a
+
+    wrapper = X.__dict__['foo']
+    x, y = X('x'), X(1)
+    assert x.foo('2') == 'xx'
+    validator = x.foo.__pydantic_validator__
+    assert y.foo.__pydantic_validator__ is validator
+    assert X('y').foo(3) == 'yyy'
+    assert X.foo is wrapper
+
+    with pytest.raises(ValidationError) as exc_info:
+        y.foo(2)
+
+    # insert_assert(exc_info.value.errors(include_url=False))
+    assert exc_info.value.errors(include_url=False) == [
+        {'type': 'string_type', 'loc': (), 'msg': 'Input should be a valid string', 'input': 2}
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        x.foo('x')
+
+    # insert_assert(exc_info.value.errors(include_url=False))
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            'type': 'int_parsing',
+            'loc': (0,),
+            'msg': 'Input should be a valid integer, unable to parse string as an integer',
+            'input': 'x',
+        }
+    ]
+
+
 @skip_pre_39
 def test_class_method():
     class X: